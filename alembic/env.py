@@ -3,9 +3,10 @@ import sys
 from logging.config import fileConfig
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 
 from alembic import context
+from alembic.operations import MigrateOperation, Operations
 from app.models.base_model import Base
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -22,10 +23,45 @@ if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
 target_metadata = Base.metadata
+# Migrations não importam código da aplicação; o que precisam da
+# configuração chega por aqui
+config.attributes.setdefault("id_uuid_version", settings.id_uuid_version)
 
 DATABASE_URL_SYNC = settings.database_url_sync
 
 
+@Operations.register_operation("drop_index_if_invalid")
+class DropIndexIfInvalidOp(MigrateOperation):
+    """``op.drop_index_if_invalid(name)``, para as migrations de índice.
+
+    CREATE INDEX CONCURRENTLY que falha deixa um índice INVALID para trás,
+    e o IF NOT EXISTS da próxima tentativa o aceitaria como pronto. Roda
+    dentro de ``autocommit_block``, antes do ``create_index``.
+    """
+
+    def __init__(self, index_name: str) -> None:
+        self.index_name = index_name
+
+    @classmethod
+    def drop_index_if_invalid(cls, operations, index_name: str):
+        return operations.invoke(cls(index_name))
+
+
+@Operations.implementation_for(DropIndexIfInvalidOp)
+def drop_index_if_invalid(operations, operation) -> None:
+    invalid = operations.get_bind().execute(
+        text(
+            "SELECT 1 FROM pg_index "
+            "WHERE indexrelid = to_regclass(:name) AND NOT indisvalid"
+        ),
+        {"name": operation.index_name},
+    )
+    if invalid.scalar():
+        operations.execute(
+            f"DROP INDEX CONCURRENTLY IF EXISTS {operation.index_name}"
+        )
+
+
 def run_migrations_offline():
     context.configure(
         url=DATABASE_URL_SYNC,
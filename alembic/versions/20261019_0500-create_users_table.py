@@ -0,0 +1,90 @@
+"""create users table
+
+Revision ID: e533e87b396c
+Revises:
+Create Date: 2026-10-19 05:00:00.000000
+
+Bancos criados antes das migrations (``Base.metadata.create_all``) já têm
+a tabela: tudo aqui é ``IF NOT EXISTS`` e vira no-op neles. Quem preferir
+pode marcar a revisão sem executá-la com ``alembic stamp e533e87b396c``
+antes do ``alembic upgrade head``.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e533e87b396c"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "users",
+        sa.Column(
+            "id",
+            postgresql.UUID(as_uuid=True),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+        sa.Column("name", sa.String(length=256), nullable=False),
+        sa.Column("username", sa.String(length=64), nullable=False),
+        sa.Column("email", sa.String(length=256), nullable=False),
+        sa.Column("hashed_password", sa.Text(), nullable=False),
+        sa.Column(
+            "is_master",
+            sa.Boolean(),
+            server_default=sa.text("false"),
+            nullable=False,
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        if_not_exists=True,
+    )
+    op.create_index(
+        op.f("ix_users_created_at"),
+        "users",
+        ["created_at"],
+        unique=False,
+        if_not_exists=True,
+    )
+    op.create_index(
+        op.f("ix_users_email"),
+        "users",
+        ["email"],
+        unique=True,
+        if_not_exists=True,
+    )
+    op.create_index(
+        op.f("ix_users_username"),
+        "users",
+        ["username"],
+        unique=True,
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_users_username"), table_name="users")
+    op.drop_index(op.f("ix_users_email"), table_name="users")
+    op.drop_index(op.f("ix_users_created_at"), table_name="users")
+    op.drop_table("users")
@@ -0,0 +1,85 @@
+"""default users.id to time-ordered UUIDv7
+
+Revision ID: 3f1d2c9a7b64
+Revises: 744a4858dd75
+Create Date: 2026-10-19 05:20:00.000000
+
+Cria sempre a função ``uuid_generate_v7()``, mas só troca o default de
+``users.id`` quando ``id_uuid_version=7`` está configurado; com o padrão
+(4) o schema não muda. Para ligar o v7 num banco que já passou por aqui::
+
+    ALTER TABLE users ALTER COLUMN id SET DEFAULT uuid_generate_v7();
+
+Linhas existentes mantêm seus ids v4: trocar chaves primárias quebraria
+referências externas e sessões abertas. Só os novos INSERTs passam a cair
+no fim do índice. Para compactar o inchaço deixado pelos v4, rode depois
+``REINDEX INDEX CONCURRENTLY users_pkey`` fora do horário de pico.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import context, op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f1d2c9a7b64"
+down_revision: Union[str, None] = "744a4858dd75"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Cópia congelada de ``app.utils.ids.UUID7_FUNCTION``: a migration não
+# pode mudar junto com o código da aplicação
+UUID7_FUNCTION = """
+CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid
+LANGUAGE sql VOLATILE AS $$
+    SELECT encode(
+        set_bit(
+            set_bit(
+                overlay(
+                    uuid_send(gen_random_uuid())
+                    PLACING substring(
+                        int8send(
+                            floor(
+                                extract(epoch FROM clock_timestamp()) * 1000
+                            )::bigint
+                        )
+                        FROM 3
+                    )
+                    FROM 1 FOR 6
+                ),
+                52, 1
+            ),
+            53, 1
+        ),
+        'hex'
+    )::uuid
+$$
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(UUID7_FUNCTION)
+    if context.config.attributes.get("id_uuid_version") != 7:
+        return
+    # Só metadado: não reescreve a tabela nem toca nas linhas
+    op.alter_column(
+        "users",
+        "id",
+        server_default=sa.text("uuid_generate_v7()"),
+        existing_type=sa.UUID(),
+        existing_nullable=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        "users",
+        "id",
+        server_default=sa.text("gen_random_uuid()"),
+        existing_type=sa.UUID(),
+        existing_nullable=False,
+    )
+    op.execute("DROP FUNCTION IF EXISTS uuid_generate_v7()")
@@ -0,0 +1,92 @@
+"""case-insensitive unique indexes on users.username and users.email
+
+Revision ID: 9c4e1b7d2a05
+Revises: 3f1d2c9a7b64
+Create Date: 2026-10-19 05:30:00.000000
+
+Troca os índices únicos de ``username``/``email`` por índices únicos em
+``lower(...)``, a expressão que o repositório usa nas buscas. Os índices
+são criados com CONCURRENTLY, sem bloquear escritas; se já existirem
+duplicatas que só diferem na caixa, a migration para antes e lista quais.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9c4e1b7d2a05"
+down_revision: Union[str, None] = "3f1d2c9a7b64"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = ("username", "email")
+
+
+def _check_duplicates(column: str) -> None:
+    duplicates = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                f"SELECT lower({column}) FROM users "
+                f"GROUP BY lower({column}) HAVING count(*) > 1 LIMIT 10"
+            )
+        )
+        .scalars()
+        .all()
+    )
+    if duplicates:
+        raise RuntimeError(
+            f"users.{column} tem valores repetidos ignorando a caixa; "
+            f"resolva antes de migrar: {', '.join(duplicates)}"
+        )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for column in COLUMNS:
+        _check_duplicates(column)
+
+    with op.get_context().autocommit_block():
+        for column in COLUMNS:
+            name = f"ux_users_lower_{column}"
+            op.drop_index_if_invalid(name)
+            op.create_index(
+                name,
+                "users",
+                [sa.text(f"lower({column})")],
+                unique=True,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        # Só depois: até aqui a unicidade continua garantida pelos antigos
+        for column in COLUMNS:
+            op.drop_index(
+                f"ix_users_{column}",
+                table_name="users",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for column in COLUMNS:
+            op.create_index(
+                f"ix_users_{column}",
+                "users",
+                [column],
+                unique=True,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        for column in COLUMNS:
+            op.drop_index(
+                f"ux_users_lower_{column}",
+                table_name="users",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,69 @@
+"""covering unique index on lower(users.email) for index-only logins
+
+Revision ID: 5b8f0e3c1d92
+Revises: 9c4e1b7d2a05
+Create Date: 2026-10-19 05:40:00.000000
+
+Substitui ``ux_users_lower_email`` por um índice com as mesmas chave e
+unicidade e, em INCLUDE, todas as colunas que o login lê. O novo índice
+é criado antes de o antigo cair, então a unicidade vale o tempo todo.
+
+Index Only Scan só evita o heap em páginas marcadas como all-visible no
+visibility map; o autovacuum mantém isso, mas depois de cargas grandes
+vale um ``VACUUM users``.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5b8f0e3c1d92"
+down_revision: Union[str, None] = "9c4e1b7d2a05"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INCLUDE = ["id", "name", "username", "email", "is_master", "hashed_password"]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index_if_invalid("ux_users_lower_email_login")
+        op.create_index(
+            "ux_users_lower_email_login",
+            "users",
+            [sa.text("lower(email)")],
+            unique=True,
+            postgresql_include=INCLUDE,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ux_users_lower_email",
+            table_name="users",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index_if_invalid("ux_users_lower_email")
+        op.create_index(
+            "ux_users_lower_email",
+            "users",
+            [sa.text("lower(email)")],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ux_users_lower_email_login",
+            table_name="users",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
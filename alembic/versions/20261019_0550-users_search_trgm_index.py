@@ -0,0 +1,48 @@
+"""trigram GIN index for user search
+
+Revision ID: 7e2a9d4c6b18
+Revises: 5b8f0e3c1d92
+Create Date: 2026-10-19 05:50:00.000000
+
+Índice GIN com ``gin_trgm_ops`` sobre ``name || ' ' || username || ' '
+|| email``, a mesma expressão de ``USER_SEARCH_DOCUMENT``: o planner só
+usa o índice quando a consulta repete a expressão exatamente.
+
+O downgrade remove o índice mas mantém a extensão ``pg_trgm``, que é do
+banco inteiro e pode estar em uso por outros objetos.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7e2a9d4c6b18"
+down_revision: Union[str, None] = "5b8f0e3c1d92"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX = "ix_users_search_trgm"
+DOCUMENT = "(name || ' ' || username || ' ' || email)"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        op.drop_index_if_invalid(INDEX)
+        op.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX} "
+            f"ON users USING gin ({DOCUMENT} gin_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            INDEX,
+            table_name="users",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,45 @@
+"""bound users.email and users.hashed_password in bytes
+
+Revision ID: 2c7b5e8f4a31
+Revises: 7e2a9d4c6b18
+Create Date: 2026-10-19 06:00:00.000000
+
+A linha de ``ux_users_lower_email_login`` leva ``lower(email)`` e, em
+INCLUDE, email, name, username e o hash. Sem teto em bytes, email
+multibyte ou hash longo passavam dos 2704 bytes do btree e o INSERT
+falhava com "index row size exceeds maximum". Os CHECKs entram NOT VALID
+(sem varrer a tabela sob lock) e o VALIDATE confere as linhas existentes
+sem bloquear escritas; se ele falhar, corrija as linhas apontadas antes.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "2c7b5e8f4a31"
+down_revision: Union[str, None] = "7e2a9d4c6b18"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CONSTRAINTS = {
+    "ck_users_email_octets": "octet_length(email) <= 254",
+    "ck_users_hashed_password_octets": "octet_length(hashed_password) <= 512",
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, condition in CONSTRAINTS.items():
+        op.execute(
+            f"ALTER TABLE users ADD CONSTRAINT {name} "
+            f"CHECK ({condition}) NOT VALID"
+        )
+    for name in CONSTRAINTS:
+        op.execute(f"ALTER TABLE users VALIDATE CONSTRAINT {name}")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name in CONSTRAINTS:
+        op.drop_constraint(name, "users", type_="check")
@@ -0,0 +1,316 @@
+import asyncio
+from collections import deque
+from enum import IntEnum
+from functools import lru_cache
+from http.cookies import CookieError, SimpleCookie
+from typing import Any, Deque, Dict, FrozenSet, Optional, Tuple
+from urllib.parse import parse_qs
+
+import orjson
+from graphql import (
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    InlineFragmentNode,
+    OperationDefinitionNode,
+    OperationType,
+    parse,
+)
+
+from app.core.settings import settings
+from app.utils.error_code import ErrorCode
+from app.utils.validators import is_uuid
+
+
+class Priority(IntEnum):
+    HIGH = 0  # leituras autenticadas, baratas
+    NORMAL = 1
+    LOW = 2  # login e createUser: bcrypt + escrita
+
+
+_EXPENSIVE = frozenset({"login", "createUser"})
+
+
+def _root_fields(selection_set, fragments, seen=frozenset()) -> set:
+    """Campos de primeiro nível, atravessando fragments."""
+    fields = set()
+    for selection in selection_set.selections:
+        if isinstance(selection, FieldNode):
+            fields.add(selection.name.value)
+        elif isinstance(selection, InlineFragmentNode):
+            fields |= _root_fields(selection.selection_set, fragments, seen)
+        elif isinstance(selection, FragmentSpreadNode):
+            name = selection.name.value
+            if name in fragments and name not in seen:
+                fields |= _root_fields(
+                    fragments[name].selection_set, fragments, seen | {name}
+                )
+    return fields
+
+
+@lru_cache(maxsize=1024)
+def _operation(
+    query: str, operation_name: Optional[str]
+) -> Optional[Tuple[OperationType, FrozenSet[str]]]:
+    """Tipo e campos raiz da operação que será executada.
+
+    Documento inválido ou operação ambígua devolve ``None``: o Strawberry
+    vai recusar a requisição de qualquer jeito.
+    """
+    try:
+        document = parse(query)
+    except GraphQLError:
+        return None
+
+    operations = [
+        definition
+        for definition in document.definitions
+        if isinstance(definition, OperationDefinitionNode)
+    ]
+    if operation_name is not None:
+        operations = [
+            operation
+            for operation in operations
+            if operation.name and operation.name.value == operation_name
+        ]
+    if len(operations) != 1:
+        return None
+
+    fragments = {
+        definition.name.value: definition
+        for definition in document.definitions
+        if isinstance(definition, FragmentDefinitionNode)
+    }
+    (operation,) = operations
+    return operation.operation, frozenset(
+        _root_fields(operation.selection_set, fragments)
+    )
+
+
+def classify(
+    query: str, authenticated: bool, operation_name: Optional[str] = None
+) -> Priority:
+    operation = _operation(query, operation_name)
+    if operation is None:
+        return Priority.NORMAL
+
+    kind, fields = operation
+    if kind == OperationType.MUTATION:
+        return Priority.LOW if fields & _EXPENSIVE else Priority.NORMAL
+    return Priority.HIGH if authenticated else Priority.NORMAL
+
+
+class AdmissionController:
+    """Limita requisições simultâneas com uma fila curta por prioridade.
+
+    Com a fila cheia, quem chega desloca o pedido de menor prioridade que
+    estiver esperando; se não houver ninguém menos prioritário, é recusado
+    na hora. Esperar mais que ``queue_timeout`` também recusa.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = 64,
+        max_queue: int = 256,
+        queue_timeout: float = 2.0,
+    ) -> None:
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+
+        self._in_flight = 0
+        self._waiters: Dict[Priority, Deque[asyncio.Future]] = {
+            priority: deque() for priority in Priority
+        }
+        self._counters = {"admitted": 0, "shed": 0, "timed_out": 0}
+
+    @property
+    def queued(self) -> int:
+        return sum(len(waiters) for waiters in self._waiters.values())
+
+    async def acquire(self, priority: Priority) -> bool:
+        if self._in_flight < self.max_in_flight and not self.queued:
+            self._in_flight += 1
+            self._counters["admitted"] += 1
+            return True
+
+        if self.queued >= self.max_queue and not self._evict_below(priority):
+            self._counters["shed"] += 1
+            return False
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters[priority].append(future)
+        try:
+            async with asyncio.timeout(self.queue_timeout):
+                admitted = await future
+        except TimeoutError:
+            self._discard(priority, future)
+            # A vaga pode ter sido entregue junto com o timeout
+            if future.done() and not future.cancelled() and future.result():
+                self.release()
+            self._counters["timed_out"] += 1
+            return False
+
+        if admitted:
+            self._counters["admitted"] += 1
+        else:
+            self._counters["shed"] += 1
+        return admitted
+
+    def release(self) -> None:
+        for priority in Priority:
+            waiters = self._waiters[priority]
+            while waiters:
+                future = waiters.popleft()
+                if not future.done():
+                    # A vaga passa direto para quem espera
+                    future.set_result(True)
+                    return
+        self._in_flight -= 1
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            **self._counters,
+            "in_flight": self._in_flight,
+            "queued": self.queued,
+        }
+
+    def _evict_below(self, priority: Priority) -> bool:
+        for lower in reversed(Priority):
+            if lower <= priority:
+                return False
+            waiters = self._waiters[lower]
+            while waiters:
+                future = waiters.pop()
+                if not future.done():
+                    future.set_result(False)
+                    return True
+        return False
+
+    def _discard(self, priority: Priority, future: asyncio.Future) -> None:
+        try:
+            self._waiters[priority].remove(future)
+        except ValueError:
+            pass
+
+
+class AdmissionControlMiddleware:
+    """Middleware ASGI que aplica o ``AdmissionController`` ao GraphQL."""
+
+    def __init__(
+        self,
+        app,
+        controller: AdmissionController,
+        path: str = "/graphql",
+        retry_after: int = 1,
+    ) -> None:
+        self.app = app
+        self.controller = controller
+        self.path = path
+        self.retry_after = retry_after
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(self.path):
+            await self.app(scope, receive, send)
+            return
+
+        body = await self._read_body(receive)
+        query, operation_name = self._operation(scope, body)
+        priority = classify(query, self._has_session(scope), operation_name)
+
+        if not await self.controller.acquire(priority):
+            await self._reject(send)
+            return
+
+        replayed = False
+
+        async def replay():
+            nonlocal replayed
+            if not replayed:
+                replayed = True
+                return {"type": "http.request", "body": body}
+            return await receive()
+
+        try:
+            await self.app(scope, replay, send)
+        finally:
+            self.controller.release()
+
+    async def _read_body(self, receive) -> bytes:
+        chunks = []
+        while True:
+            message = await receive()
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body"):
+                return b"".join(chunks)
+
+    def _operation(self, scope, body: bytes) -> Tuple[str, Optional[str]]:
+        """``(query, operationName)`` do corpo JSON ou da query string."""
+        if body:
+            try:
+                payload = orjson.loads(body)
+            except orjson.JSONDecodeError:
+                return "", None
+            if not isinstance(payload, dict):
+                return "", None
+            query = payload.get("query")
+            operation_name = payload.get("operationName")
+        else:
+            params = parse_qs(scope.get("query_string", b"").decode())
+            query = params.get("query", [""])[0]
+            operation_name = params.get("operationName", [None])[0]
+
+        return (
+            query if isinstance(query, str) else "",
+            operation_name if isinstance(operation_name, str) else None,
+        )
+
+    def _has_session(self, scope) -> bool:
+        # Só o formato é checado: validar a sessão custaria uma ida ao
+        # Redis antes da fila. Um UUID forjado ganha prioridade, mas
+        # continua sendo barrado pelo IsAuthenticated
+        for name, value in scope.get("headers", []):
+            if name != b"cookie":
+                continue
+            try:
+                cookie = SimpleCookie(value.decode("latin-1"))
+            except CookieError:
+                continue
+            session = cookie.get("session")
+            if session is not None and is_uuid(session.value):
+                return True
+        return False
+
+    async def _reject(self, send) -> None:
+        body = orjson.dumps(
+            {
+                "errors": [
+                    {
+                        "message": (
+                            "A taverna está lotada. Espere um pouco do "
+                            "lado de fora e tente de novo."
+                        ),
+                        "code": ErrorCode.SERVICE_OVERLOADED,
+                    }
+                ]
+            }
+        )
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 503,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"retry-after", str(self.retry_after).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+
+admission_controller = AdmissionController(
+    max_in_flight=settings.admission_max_in_flight,
+    max_queue=settings.admission_max_queue,
+    queue_timeout=settings.admission_queue_timeout,
+)
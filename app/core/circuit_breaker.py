@@ -0,0 +1,162 @@
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Awaitable, Dict, Optional, Tuple, Type, TypeVar
+
+T = TypeVar("T")
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Chamada recusada sem tentativa porque o circuito está aberto."""
+
+
+@dataclass
+class _Bucket:
+    second: int
+    calls: int = 0
+    failures: int = 0
+
+
+class CircuitBreaker:
+    """Circuit breaker por taxa de erro numa janela deslizante.
+
+    Abre quando, com ao menos ``minimum_calls`` na janela, a fração de
+    falhas passa de ``failure_rate``. Depois de ``open_seconds`` libera até
+    ``half_open_calls`` sondas: sucesso fecha o circuito, falha o reabre.
+    Exceções em ``ignored_exceptions`` não contam nem como sucesso nem como
+    falha, mesmo sendo subclasses de ``failure_exceptions``.
+    """
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        minimum_calls: int = 20,
+        window_seconds: int = 10,
+        open_seconds: float = 5.0,
+        half_open_calls: int = 1,
+        failure_exceptions: Tuple[Type[BaseException], ...] = (Exception,),
+        ignored_exceptions: Tuple[Type[BaseException], ...] = (),
+    ) -> None:
+        self.failure_rate = failure_rate
+        self.minimum_calls = minimum_calls
+        self.window_seconds = window_seconds
+        self.open_seconds = open_seconds
+        self.half_open_calls = half_open_calls
+        self.failure_exceptions = failure_exceptions
+        self.ignored_exceptions = ignored_exceptions
+
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._probes = 0
+        self._buckets: deque[_Bucket] = deque()
+
+        self.opened_total = 0
+        self.rejected_total = 0
+
+    @property
+    def state(self) -> CircuitState:
+        if (
+            self._state is CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self.open_seconds
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._probes = 0
+        return self._state
+
+    async def call(
+        self, awaitable: Awaitable[T], timeout: Optional[float] = None
+    ) -> T:
+        if not self._allow():
+            self.rejected_total += 1
+            if asyncio.iscoroutine(awaitable):
+                awaitable.close()
+            raise CircuitOpenError("Circuito aberto.")
+
+        try:
+            async with asyncio.timeout(timeout):
+                result = await awaitable
+        except self.ignored_exceptions:
+            self._release_probe()
+            raise
+        except self.failure_exceptions + (TimeoutError,):
+            self._record(success=False)
+            raise
+        except BaseException:
+            self._release_probe()
+            raise
+
+        self._record(success=True)
+        return result
+
+    def metrics(self) -> Dict[str, Any]:
+        calls, failures = self._window_totals()
+        return {
+            "state": self.state.value,
+            "window_calls": calls,
+            "window_failures": failures,
+            "failure_rate": failures / calls if calls else 0.0,
+            "opened_total": self.opened_total,
+            "rejected_total": self.rejected_total,
+        }
+
+    def _allow(self) -> bool:
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return True
+        if state is CircuitState.HALF_OPEN:
+            if self._probes < self.half_open_calls:
+                self._probes += 1
+                return True
+        return False
+
+    def _release_probe(self) -> None:
+        if self._state is CircuitState.HALF_OPEN and self._probes > 0:
+            self._probes -= 1
+
+    def _record(self, success: bool) -> None:
+        if self._state is CircuitState.HALF_OPEN:
+            if success:
+                self._state = CircuitState.CLOSED
+                self._buckets.clear()
+            else:
+                self._open()
+            return
+
+        now = int(time.monotonic())
+        if not self._buckets or self._buckets[-1].second != now:
+            self._buckets.append(_Bucket(second=now))
+        bucket = self._buckets[-1]
+        bucket.calls += 1
+        if not success:
+            bucket.failures += 1
+
+        calls, failures = self._window_totals()
+        if (
+            self._state is CircuitState.CLOSED
+            and calls >= self.minimum_calls
+            and failures / calls >= self.failure_rate
+        ):
+            self._open()
+
+    def _window_totals(self) -> Tuple[int, int]:
+        oldest = int(time.monotonic()) - self.window_seconds
+        while self._buckets and self._buckets[0].second <= oldest:
+            self._buckets.popleft()
+
+        calls = sum(bucket.calls for bucket in self._buckets)
+        failures = sum(bucket.failures for bucket in self._buckets)
+        return calls, failures
+
+    def _open(self) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+        self._buckets.clear()
+        self.opened_total += 1
@@ -1,5 +1,6 @@
 from contextlib import asynccontextmanager
-from typing import AsyncIterator
+from typing import Any, AsyncIterator, Dict, Optional
+from uuid import uuid4
 
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
@@ -9,11 +10,48 @@ from sqlalchemy.ext.asyncio import (
 
 from app.core.settings import settings
 
+
+def _statement_name() -> str:
+    # Nome único: atrás do PgBouncer a conexão do servidor muda a cada
+    # transação e um nome repetido colide com o prepare de outro cliente
+    return f"__asyncpg_{uuid4()}__"
+
+
+def engine_options(pgbouncer: Optional[bool] = None) -> Dict[str, Any]:
+    """Argumentos do ``create_async_engine`` para o perfil de conexão.
+
+    Há dois caches de prepared statements: o LRU do dialeto do SQLAlchemy
+    (``prepared_statement_cache_size``), usado nas consultas da aplicação,
+    e o do próprio asyncpg (``statement_cache_size``), usado nas consultas
+    internas do driver. No perfil PgBouncer os dois ficam desligados.
+    """
+    if pgbouncer is None:
+        pgbouncer = settings.db_pgbouncer
+
+    if pgbouncer:
+        connect_args: Dict[str, Any] = {
+            "prepared_statement_cache_size": 0,
+            "statement_cache_size": 0,
+            "prepared_statement_name_func": _statement_name,
+        }
+    else:
+        connect_args = {
+            "prepared_statement_cache_size": (
+                settings.db_prepared_statement_cache_size
+            ),
+            "statement_cache_size": settings.db_statement_cache_size,
+        }
+
+    return {
+        "echo": settings.debug,
+        # Cache do SQL compilado por chave de statement, por engine
+        "query_cache_size": settings.db_query_cache_size,
+        "connect_args": connect_args,
+    }
+
+
 # Engine assíncrona com o driver asyncpg
-engine = create_async_engine(
-    settings.database_url_async,
-    echo=settings.debug,
-)
+engine = create_async_engine(settings.database_url_async, **engine_options())
 
 # Criador de sessões assíncronas
 async_session = async_sessionmaker(
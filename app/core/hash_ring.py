@@ -0,0 +1,61 @@
+import bisect
+import hashlib
+from typing import Dict, Iterable, List
+
+
+def _hash(value: str) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(value.encode(), digest_size=8).digest(), "big"
+    )
+
+
+class HashRing:
+    """Anel de hash consistente com nós virtuais.
+
+    Cada nó ocupa ``replicas`` pontos do anel; uma chave pertence ao primeiro
+    ponto no sentido horário. Incluir ou remover um nó move só as chaves dos
+    pontos dele (~1/N do total).
+    """
+
+    def __init__(self, nodes: Iterable[str] = (), replicas: int = 160):
+        self.replicas = replicas
+        self._points: List[int] = []
+        self._owners: Dict[int, str] = {}
+        self._nodes: set[str] = set()
+
+        for node in nodes:
+            self.add_node(node)
+
+    @property
+    def nodes(self) -> List[str]:
+        return sorted(self._nodes)
+
+    def add_node(self, node: str) -> None:
+        if node in self._nodes:
+            return
+
+        self._nodes.add(node)
+        for replica in range(self.replicas):
+            point = _hash(f"{node}#{replica}")
+            # Colisões são raríssimas; o primeiro dono mantém o ponto
+            if point in self._owners:
+                continue
+            self._owners[point] = node
+            bisect.insort(self._points, point)
+
+    def remove_node(self, node: str) -> None:
+        if node not in self._nodes:
+            return
+
+        self._nodes.discard(node)
+        self._points = [p for p in self._points if self._owners[p] != node]
+        self._owners = {p: self._owners[p] for p in self._points}
+
+    def get_node(self, key: str) -> str:
+        if not self._points:
+            raise LookupError("Hash ring has no nodes.")
+
+        index = bisect.bisect(self._points, _hash(key))
+        if index == len(self._points):
+            index = 0
+        return self._owners[self._points[index]]
@@ -1,15 +1,170 @@
+import asyncio
 from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
 
-from redis.asyncio import Redis
+from redis.asyncio import BlockingConnectionPool, Redis
+from redis.asyncio.client import Pipeline
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import MaxConnectionsError
+from redis.exceptions import TimeoutError as RedisTimeoutError
+
+from app.core.circuit_breaker import CircuitBreaker, CircuitOpenError
+from app.core.hash_ring import HashRing
+from app.core.redis_cache import ClientSideCache, LocalTTLCache
+from app.core.settings import settings
+
+# Erros que indicam Redis indisponível (e não uso incorreto de comandos)
+REDIS_UNAVAILABLE_ERRORS = (
+    CircuitOpenError,
+    RedisConnectionError,
+    RedisTimeoutError,
+    TimeoutError,
+)
+
+
+class PoolExhaustedError(MaxConnectionsError):
+    """Nenhuma conexão livre no pool local dentro do prazo.
+
+    É sobrecarga deste processo, não do Redis: não conta como falha no
+    circuit breaker, mas continua sendo ``ConnectionError`` para quem trata
+    o Redis como indisponível.
+    """
+
+
+class GuardedConnectionPool(BlockingConnectionPool):
+    """Pool que espera por conexão livre em vez de falhar na hora."""
+
+    async def get_connection(self, *args, **options):
+        try:
+            return await super().get_connection(*args, **options)
+        except RedisConnectionError as err:
+            if isinstance(err.__cause__, asyncio.TimeoutError):
+                raise PoolExhaustedError(
+                    "Todas as conexões com o Redis estão ocupadas."
+                ) from err
+            raise
+
+
+class GuardedPipeline(Pipeline):
+    """Pipeline cujo ``execute`` passa pelo breaker e pelo timeout."""
+
+    breaker: Optional[CircuitBreaker] = None
+    command_timeout: Optional[float] = None
+
+    async def execute(self, raise_on_error: bool = True) -> List[Any]:
+        if self.breaker is None:
+            return await super().execute(raise_on_error)
+
+        return await self.breaker.call(
+            super().execute(raise_on_error), timeout=self.command_timeout
+        )
+
+
+class GuardedRedis(Redis):
+    """Cliente Redis com timeout por comando e circuit breaker."""
+
+    breaker: Optional[CircuitBreaker] = None
+    command_timeout: Optional[float] = None
+
+    async def execute_command(self, *args, **options):
+        if self.breaker is None:
+            return await super().execute_command(*args, **options)
+
+        return await self.breaker.call(
+            super().execute_command(*args, **options),
+            timeout=self.command_timeout,
+        )
+
+    def pipeline(
+        self, transaction: bool = True, shard_hint: Optional[str] = None
+    ) -> GuardedPipeline:
+        pipe = GuardedPipeline(
+            self.connection_pool,
+            self.response_callbacks,
+            transaction,
+            shard_hint,
+        )
+        pipe.breaker = self.breaker
+        pipe.command_timeout = self.command_timeout
+        return pipe
+
+
+class ShardedRedis:
+    """Roteia chaves entre vários Redis por hash consistente."""
+
+    def __init__(self, clients: Dict[str, Redis], replicas: int = 160):
+        self.clients = clients
+        self.ring = HashRing(clients, replicas=replicas)
+
+    def for_key(self, key: str) -> Redis:
+        return self.clients[self.ring.get_node(key)]
+
+
+def node_name(url: str) -> str:
+    """Identifica o nó pelo endereço, sem credenciais.
+
+    É o nome usado no anel: trocar a senha de um nó não remapeia chaves.
+    """
+    parts = urlsplit(url)
+    return f"{parts.hostname}:{parts.port or 6379}{parts.path or '/0'}"
+
+
+def _make_breaker() -> CircuitBreaker:
+    return CircuitBreaker(
+        failure_rate=settings.redis_breaker_failure_rate,
+        minimum_calls=settings.redis_breaker_minimum_calls,
+        window_seconds=settings.redis_breaker_window,
+        open_seconds=settings.redis_breaker_open_seconds,
+        half_open_calls=settings.redis_breaker_half_open_calls,
+        failure_exceptions=(RedisConnectionError, RedisTimeoutError),
+        ignored_exceptions=(MaxConnectionsError,),
+    )
 
 
 class RedisManager:
     def __init__(
-        self, url: str = "redis://localhost", max_connections: int = 10
+        self,
+        url: Optional[str] = None,
+        max_connections: Optional[int] = None,
+        client_cache: Optional[bool] = None,
+        session_urls: Optional[List[str]] = None,
+        command_timeout: Optional[float] = None,
     ) -> None:
-        self._url = url
-        self._max_connections = max_connections
-        self._client: Redis | None = None
+        self._url = url or settings.redis_url
+        self._max_connections = (
+            max_connections or settings.redis_max_connections
+        )
+        self._command_timeout = (
+            command_timeout or settings.redis_command_timeout
+        )
+        self._client: GuardedRedis | None = None
+
+        if session_urls is None:
+            session_urls = settings.redis_session_urls
+        self._session_urls = {node_name(u): u for u in session_urls}
+        self.session_breakers = {
+            node: _make_breaker() for node in self._session_urls
+        }
+        self.session_shards: Optional[ShardedRedis] = None
+
+        if client_cache is None:
+            client_cache = settings.redis_client_cache_enabled
+        self.cache: Optional[ClientSideCache] = None
+        if client_cache:
+            self.cache = ClientSideCache(
+                prefixes=("session:", "user_version:"),
+                max_size=settings.redis_client_cache_max_size,
+                touch_interval=settings.redis_client_cache_touch_interval,
+            )
+
+        self.breaker = _make_breaker()
+
+        self.session_fallback: Optional[LocalTTLCache] = None
+        if settings.session_degraded_mode == "local":
+            self.session_fallback = LocalTTLCache(
+                max_size=settings.session_local_cache_size
+            )
 
     def get_client(self) -> Redis:
         if not self._client:
@@ -19,19 +174,76 @@ class RedisManager:
         return self._client
 
     async def connect(self):
-        if not self._client:
-            self._client = Redis.from_url(
-                self._url,
-                decode_responses=True,
-                max_connections=self._max_connections,
+        """Cria o cliente na primeira chamada; depois disso é um no-op.
+
+        Chamado a cada request pelo context getter, então só faz PING na
+        criação: com o Redis fora do ar a requisição ficaria bloqueada mesmo
+        sem precisar de sessão.
+        """
+        if self._client:
+            return
+
+        self._client = self._make_client(self._url, self.breaker)
+        if self._session_urls:
+            self.session_shards = ShardedRedis(
+                {
+                    node: self._make_client(
+                        session_url, self.session_breakers[node]
+                    )
+                    for node, session_url in self._session_urls.items()
+                },
+                replicas=settings.redis_session_ring_replicas,
             )
 
-        await self._client.ping()
+        for client in self._all_clients():
+            await client.ping()
+            if self.cache is not None:
+                await self.cache.start(client)
+
+    def _make_client(self, url: str, breaker: CircuitBreaker) -> GuardedRedis:
+        pool = GuardedConnectionPool.from_url(
+            url,
+            decode_responses=True,
+            max_connections=self._max_connections,
+            timeout=settings.redis_pool_timeout,
+            socket_timeout=settings.redis_socket_timeout,
+            socket_connect_timeout=settings.redis_socket_connect_timeout,
+            health_check_interval=settings.redis_health_check_interval,
+        )
+        client = GuardedRedis.from_pool(pool)
+        client.breaker = breaker
+        client.command_timeout = self._command_timeout
+        return client
+
+    def _all_clients(self) -> List[Redis]:
+        clients: List[Redis] = [self._client] if self._client else []
+        if self.session_shards is not None:
+            clients.extend(self.session_shards.clients.values())
+        return clients
 
     async def close(self):
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        if self.cache is not None:
+            await self.cache.stop()
+
+        for client in self._all_clients():
+            await client.aclose()
+        self._client = None
+        self.session_shards = None
+
+    def metrics(self) -> Dict[str, Any]:
+        metrics: Dict[str, Any] = {
+            "circuit_breaker": self.breaker.metrics(),
+        }
+        if self.cache is not None:
+            metrics["client_cache"] = self.cache.metrics()
+        if self.session_breakers:
+            metrics["session_shards"] = {
+                node: breaker.metrics()
+                for node, breaker in self.session_breakers.items()
+            }
+        if self.session_fallback is not None:
+            metrics["session_fallback_size"] = len(self.session_fallback)
+        return metrics
 
     @asynccontextmanager
     async def lifespan(self):
@@ -0,0 +1,224 @@
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from redis.asyncio import Redis
+from redis.asyncio.connection import Connection
+
+INVALIDATION_CHANNEL = "__redis__:invalidate"
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+    evictions: int = 0
+
+
+class ClientSideCache:
+    """Cache local de chaves quentes mantido correto pelo próprio Redis.
+
+    Usa ``CLIENT TRACKING`` em modo BCAST com redirecionamento para uma
+    conexão dedicada, inscrita em ``__redis__:invalidate``. Toda escrita
+    (inclusive expiração) em uma chave com os prefixos rastreados derruba
+    a entrada local. Sem a conexão de invalidação ativa o cache é ignorado.
+    """
+
+    def __init__(
+        self,
+        prefixes: Iterable[str],
+        max_size: int = 10_000,
+        touch_interval: int = 60,
+    ) -> None:
+        self.prefixes = tuple(prefixes)
+        self.max_size = max_size
+        self.touch_interval = touch_interval
+        self.stats = CacheStats()
+
+        self._entries: OrderedDict[str, Tuple[Any, float]] = OrderedDict()
+        self._pending: set[str] = set()
+        self._connections: Dict[int, Connection] = {}
+        self._listeners: List[asyncio.Task] = []
+        self._ready: set[int] = set()
+        self._active = False
+
+    @property
+    def is_active(self) -> bool:
+        return self._active
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        if not self._active:
+            return False, None
+
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return False, None
+
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return True, entry[0]
+
+    def begin(self, key: str) -> None:
+        """Marca uma leitura em andamento.
+
+        Se uma invalidação chegar antes da resposta, ``store`` descarta o
+        valor lido, que pode já estar desatualizado.
+        """
+        if self._active:
+            self._pending.add(key)
+
+    def cancel(self, key: str) -> None:
+        """Encerra a leitura marcada por ``begin`` sem guardar nada."""
+        self._pending.discard(key)
+
+    def store(self, key: str, value: Any) -> None:
+        if key not in self._pending:
+            return
+
+        self._pending.discard(key)
+        self._entries[key] = (value, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def needs_touch(self, key: str) -> bool:
+        """Indica se a entrada deve renovar o TTL da chave no Redis.
+
+        Renovar o TTL também a invalida, então isso acontece no máximo uma
+        vez por ``touch_interval`` por chave.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return False
+        return time.monotonic() - entry[1] >= self.touch_interval
+
+    def invalidate(self, keys: Optional[Iterable[str]] = None) -> None:
+        if keys is None:
+            self.stats.invalidations += len(self._entries)
+            self._entries.clear()
+            self._pending.clear()
+            return
+
+        for key in keys:
+            self._pending.discard(key)
+            if self._entries.pop(key, None) is not None:
+                self.stats.invalidations += 1
+
+    def metrics(self) -> Dict[str, Any]:
+        lookups = self.stats.hits + self.stats.misses
+        return {
+            **asdict(self.stats),
+            "size": len(self._entries),
+            "active": self._active,
+            "hit_rate": self.stats.hits / lookups if lookups else 0.0,
+        }
+
+    async def start(self, client: Redis) -> None:
+        """Passa a rastrear as chaves de mais um servidor.
+
+        O cache só é usado enquanto todos os servidores registrados têm a
+        conexão de invalidação ativa.
+        """
+        index = len(self._listeners)
+        self._listeners.append(
+            asyncio.create_task(self._listen(index, client))
+        )
+        self._active = False
+
+    async def stop(self) -> None:
+        for listener in self._listeners:
+            listener.cancel()
+            try:
+                await listener
+            except asyncio.CancelledError:
+                pass
+        self._listeners = []
+
+        for index in list(self._connections):
+            await self._reset(index)
+
+    async def _subscribe(self, client: Redis) -> Connection:
+        pool = client.connection_pool
+        connection = pool.connection_class(
+            **{**pool.connection_kwargs, "socket_timeout": None}
+        )
+        await connection.connect()
+
+        await connection.send_command("CLIENT", "ID")
+        client_id = await connection.read_response()
+
+        args: list[Any] = ["CLIENT", "TRACKING", "ON"]
+        args += ["REDIRECT", client_id, "BCAST"]
+        for prefix in self.prefixes:
+            args += ["PREFIX", prefix]
+        await connection.send_command(*args)
+        await connection.read_response()
+
+        await connection.send_command("SUBSCRIBE", INVALIDATION_CHANNEL)
+        await connection.read_response()
+        return connection
+
+    async def _listen(self, index: int, client: Redis) -> None:
+        while True:
+            try:
+                connection = await self._subscribe(client)
+                self._connections[index] = connection
+                self._ready.add(index)
+                self._active = len(self._ready) == len(self._listeners)
+
+                while True:
+                    message = await connection.read_response()
+                    if isinstance(message, list) and message[0] == "message":
+                        self.invalidate(message[2])
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                await self._reset(index)
+                await asyncio.sleep(1)
+
+    async def _reset(self, index: int) -> None:
+        self._ready.discard(index)
+        self._active = False
+        self.invalidate()
+
+        connection = self._connections.pop(index, None)
+        if connection is not None:
+            await connection.disconnect()
+
+
+class LocalTTLCache:
+    """LRU local com expiração, usado como reserva quando o Redis cai."""
+
+    def __init__(self, max_size: int = 10_000) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[str, Tuple[Any, float]] = OrderedDict()
+
+    def get(self, key: str) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        value, deadline = entry
+        if time.monotonic() >= deadline:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        self._entries[key] = (value, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,149 @@
+import asyncio
+import itertools
+from collections import Counter
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from app.core.database import engine_options
+from app.core.settings import settings
+
+
+def parse_lsn(value: str) -> int:
+    """``'16/B374D848'`` -> posição absoluta no WAL, comparável."""
+    high, low = value.split("/")
+    return (int(high, 16) << 32) | int(low, 16)
+
+
+async def primary_lsn(session: AsyncSession) -> int:
+    """Posição atual do WAL no primário, lida depois de um commit."""
+    result = await session.execute(text("SELECT pg_current_wal_lsn()::text"))
+    return parse_lsn(result.scalar_one())
+
+
+class ReplicaRouter:
+    """Distribui leituras entre réplicas em round-robin.
+
+    Um monitor consulta ``pg_last_wal_replay_lsn()`` de cada réplica a cada
+    ``interval``. Réplica que não responde, ou que não está em recovery,
+    sai da rotação até a próxima checagem. O LSN guardado só fica para
+    trás do real, então ``replayed >= min_lsn`` nunca aceita uma réplica
+    que ainda não aplicou a escrita que a sessão precisa ver.
+    """
+
+    def __init__(
+        self,
+        urls: Sequence[str],
+        interval: float = 5.0,
+        timeout: float = 1.0,
+    ) -> None:
+        self.interval = interval
+        self.timeout = timeout
+        self.engines = [
+            create_async_engine(url, **engine_options()) for url in urls
+        ]
+        self.sessions = [
+            async_sessionmaker(engine, expire_on_commit=False)
+            for engine in self.engines
+        ]
+        self.replayed: List[Optional[int]] = [None] * len(self.engines)
+        self.routed: Counter = Counter()
+        self._cursor = itertools.count()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.engines)
+
+    def pick(self, min_lsn: Optional[int] = None) -> Optional[int]:
+        """Próxima réplica saudável que já aplicou ``min_lsn``."""
+        if not self.engines:
+            return None
+        start = next(self._cursor)
+        for offset in range(len(self.engines)):
+            index = (start + offset) % len(self.engines)
+            replayed = self.replayed[index]
+            if replayed is None:
+                continue
+            if min_lsn is None or replayed >= min_lsn:
+                return index
+        return None
+
+    def session(self, min_lsn: Optional[int] = None) -> Optional[AsyncSession]:
+        """Sessão numa réplica, ou ``None`` para ler do primário."""
+        if not self.enabled:
+            return None
+        index = self.pick(min_lsn)
+        if index is None:
+            healthy = any(lsn is not None for lsn in self.replayed)
+            reason = "pinned" if healthy else "unavailable"
+            self.routed[f"primary_{reason}"] += 1
+            return None
+        self.routed[f"replica_{index}"] += 1
+        return self.sessions[index]()
+
+    async def _probe(self, index: int) -> None:
+        value = None
+        try:
+            async with asyncio.timeout(self.timeout):
+                async with self.engines[index].connect() as connection:
+                    result = await connection.execute(
+                        text("SELECT pg_last_wal_replay_lsn()::text")
+                    )
+                    value = result.scalar()
+        except (OSError, SQLAlchemyError, TimeoutError):
+            pass
+        self.replayed[index] = parse_lsn(value) if value else None
+
+    async def check(self) -> None:
+        await asyncio.gather(
+            *(self._probe(index) for index in range(len(self.engines)))
+        )
+
+    async def _monitor(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.check()
+
+    @asynccontextmanager
+    async def lifespan(self) -> AsyncIterator["ReplicaRouter"]:
+        if not self.enabled:
+            yield self
+            return
+
+        await self.check()
+        self._task = asyncio.create_task(self._monitor())
+        try:
+            yield self
+        finally:
+            self._task.cancel()
+            self._task = None
+            for engine in self.engines:
+                await engine.dispose()
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "replicas": [
+                {
+                    "url": engine.url.render_as_string(hide_password=True),
+                    "healthy": replayed is not None,
+                    "replayed_lsn": replayed,
+                }
+                for engine, replayed in zip(self.engines, self.replayed)
+            ],
+            "routed": dict(self.routed),
+        }
+
+
+replica_router = ReplicaRouter(
+    settings.database_replica_urls,
+    interval=settings.replica_health_interval,
+    timeout=settings.replica_health_timeout,
+)
@@ -1,6 +1,8 @@
 import os
+from typing import Annotated, List, Literal, Optional
 
 from dotenv import load_dotenv
+from pydantic import BeforeValidator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 # Define o ambiente atual (default para 'development')
@@ -20,6 +22,78 @@ class Settings(BaseSettings):
     secret_key: str = "your_secret_key"
     access_token_expire_minutes: int = 30
     algorithm: str = "HS256"
+    # 4: aleatórias; 7: ordenadas no tempo (ligue antes da migration 0520).
+    # Literal não converte texto: o valor do .env chega como "7"
+    id_uuid_version: Annotated[Literal[4, 7], BeforeValidator(int)] = 4
+    # PgBouncer em transaction mode não aguenta prepares nomeados por conexão
+    db_pgbouncer: bool = False
+    db_prepared_statement_cache_size: int = 100
+    db_statement_cache_size: int = 100
+    db_query_cache_size: int = 500
+    # URLs asyncpg das réplicas de leitura; vazio manda tudo ao primário
+    database_replica_urls: List[str] = []
+    replica_health_interval: float = 5.0
+    replica_health_timeout: float = 1.0
+
+    redis_url: str = "redis://localhost"
+    redis_max_connections: int = 10
+    # Espera por conexão livre no pool; menor que o timeout por comando
+    redis_pool_timeout: float = 0.1
+    redis_socket_timeout: float = 5.0
+    redis_socket_connect_timeout: float = 2.0
+    redis_health_check_interval: int = 30
+    redis_session_urls: List[str] = []
+    redis_session_ring_replicas: int = 160
+    redis_client_cache_enabled: bool = False
+    redis_client_cache_max_size: int = 10_000
+    redis_client_cache_touch_interval: int = 60
+    redis_command_timeout: float = 0.5
+    redis_breaker_failure_rate: float = 0.5
+    redis_breaker_minimum_calls: int = 20
+    redis_breaker_window: int = 10
+    redis_breaker_open_seconds: float = 5.0
+    redis_breaker_half_open_calls: int = 1
+    session_degraded_mode: Literal["reject", "local"] = "reject"
+    session_local_cache_size: int = 10_000
+    # O primeiro esquema é o padrão; os demais só verificam hashes antigos
+    password_schemes: List[str] = ["bcrypt", "argon2", "scrypt"]
+    bcrypt_rounds: int = 12
+    argon2_time_cost: int = 3
+    argon2_memory_cost: int = 64 * 1024  # KiB
+    argon2_parallelism: int = 4
+    scrypt_rounds: int = 16  # log2(N)
+    scrypt_block_size: int = 8
+    scrypt_parallelism: int = 1
+    login_throttle_enabled: bool = True
+    login_window_seconds: int = 15 * 60
+    login_max_attempts_per_email: int = 5
+    login_max_attempts_per_ip: int = 50
+    login_lockout_base_seconds: int = 60
+    login_lockout_max_seconds: int = 60 * 60
+    analytics_enabled: bool = True
+    analytics_concurrency_window_minutes: int = 15
+    # Escritas de atividade aguardando o próximo lote; o excesso é descartado
+    analytics_buffer_max_size: int = 10_000
+    breached_passwords_path: Optional[str] = None
+    availability_filter_bits: int = 2**25
+    users_page_default_size: int = 20
+    users_page_max_size: int = 100
+    availability_filter_hashes: int = 7
+    idempotency_ttl_seconds: int = 24 * 60 * 60
+    idempotency_lock_seconds: int = 30
+    idempotency_wait_seconds: float = 10.0
+    user_cache_enabled: bool = True
+    user_cache_ttl_seconds: int = 5 * 60
+    user_cache_local_ttl_seconds: float = 1.0
+    user_cache_local_size: int = 10_000
+    user_cache_early_refresh_beta: float = 1.0
+    admission_enabled: bool = True
+    admission_max_in_flight: int = 64
+    admission_max_queue: int = 256
+    admission_queue_timeout: float = 2.0
+    admission_retry_after: int = 1
+    # Bearer token do /metrics; vazio desliga o endpoint
+    metrics_token: Optional[str] = None
 
     model_config = SettingsConfigDict(env_file=f".env.{ENV}", extra="ignore")
 
@@ -43,6 +43,20 @@ class ForbiddenError(AppError):
         super().__init__(message)
 
 
+class ServiceUnavailableError(AppError):
+    """Dependência externa indisponível no momento."""
+
+    def __init__(self, message: str = "Serviço indisponível."):
+        super().__init__(message)
+
+
+class TooManyRequestsError(AppError):
+    """Limite de requisições excedido."""
+
+    def __init__(self, message: str = "Muitas requisições."):
+        super().__init__(message)
+
+
 class UserNotFoundError(NotFoundError):
     def __init__(self):
         msg = (
@@ -101,3 +115,94 @@ class ExpiredSessionError(UnauthorizedError):
         )
 
         super().__init__(msg)
+
+
+class SessionStoreUnavailableError(ServiceUnavailableError):
+    def __init__(self):
+        msg = (
+            "O oráculo das sessões está em meditação profunda. "
+            + "Tente novamente em alguns instantes."
+        )
+
+        super().__init__(msg)
+
+
+class MasterPermissionRequiredError(ForbiddenError):
+    def __init__(self):
+        msg = (
+            "Esse pergaminho só pode ser lido pelo mestre da mesa. "
+            + "Jogadores, voltem para suas fichas."
+        )
+
+        super().__init__(msg)
+
+
+class TooManyLoginAttemptsError(TooManyRequestsError):
+    def __init__(self, retry_after: int):
+        msg = (
+            "Tentativas demais! O guardião da porta desconfiou e trancou "
+            + f"tudo. Tente de novo em {retry_after} segundos."
+        )
+
+        super().__init__(msg)
+        self.extensions["retry_after"] = retry_after
+
+
+class InvalidIdempotencyKeyError(AppError):
+    def __init__(self, max_length: int):
+        msg = (
+            "Essa runa de idempotência está ilegível. Use uma chave "
+            + f"com 1 a {max_length} caracteres."
+        )
+
+        super().__init__(msg)
+
+
+class IdempotencyKeyReusedError(ConflictError):
+    def __init__(self):
+        msg = (
+            "Essa runa de idempotência já selou outro feitiço. "
+            + "Gere uma chave nova para um pedido diferente."
+        )
+
+        super().__init__(msg)
+
+
+class IdempotencyKeyInProgressError(ConflictError):
+    def __init__(self):
+        msg = (
+            "O mesmo feitiço ainda está sendo conjurado. "
+            + "Aguarde um instante e repita com a mesma chave."
+        )
+
+        super().__init__(msg)
+
+
+class InvalidCursorError(AppError):
+    def __init__(self):
+        msg = (
+            "Esse marcador de página não pertence a este grimório. "
+            + "Use o endCursor devolvido pela consulta anterior."
+        )
+
+        super().__init__(msg)
+
+
+class PageSizeOutOfRangeError(AppError):
+    def __init__(self, max_size: int):
+        msg = (
+            "Nem a biblioteca de Candlekeep entrega tantos pergaminhos "
+            + f"de uma vez. Peça entre 1 e {max_size} por página."
+        )
+
+        super().__init__(msg)
+
+
+class SearchTermTooShortError(AppError):
+    def __init__(self, min_length: int):
+        msg = (
+            "Nem o oráculo de Delfos adivinha com tão poucas runas. "
+            + f"Busque com pelo menos {min_length} caracteres."
+        )
+
+        super().__init__(msg)
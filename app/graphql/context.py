@@ -7,16 +7,27 @@ from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 from strawberry.fastapi import BaseContext
 
+from app.core.redis import RedisManager
+from app.core.replicas import primary_lsn, replica_router
+from app.core.settings import settings
 from app.exceptions import (
     ExpiredSessionError,
     PermissionDeniedError,
+    SessionStoreUnavailableError,
     UserNotFoundError,
 )
+from app.graphql.loaders import UserLoaders
 from app.models.user_model import UserModel
+from app.repositories.user_cache import UserCache
+from app.schemas.user_schema import UserRead
+from app.services.analytics_service import AnalyticsService
+from app.services.availability_service import AvailabilityService
+from app.services.idempotency_service import IdempotencyService
+from app.services.login_throttle_service import LoginThrottleService
 from app.services.session_service import SessionService
 from app.services.user_auth_service import UserAuthService
 from app.services.user_service import UserService
-from app.utils.validators import is_uuid4
+from app.utils.validators import is_uuid
 
 
 @dataclass
@@ -25,8 +36,11 @@ class Context(BaseContext):
     redis: Redis
     request: Request
     response: Response
-    user: Optional[UserModel] = None
+    user: Optional[UserRead] = None
+    redis_manager: Optional[RedisManager] = None
+    write_lsn: Optional[int] = None
 
+    _user_model: Optional[UserModel] = field(init=False, default=None)
     _user_service: Optional[UserService] = field(init=False, default=None)
     _user_auth_service: Optional[UserAuthService] = field(
         init=False, default=None
@@ -34,25 +48,138 @@ class Context(BaseContext):
     _session_service: Optional[SessionService] = field(
         init=False, default=None
     )
+    _analytics_service: Optional[AnalyticsService] = field(
+        init=False, default=None
+    )
+    _idempotency_service: Optional[IdempotencyService] = field(
+        init=False, default=None
+    )
+    _availability_service: Optional[AvailabilityService] = field(
+        init=False, default=None
+    )
+    _loaders: Optional[UserLoaders] = field(init=False, default=None)
+    _user_cache: Optional[UserCache] = field(init=False, default=None)
+    _read_session: Optional[AsyncSession] = field(init=False, default=None)
+
+    @property
+    def read_session(self) -> AsyncSession:
+        """Réplica para leituras que toleram atraso, ou o primário.
+
+        Com ``write_lsn`` (escrita recente desta sessão) só serve uma
+        réplica que já aplicou aquele ponto do WAL.
+        """
+        if self._read_session is None:
+            replica = replica_router.session(self.write_lsn)
+            self._read_session = replica or self.session
+        return self._read_session
+
+    async def close(self) -> None:
+        if self._read_session not in (None, self.session):
+            await self._read_session.close()
 
     @property
     def user_service(self) -> UserService:
         if self._user_service is None:
-            self._user_service = UserService(self.session)
+            self._user_service = UserService(
+                self.session,
+                self.session_service,
+                self.availability_service,
+                read_session=self.read_session,
+                cache=self.user_cache,
+            )
         return self._user_service
 
+    @property
+    def user_cache(self) -> Optional[UserCache]:
+        if self._user_cache is None and settings.user_cache_enabled:
+            self._user_cache = UserCache(self.redis)
+        return self._user_cache
+
     @property
     def user_auth_service(self) -> UserAuthService:
         if self._user_auth_service is None:
-            self._user_auth_service = UserAuthService(self.session)
+            throttle = None
+            if settings.login_throttle_enabled:
+                throttle = LoginThrottleService(self.redis)
+            self._user_auth_service = UserAuthService(
+                self.session,
+                self.session_service,
+                throttle,
+                cache=self.user_cache,
+            )
         return self._user_auth_service
 
+    @property
+    def analytics_service(self) -> AnalyticsService:
+        if self._analytics_service is None:
+            self._analytics_service = AnalyticsService(self.redis)
+        return self._analytics_service
+
+    @property
+    def loaders(self) -> UserLoaders:
+        if self._loaders is None:
+            self._loaders = UserLoaders(self.session)
+        return self._loaders
+
+    @property
+    def availability_service(self) -> AvailabilityService:
+        if self._availability_service is None:
+            self._availability_service = AvailabilityService(
+                self.session, self.redis
+            )
+        return self._availability_service
+
+    @property
+    def idempotency_service(self) -> IdempotencyService:
+        if self._idempotency_service is None:
+            self._idempotency_service = IdempotencyService(self.redis)
+        return self._idempotency_service
+
     @property
     def session_service(self) -> SessionService:
         if self._session_service is None:
-            self._session_service = SessionService(self.redis)
+            manager = self.redis_manager
+            if manager is None:
+                self._session_service = SessionService(self.redis)
+            else:
+                analytics_enabled = settings.analytics_enabled
+                self._session_service = SessionService(
+                    self.redis,
+                    cache=manager.cache,
+                    fallback=manager.session_fallback,
+                    shards=manager.session_shards,
+                    analytics=(
+                        self.analytics_service if analytics_enabled else None
+                    ),
+                )
         return self._session_service
 
+    @property
+    def client_ip(self) -> Optional[str]:
+        client = self.request.client
+        return client.host if client else None
+
+    def idempotency_key(self, argument: Optional[str] = None) -> Optional[str]:
+        """Chave vinda do argumento ou do header ``Idempotency-Key``."""
+        if argument is not None:
+            return argument
+        return self.request.headers.get("idempotency-key")
+
+    async def write_marker(self) -> Optional[int]:
+        """LSN do primário agora; ``None`` quando não há réplicas."""
+        if not replica_router.enabled:
+            return None
+        return await primary_lsn(self.session)
+
+    async def record_write(self) -> None:
+        """Prende as leituras seguintes desta sessão à última escrita."""
+        write_lsn = await self.write_marker()
+        session_id = self.request.cookies.get("session")
+        if write_lsn is None or not session_id or not is_uuid(session_id):
+            return
+        self.write_lsn = write_lsn
+        await self.session_service.mark_write(UUID(session_id), write_lsn)
+
     def set_cookie(self, session_id: UUID) -> None:
         self.response.set_cookie(
             key="session",
@@ -69,19 +196,77 @@ class Context(BaseContext):
         if not session_id:
             raise PermissionDeniedError
 
-        if not is_uuid4(session_id):
+        if not is_uuid(session_id):
             raise ExpiredSessionError()
 
-        user = await self.session_service.get_user_id_from_session(
-            UUID(session_id)
-        )
-        if not user:
+        session_uuid = UUID(session_id)
+        user_session = await self.session_service.get_session(session_uuid)
+        if not user_session:
             raise ExpiredSessionError
 
-        user = await self.session.get(UserModel, ident=user.id)
+        user_id = user_session.user.id
+        self.write_lsn = user_session.write_lsn
+        try:
+            version = await self.session_service.get_user_version(user_id)
+        except SessionStoreUnavailableError:
+            if self.session_service.fallback is None:
+                raise
+            version = user_session.version
+        if version == user_session.version:
+            self.user = user_session.user
+            self.loaders.prime(self.user)
+            return True
+
+        # Sem marcador não se sabe que ponto do WAL tem a escrita que mudou
+        # a versão; uma réplica atrasada gravaria o usuário velho na sessão
+        session = self.session
+        if self.write_lsn is not None:
+            session = self.read_session
+
+        if self.user_cache is None:
+            user = await self._load_user(session, user_id)
+        else:
+            user = await self.user_cache.get_or_load(
+                user_id,
+                lambda: self._load_user(session, user_id),
+                store=session is self.session,
+                # O L1 não confere a versão e o resultado vai para a sessão
+                local=False,
+            )
         if not user:
             raise UserNotFoundError
 
         self.user = user
+        self.loaders.prime(self.user)
+        await self.session_service.save_session(
+            session_uuid,
+            self.user,
+            version,
+            user_session.analytics_offset,
+            user_session.write_lsn,
+        )
 
         return True
+
+    async def _load_user(
+        self, session: AsyncSession, user_id: UUID
+    ) -> Optional[UserRead]:
+        user = await session.get(UserModel, ident=user_id)
+        if not user:
+            return None
+        if session is self.session:
+            self._user_model = user
+        return UserRead.model_validate(user)
+
+    async def get_user_model(self) -> UserModel:
+        """Carrega a linha do usuário autenticado apenas quando necessária."""
+        if self._user_model is None:
+            if not self.user:
+                raise PermissionDeniedError
+
+            user = await self.session.get(UserModel, ident=self.user.id)
+            if not user:
+                raise UserNotFoundError
+
+            self._user_model = user
+        return self._user_model
@@ -8,9 +8,14 @@ from app.graphql.context import Context
 async def get_context(request: Request, response: Response):
     await redis_manager.connect()
     async with get_session() as session:
-        yield Context(
+        context = Context(
             session=session,
             redis=redis_manager.get_client(),
+            redis_manager=redis_manager,
             request=request,
             response=response,
         )
+        try:
+            yield context
+        finally:
+            await context.close()
@@ -0,0 +1,91 @@
+from collections import Counter
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
+from uuid import UUID
+
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from strawberry.dataloader import DataLoader
+
+from app.repositories.user_read_repository import UserReadRepository
+from app.schemas.user_schema import UserRead
+
+# Linhas Core vão direto para o ``UserType.from_pydantic``, que só lê
+# atributos; ``UserRead`` aparece quando o loader é pré-carregado
+UserLike = Union[UserRead, Row]
+
+
+class BatchMetrics:
+    """Tamanho dos lotes despachados pelos DataLoaders, por loader."""
+
+    BUCKETS = (1, 2, 5, 10, 25, 50, 100)
+
+    def __init__(self) -> None:
+        self.batches: Counter = Counter()
+        self.keys: Counter = Counter()
+        self.sizes: Dict[str, Counter] = {}
+
+    def record(self, name: str, size: int) -> None:
+        self.batches[name] += 1
+        self.keys[name] += size
+        bucket = next((b for b in self.BUCKETS if size <= b), "inf")
+        self.sizes.setdefault(name, Counter())[f"le_{bucket}"] += 1
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            name: {
+                "batches": self.batches[name],
+                "keys": self.keys[name],
+                "avg_batch_size": self.keys[name] / self.batches[name],
+                "batch_sizes": dict(self.sizes[name]),
+            }
+            for name in self.batches
+        }
+
+
+loader_metrics = BatchMetrics()
+
+
+class UserLoaders:
+    """DataLoaders de usuário de uma requisição.
+
+    Chaves pedidas no mesmo tick do event loop viram uma única consulta
+    ``= ANY(:keys)``; o cache vive só até o fim da requisição.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        repository = UserReadRepository(session)
+        self.by_id: DataLoader[UUID, Optional[UserLike]] = DataLoader(
+            self._batch("user_by_id", repository.get_by_ids, "id")
+        )
+        # Email sem caixa no SQL; cada linha traz o email pedido em ``key``
+        self.by_email: DataLoader[str, Optional[UserLike]] = DataLoader(
+            self._batch("user_by_email", repository.get_by_emails, "key")
+        )
+
+    def prime(self, user: UserRead) -> None:
+        self.by_id.prime(user.id, user)
+        self.by_email.prime(user.email, user)
+
+    def _batch(
+        self,
+        name: str,
+        fetch: Callable[[Sequence[Any]], Awaitable[List[Any]]],
+        attribute: str,
+    ):
+        async def load(keys: List[Any]) -> List[Optional[UserLike]]:
+            loader_metrics.record(name, len(keys))
+            users = {
+                getattr(user, attribute): user for user in await fetch(keys)
+            }
+            return [users.get(key) for key in keys]
+
+        return load
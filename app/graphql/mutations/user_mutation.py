@@ -1,3 +1,5 @@
+from typing import Optional
+
 import strawberry
 from graphql import GraphQLError
 from strawberry.types import Info
@@ -6,17 +8,28 @@ import app.graphql.types.user_types as user_types
 from app.graphql.context import Context
 from app.graphql.permission import IsAuthenticated
 from app.graphql.types.user_types import UserType
+from app.schemas.user_schema import UserRead
 
 
 @strawberry.type
 class UserMutation:
     @strawberry.mutation
     async def create_user(
-        self, info: Info[Context, None], data: user_types.UserCreateInput
+        self,
+        info: Info[Context, None],
+        data: user_types.UserCreateInput,
+        idempotency_key: Optional[str] = None,
     ) -> UserType:
         try:
-            user = await info.context.user_service.create_user(
-                data.to_pydantic()
+            context = info.context
+            user_data = data.to_pydantic()
+            user = await context.idempotency_service.run(
+                "create_user",
+                "anonymous",
+                context.idempotency_key(idempotency_key),
+                user_data.model_dump(),
+                UserRead,
+                lambda: context.user_service.create_user(user_data),
             )
             return UserType.from_pydantic(user)
         except GraphQLError:
@@ -31,10 +44,14 @@ class UserMutation:
         try:
             context = info.context
             user = await context.user_auth_service.login_user(
-                data.to_pydantic()
+                data.to_pydantic(), client_ip=context.client_ip
             )
 
-            session_id = await context.session_service.create_session(user)
+            # O usuário pode ter acabado de ser criado: a sessão nasce
+            # presa ao primário até as réplicas chegarem neste ponto
+            session_id = await context.session_service.create_session(
+                user, await context.write_marker()
+            )
             context.set_cookie(session_id)
 
             return UserType.from_pydantic(user)
@@ -48,15 +65,24 @@ class UserMutation:
         self,
         info: Info[Context, None],
         data: user_types.UserUpdateInput,
+        idempotency_key: Optional[str] = None,
     ) -> UserType:
         try:
-            user = info.context.user
+            context = info.context
+            user = context.user
             if not user:
                 raise GraphQLError("Usuário não autenticado ou inválido.")
 
-            userRead = await info.context.user_service.update_user(
-                user.id, data.to_pydantic()
+            user_data = data.to_pydantic()
+            userRead = await context.idempotency_service.run(
+                "update_user",
+                str(user.id),
+                context.idempotency_key(idempotency_key),
+                user_data.model_dump(),
+                UserRead,
+                lambda: context.user_service.update_user(user.id, user_data),
             )
+            await context.record_write()
             return UserType.from_pydantic(userRead)
         except GraphQLError:
             raise
@@ -70,15 +96,26 @@ class UserMutation:
         self,
         info: Info[Context, None],
         data: user_types.UserChangePasswordInput,
+        idempotency_key: Optional[str] = None,
     ) -> UserType:
         try:
-            user = info.context.user
+            context = info.context
+            user = context.user
             if not user:
                 raise GraphQLError("Usuário não autenticado ou inválido.")
 
-            userRead = await info.context.user_auth_service.change_password(
-                user.id, data.to_pydantic()
+            password_data = data.to_pydantic()
+            userRead = await context.idempotency_service.run(
+                "change_password",
+                str(user.id),
+                context.idempotency_key(idempotency_key),
+                password_data.model_dump(),
+                UserRead,
+                lambda: context.user_auth_service.change_password(
+                    user.id, password_data
+                ),
             )
+            await context.record_write()
             return UserType.from_pydantic(userRead)
         except GraphQLError:
             raise
@@ -4,6 +4,8 @@ import strawberry
 from graphql import GraphQLError
 from strawberry.permission import BasePermission
 
+from app.exceptions import MasterPermissionRequiredError
+
 
 class IsAuthenticated(BasePermission):
     def has_permission(
@@ -21,3 +23,13 @@ class IsAuthenticated(BasePermission):
 
     def on_unauthorized(self) -> None:
         raise self.error_class()  # type: ignore
+
+
+class IsMaster(BasePermission):
+    async def has_permission(
+        self, source: typing.Any, info: strawberry.Info, **kwargs
+    ) -> bool:
+        await info.context.authenticate_user()
+        if not info.context.user.is_master:
+            raise MasterPermissionRequiredError()
+        return True
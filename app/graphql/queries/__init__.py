@@ -1,8 +1,9 @@
 import strawberry
 
+from app.graphql.queries.analytics_query import AnalyticsQuery
 from app.graphql.queries.user_query import UserQuery
 
 
 @strawberry.type
-class Query(UserQuery):
+class Query(UserQuery, AnalyticsQuery):
     pass
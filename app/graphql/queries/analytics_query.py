@@ -0,0 +1,22 @@
+import strawberry
+from graphql import GraphQLError
+from strawberry.types import Info
+
+from app.graphql.context import Context
+from app.graphql.permission import IsMaster
+from app.graphql.types.analytics_types import ActiveUsersType
+
+
+@strawberry.type
+class AnalyticsQuery:
+    @strawberry.field(permission_classes=[IsMaster])
+    async def active_users(self, info: Info[Context, None]) -> ActiveUsersType:
+        try:
+            stats = await info.context.analytics_service.get_active_users()
+            return ActiveUsersType.from_pydantic(stats)
+        except GraphQLError:
+            raise
+        except Exception as e:
+            raise GraphQLError(
+                f"Erro inesperado ao buscar usuários ativos: {str(e)}"
+            )
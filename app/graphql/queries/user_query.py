@@ -1,14 +1,21 @@
+from typing import List, Optional
 from uuid import UUID
 
 import strawberry
 from graphql import GraphQLError
 from strawberry.types import Info
 
-from app.exceptions import UserNotFoundError
+from app.core.settings import settings
+from app.exceptions import PageSizeOutOfRangeError, UserNotFoundError
 from app.graphql.context import Context
-from app.graphql.permission import IsAuthenticated
+from app.graphql.permission import IsAuthenticated, IsMaster
+from app.graphql.selection import selected_columns
 from app.graphql.types.user_types import (
+    UserAvailabilityType,
+    UserConnectionType,
     UserLogoutType,
+    UserOrderByEnum,
+    UserSearchConnectionType,
     UserType,
 )
 
@@ -22,13 +29,88 @@ class UserQuery:
             if not user:
                 raise UserNotFoundError
 
-            user = await info.context.user_service.get_user_by_id(user.id)
+            user = await info.context.user_service.get_user_by_id(
+                user.id, selected_columns(info)
+            )
             return UserType.from_pydantic(user)
         except GraphQLError:
             raise
         except Exception as e:
             raise GraphQLError(f"Erro inesperado ao buscar usuário: {str(e)}")
 
+    @strawberry.field(permission_classes=[IsMaster])
+    async def users(
+        self,
+        info: Info[Context, None],
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+        order_by: UserOrderByEnum = UserOrderByEnum.CREATED_AT_ASC,
+    ) -> UserConnectionType:
+        try:
+            connection = await info.context.user_service.list_users(
+                first, after, order_by
+            )
+            return UserConnectionType.from_pydantic(connection)
+        except GraphQLError:
+            raise
+        except Exception as e:
+            raise GraphQLError(f"Erro inesperado ao listar usuários: {str(e)}")
+
+    @strawberry.field(permission_classes=[IsMaster])
+    async def search_users(
+        self,
+        info: Info[Context, None],
+        term: str,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+    ) -> UserSearchConnectionType:
+        try:
+            connection = await info.context.user_service.search_users(
+                term, first, after
+            )
+            return UserSearchConnectionType.from_pydantic(connection)
+        except GraphQLError:
+            raise
+        except Exception as e:
+            raise GraphQLError(f"Erro inesperado ao buscar usuários: {str(e)}")
+
+    @strawberry.field(permission_classes=[IsMaster])
+    async def users_by_ids(
+        self, info: Info[Context, None], ids: List[UUID]
+    ) -> List[Optional[UserType]]:
+        try:
+            if len(ids) > settings.users_page_max_size:
+                raise PageSizeOutOfRangeError(settings.users_page_max_size)
+
+            users = await info.context.loaders.by_id.load_many(ids)
+            return [
+                UserType.from_pydantic(user) if user else None
+                for user in users
+            ]
+        except GraphQLError:
+            raise
+        except Exception as e:
+            raise GraphQLError(f"Erro inesperado ao buscar usuários: {str(e)}")
+
+    @strawberry.field
+    async def is_available(
+        self,
+        info: Info[Context, None],
+        username: Optional[str] = None,
+        email: Optional[str] = None,
+    ) -> UserAvailabilityType:
+        try:
+            availability = await info.context.availability_service.check(
+                username, email
+            )
+            return UserAvailabilityType.from_pydantic(availability)
+        except GraphQLError:
+            raise
+        except Exception as e:
+            raise GraphQLError(
+                f"Erro inesperado ao verificar disponibilidade: {str(e)}"
+            )
+
     @strawberry.field(permission_classes=[IsAuthenticated])
     async def logout(self, info: Info[Context, None]) -> UserLogoutType:
         try:
@@ -0,0 +1,25 @@
+from typing import Iterable, Set
+
+from strawberry.types import Info
+from strawberry.types.nodes import SelectedField, Selection
+from strawberry.utils.str_converters import to_snake_case
+
+
+def selected_columns(info: Info) -> Set[str]:
+    """Campos pedidos no resolver atual, em snake_case.
+
+    Atravessa fragments e inline fragments; ``__typename`` fica de fora.
+    """
+    names: Set[str] = set()
+    for field in info.selected_fields:
+        _collect(field.selections, names)
+    return names
+
+
+def _collect(selections: Iterable[Selection], names: Set[str]) -> None:
+    for selection in selections:
+        if isinstance(selection, SelectedField):
+            if not selection.name.startswith("__"):
+                names.add(to_snake_case(selection.name))
+        else:
+            _collect(selection.selections, names)
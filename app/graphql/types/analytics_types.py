@@ -0,0 +1,8 @@
+from strawberry.experimental import pydantic
+
+import app.schemas.analytics_schema as analytics
+
+
+@pydantic.type(model=analytics.ActiveUsersRead, all_fields=True)
+class ActiveUsersType:
+    pass
@@ -1,6 +1,7 @@
 import strawberry
 from strawberry.experimental import pydantic
 
+import app.schemas.pagination_schema as pagination
 import app.schemas.user_schema as user
 
 
@@ -37,3 +38,36 @@ class UserLogoutType:
 @pydantic.type(model=user.UserRead, all_fields=True, include_computed=True)
 class UserType:
     pass
+
+
+@pydantic.type(model=user.UserAvailabilityRead, all_fields=True)
+class UserAvailabilityType:
+    pass
+
+
+UserOrderByEnum = strawberry.enum(user.UserOrderBy, name="UserOrderBy")
+
+
+@pydantic.type(model=pagination.PageInfoRead, all_fields=True)
+class PageInfoType:
+    pass
+
+
+@pydantic.type(model=user.UserEdgeRead, all_fields=True)
+class UserEdgeType:
+    pass
+
+
+@pydantic.type(model=user.UserConnectionRead, all_fields=True)
+class UserConnectionType:
+    pass
+
+
+@pydantic.type(model=user.UserSearchEdgeRead, all_fields=True)
+class UserSearchEdgeType:
+    pass
+
+
+@pydantic.type(model=user.UserSearchConnectionRead, all_fields=True)
+class UserSearchConnectionType:
+    pass
@@ -0,0 +1,71 @@
+"""Gera o filtro de senhas vazadas de ``validate_password_not_breached``.
+
+Aceita listas em texto puro (uma senha por linha) ou no formato do
+Pwned Passwords (``SHA1:contagem``). O resultado é o arquivo apontado por
+``BREACHED_PASSWORDS_PATH``.
+
+Uso:
+    python -m app.jobs.build_password_filter rockyou.txt -o breached.bloom
+    python -m app.jobs.build_password_filter pwned-passwords-sha1.txt \\
+        --format sha1 --false-positive-rate 1e-7 -o breached.bloom
+"""
+
+import argparse
+import os
+import re
+import time
+from typing import Iterator, List
+
+from app.utils.breached_passwords import build_filter, password_digest
+
+_SHA1_LINE = re.compile(r"^[0-9A-Fa-f]{40}(:\d+)?$")
+
+
+def _lines(paths: List[str]) -> Iterator[str]:
+    for path in paths:
+        with open(path, encoding="utf-8", errors="surrogateescape") as file:
+            for line in file:
+                line = line.rstrip("\r\n")
+                if line:
+                    yield line
+
+
+def digests(paths: List[str], fmt: str) -> Iterator[bytes]:
+    for line in _lines(paths):
+        if fmt == "sha1" or (fmt == "auto" and _SHA1_LINE.match(line)):
+            yield bytes.fromhex(line[:40])
+        else:
+            try:
+                yield password_digest(line)
+            except UnicodeEncodeError:
+                continue
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("inputs", nargs="+")
+    parser.add_argument("-o", "--output", required=True)
+    parser.add_argument(
+        "--format", choices=["auto", "plain", "sha1"], default="auto"
+    )
+    parser.add_argument("--false-positive-rate", type=float, default=1e-6)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    count = sum(1 for _ in _lines(args.inputs))
+    build_filter(
+        digests(args.inputs, args.format),
+        count,
+        args.output,
+        args.false_positive_rate,
+    )
+
+    size_mb = os.path.getsize(args.output) / 1024 / 1024
+    print(
+        f"✅ {count} senhas → {args.output} ({size_mb:.1f} MB) "
+        f"em {time.perf_counter() - start:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
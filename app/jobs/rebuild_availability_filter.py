@@ -0,0 +1,40 @@
+"""Recria o Bloom filter de usernames/emails usado por ``isAvailable``.
+
+Rode depois de exclusões em massa (o filtro não esquece valores) ou se a
+chave se perder no Redis; sem ela a query consulta sempre o banco.
+
+Uso:
+    python -m app.jobs.rebuild_availability_filter
+"""
+
+import argparse
+import asyncio
+
+from app.core.database import get_session
+from app.core.redis import RedisManager
+from app.core.settings import settings
+from app.services.availability_service import AvailabilityService
+
+
+async def run(batch_size: int) -> None:
+    # O filtro inteiro (MBs) vai num SET só: não cabe no timeout por comando
+    # pensado para requisições
+    manager = RedisManager(command_timeout=settings.redis_socket_timeout)
+    async with manager.lifespan() as redis:
+        async with get_session() as session:
+            service = AvailabilityService(session, redis)
+            count = await service.rebuild(batch_size=batch_size)
+
+    print(f"✅ Filtro recriado com {count} usuários")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
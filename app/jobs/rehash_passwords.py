@@ -0,0 +1,45 @@
+"""Relatório e migração em lote dos hashes de senha.
+
+Uso:
+    python -m app.jobs.rehash_passwords            # só relatório
+    python -m app.jobs.rehash_passwords --wrap     # envolve hashes fracos
+"""
+
+import argparse
+import asyncio
+import json
+import os
+
+from app.core.database import get_session
+from app.services.password_migration_service import PasswordMigrationService
+
+
+async def run(wrap: bool, batch_size: int, cpu_fraction: float) -> None:
+    async with get_session() as session:
+        service = PasswordMigrationService(
+            session, batch_size=batch_size, cpu_fraction=cpu_fraction
+        )
+        report = await service.run(wrap=wrap)
+
+    print(json.dumps(report.as_dict(), indent=2))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--wrap", action="store_true")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument(
+        "--cpu-fraction",
+        type=float,
+        default=0.25,
+        help="fração máxima de um núcleo gasta com hashes",
+    )
+    args = parser.parse_args()
+
+    # Cede CPU para os workers que atendem requisições na mesma máquina
+    os.nice(10)
+    asyncio.run(run(args.wrap, args.batch_size, args.cpu_fraction))
+
+
+if __name__ == "__main__":
+    main()
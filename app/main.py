@@ -1,23 +1,72 @@
+import hmac
 from contextlib import asynccontextmanager
+from typing import Optional
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, Header, HTTPException
 
+from app.core.admission import AdmissionControlMiddleware, admission_controller
 from app.core.redis import redis_manager
+from app.core.replicas import replica_router
 from app.core.settings import settings
 from app.graphql.context_getter import get_context
 from app.graphql.custom_graphql_route import CustomGraphQLRouter
+from app.graphql.loaders import loader_metrics
 from app.graphql.schema import schema
+from app.repositories import user_cache
+from app.services.analytics_service import activity_buffer
+from app.utils.breached_passwords import get_breached_filter
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     print("🔌 Aplicação iniciando...")
-    async with redis_manager.lifespan():
+    # Abre o filtro já na subida: caminho errado derruba o deploy cedo
+    get_breached_filter()
+    async with redis_manager.lifespan(), replica_router.lifespan():
         yield
+        await activity_buffer.flush()
     print("🔌 Aplicação encerrando...")
 
 
 app = FastAPI(title=settings.dbname, lifespan=lifespan)
 
+if settings.admission_enabled:
+    app.add_middleware(
+        AdmissionControlMiddleware,
+        controller=admission_controller,
+        retry_after=settings.admission_retry_after,
+    )
+
 graphql_app = CustomGraphQLRouter(schema, context_getter=get_context)
 app.include_router(graphql_app, prefix="/graphql")
+
+
+def require_metrics_token(
+    authorization: Optional[str] = Header(default=None),
+) -> None:
+    """Exige ``Authorization: Bearer <metrics_token>``.
+
+    Sem token configurado o endpoint nem existe: ele expõe URLs das
+    réplicas e o estado interno do serviço.
+    """
+    if not settings.metrics_token:
+        raise HTTPException(status_code=404)
+    expected = f"Bearer {settings.metrics_token}"
+    if not hmac.compare_digest(
+        (authorization or "").encode(), expected.encode()
+    ):
+        raise HTTPException(
+            status_code=401, headers={"WWW-Authenticate": "Bearer"}
+        )
+
+
+@app.get("/metrics", dependencies=[Depends(require_metrics_token)])
+async def metrics():
+    return {
+        "redis": redis_manager.metrics(),
+        "admission": admission_controller.metrics(),
+        "dataloaders": loader_metrics.metrics(),
+        "replicas": replica_router.metrics(),
+        "user_cache": user_cache.metrics(),
+        "analytics": activity_buffer.metrics(),
+    }
@@ -1,18 +1,30 @@
 from datetime import datetime
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlalchemy import DateTime
+from sqlalchemy import DDL, DateTime, event
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func, text
 
+from app.core.settings import settings
+from app.models.base_model import Base
+from app.utils.ids import UUID7_FUNCTION, new_id
+
+# create_all (testes) precisa da função antes das tabelas; em produção
+# quem cria é a migration
+event.listen(Base.metadata, "before_create", DDL(UUID7_FUNCTION))
+
 
 class IDMixin:
     id: Mapped[UUID] = mapped_column(
         PG_UUID(as_uuid=True),
         primary_key=True,
-        default=uuid4,
-        server_default=text("gen_random_uuid()"),
+        default=new_id,
+        server_default=text(
+            "uuid_generate_v7()"
+            if settings.id_uuid_version == 7
+            else "gen_random_uuid()"
+        ),
     )
 
 
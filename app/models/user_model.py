@@ -1,4 +1,15 @@
-from sqlalchemy import Boolean, String, Text, text
+from sqlalchemy import (
+    DDL,
+    Boolean,
+    CheckConstraint,
+    Index,
+    String,
+    Text,
+    event,
+    func,
+    literal_column,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models import Base, IDMixin, TimestampMixin
@@ -6,15 +17,78 @@ from app.models import Base, IDMixin, TimestampMixin
 
 class UserModel(Base, IDMixin, TimestampMixin):
     __tablename__ = "users"
+    __table_args__ = (
+        # Keyset da listagem: (created_at, id) é único e estável
+        Index("ix_users_created_at_id", "created_at", "id"),
+        # Teto em bytes para a linha de ux_users_lower_email_login caber
+        # no limite do btree (2704 bytes) mesmo com texto multibyte: com
+        # name (1024) e username (256) já limitados pelo varchar, sobram
+        # email, lower(email) (até 1,5x) e o hash. 254 é o que o
+        # email-validator já aceita
+        CheckConstraint(
+            "octet_length(email) <= 254", name="ck_users_email_octets"
+        ),
+        CheckConstraint(
+            "octet_length(hashed_password) <= 512",
+            name="ck_users_hashed_password_octets",
+        ),
+    )
 
     name: Mapped[str] = mapped_column(String(256), nullable=False)
-    username: Mapped[str] = mapped_column(
-        String(64), nullable=False, index=True, unique=True
-    )
-    email: Mapped[str] = mapped_column(
-        String(256), nullable=False, index=True, unique=True
+    # Unicidade e busca sem caixa ficam nos índices lower() abaixo
+    username: Mapped[str] = mapped_column(String(64), nullable=False)
+    email: Mapped[str] = mapped_column(String(256), nullable=False)
+    # Fora dos SELECTs por padrão; só quem verifica senha pede a coluna
+    hashed_password: Mapped[str] = mapped_column(
+        Text, nullable=False, deferred=True, deferred_raiseload=True
     )
-    hashed_password: Mapped[str] = mapped_column(Text, nullable=False)
     is_master: Mapped[bool] = mapped_column(
         Boolean, nullable=False, default=False, server_default=text("false")
     )
+
+
+# As consultas comparam ``lower(coluna) = lower(:valor)``; só a mesma
+# expressão no índice permite index scan em vez de varrer a tabela
+Index("ux_users_lower_username", func.lower(UserModel.username), unique=True)
+# Cobre o login inteiro: a busca usa a chave e o resto vem do INCLUDE,
+# então o plano é Index Only Scan (ver ``UserRepository._LOGIN_COLUMNS``)
+Index(
+    "ux_users_lower_email_login",
+    func.lower(UserModel.email),
+    unique=True,
+    postgresql_include=[
+        "id",
+        "name",
+        "username",
+        "email",
+        "is_master",
+        "hashed_password",
+    ],
+)
+
+# Documento da busca por trechos: mesma expressão no índice e nas
+# consultas, senão o planner não casa uma com a outra. O separador vai
+# literal no SQL; como bind param viraria ``$n`` e não bateria no índice
+_SEPARATOR = literal_column("' '", String)
+USER_SEARCH_DOCUMENT = (
+    UserModel.name
+    + _SEPARATOR
+    + UserModel.username
+    + _SEPARATOR
+    + UserModel.email
+)
+# GIN de trigramas: ``ILIKE '%termo%'`` vira busca de trigramas no índice
+# (ver ``UserReadRepository.search``)
+Index(
+    "ix_users_search_trgm",
+    USER_SEARCH_DOCUMENT.label("search_document"),
+    postgresql_using="gin",
+    postgresql_ops={"search_document": "gin_trgm_ops"},
+)
+# create_all (testes) precisa do pg_trgm antes do índice; em produção
+# quem cria é a migration
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"),
+)
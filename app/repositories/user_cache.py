@@ -0,0 +1,176 @@
+import asyncio
+import json
+import math
+import random
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional
+from uuid import UUID
+
+from redis.asyncio import Redis
+
+from app.core.redis import REDIS_UNAVAILABLE_ERRORS
+from app.core.redis_cache import LocalTTLCache
+from app.core.settings import settings
+from app.schemas.user_schema import UserRead
+
+
+def user_version_key(user_id: UUID) -> str:
+    """Contador incrementado a cada escrita no usuário."""
+    return f"user_version:{user_id}"
+
+
+@dataclass
+class UserCacheStats:
+    local_hits: int = 0
+    hits: int = 0
+    misses: int = 0
+    early_refreshes: int = 0
+    version_misses: int = 0
+    invalidations: int = 0
+    errors: int = 0
+    served_age_total: float = 0.0
+    served_age_max: float = 0.0
+
+    def served(self, age: float) -> None:
+        self.served_age_total += age
+        self.served_age_max = max(self.served_age_max, age)
+
+
+user_cache_stats = UserCacheStats()
+
+# Um L1 por processo; entradas vivem ``user_cache_local_ttl_seconds``
+_local = LocalTTLCache(settings.user_cache_local_size)
+
+
+class UserCache:
+    """Cache read-through de ``UserRead`` no Redis, com L1 local.
+
+    Cada registro guarda a versão do usuário (``user_version:{id}``, que
+    toda escrita incrementa). Uma leitura traz registro e versão atual no
+    mesmo ``MGET``; versão diferente é miss. Assim, um preenchimento que
+    leu a linha antes de uma escrita e gravou depois fica inválido sozinho.
+
+    Contra estouros quando uma chave quente expira, cada leitura pode
+    renovar antes do prazo (XFetch): a chance cresce perto de expirar e com
+    o tempo que a carga levou, então quase sempre só um leitor recarrega.
+    O L1 não consulta a versão: serve no máximo ``local_ttl`` de atraso
+    entre processos, o que aparece em ``served_age_*`` nas métricas.
+    """
+
+    def __init__(self, redis: Redis) -> None:
+        self.redis = redis
+        self.ttl = settings.user_cache_ttl_seconds
+        self.local_ttl = settings.user_cache_local_ttl_seconds
+        self.beta = settings.user_cache_early_refresh_beta
+
+    def _key(self, user_id: UUID) -> str:
+        return f"user_cache:{user_id}"
+
+    def _expired_early(self, record: Dict[str, Any], now: float) -> bool:
+        # 1 - random() fica em (0, 1]: log nunca recebe zero
+        jitter = record["delta"] * self.beta * math.log(1 - random.random())
+        return now - jitter >= record["expires_at"]
+
+    async def get_or_load(
+        self,
+        user_id: UUID,
+        load: Callable[[], Awaitable[Optional[UserRead]]],
+        store: bool = True,
+        local: bool = True,
+    ) -> Optional[UserRead]:
+        """Devolve o usuário do cache ou de ``load``, gravando o resultado.
+
+        ``store=False`` serve para leituras de réplica: podem estar
+        atrasadas e não devem ficar no cache com a versão atual.
+        ``local=False`` pula o L1 para quem precisa da versão conferida.
+        """
+        key = self._key(user_id)
+        entry = _local.get(key) if local else None
+        if entry is not None:
+            user, stored_at = entry
+            user_cache_stats.local_hits += 1
+            user_cache_stats.served(time.time() - stored_at)
+            return user
+
+        record, version = await self._read(user_id)
+        now = time.time()
+        if record is not None:
+            if record["version"] != version:
+                user_cache_stats.version_misses += 1
+            elif self._expired_early(record, now):
+                user_cache_stats.early_refreshes += 1
+            else:
+                user_cache_stats.hits += 1
+                user_cache_stats.served(now - record["stored_at"])
+                user = UserRead.model_validate(record["user"])
+                _local.set(key, (user, record["stored_at"]), self.local_ttl)
+                return user
+        else:
+            user_cache_stats.misses += 1
+
+        start = time.perf_counter()
+        user = await load()
+        delta = time.perf_counter() - start
+        if user is not None and store and version is not None:
+            await self._write(user_id, user, version, delta)
+        return user
+
+    async def _read(self, user_id: UUID):
+        try:
+            async with asyncio.timeout(settings.redis_command_timeout):
+                raw, version = await self.redis.mget(
+                    self._key(user_id), user_version_key(user_id)
+                )
+        except REDIS_UNAVAILABLE_ERRORS:
+            user_cache_stats.errors += 1
+            return None, None
+        record = json.loads(raw) if raw else None
+        return record, int(version) if version else 0
+
+    async def _write(
+        self, user_id: UUID, user: UserRead, version: int, delta: float
+    ) -> None:
+        now = time.time()
+        record = {
+            "user": user.model_dump(mode="json"),
+            "version": version,
+            "delta": delta,
+            "stored_at": now,
+            "expires_at": now + self.ttl,
+        }
+        try:
+            async with asyncio.timeout(settings.redis_command_timeout):
+                await self.redis.set(
+                    self._key(user_id), json.dumps(record), ex=self.ttl
+                )
+        except REDIS_UNAVAILABLE_ERRORS:
+            user_cache_stats.errors += 1
+            return
+        _local.set(self._key(user_id), (user, now), self.local_ttl)
+
+    async def invalidate(self, user_id: UUID) -> None:
+        """Chamado depois de toda escrita no usuário já confirmada."""
+        key = self._key(user_id)
+        _local.delete(key)
+        user_cache_stats.invalidations += 1
+        try:
+            async with asyncio.timeout(settings.redis_command_timeout):
+                await self.redis.delete(key)
+        except REDIS_UNAVAILABLE_ERRORS:
+            # A versão incrementada já torna o registro inválido
+            user_cache_stats.errors += 1
+
+
+def metrics() -> Dict[str, Any]:
+    stats = asdict(user_cache_stats)
+    served = stats["local_hits"] + stats["hits"]
+    lookups = served + stats["misses"] + stats["version_misses"]
+    lookups += stats["early_refreshes"]
+    total_age = stats.pop("served_age_total")
+    return {
+        **stats,
+        "local_size": len(_local),
+        "hit_rate": served / lookups if lookups else 0.0,
+        "served_age_avg": total_age / served if served else 0.0,
+    }
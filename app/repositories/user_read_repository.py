@@ -0,0 +1,186 @@
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import (
+    Float,
+    Integer,
+    Row,
+    String,
+    any_,
+    bindparam,
+    column,
+    func,
+    select,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.user_model import USER_SEARCH_DOCUMENT, UserModel
+
+_users = UserModel.__table__
+
+# Linha pública do usuário: tudo menos o hash da senha
+_COLUMNS = (
+    _users.c.id,
+    _users.c.name,
+    _users.c.username,
+    _users.c.email,
+    _users.c.is_master,
+    _users.c.created_at,
+)
+
+# Montados uma vez no import: a chave de cache do compilador sai igual a
+# cada chamada e nenhum ``select()`` é reconstruído por requisição
+_BY_ID = select(*_COLUMNS).where(
+    _users.c.id == bindparam("id", type_=_users.c.id.type)
+)
+# Email sem caixa, pela mesma expressão do índice ux_users_lower_email_login
+_BY_EMAIL = select(*_COLUMNS).where(
+    func.lower(_users.c.email)
+    == func.lower(bindparam("email", type_=_users.c.email.type))
+)
+_BY_IDS = select(*_COLUMNS).where(
+    _users.c.id == any_(bindparam("ids", type_=ARRAY(_users.c.id.type)))
+)
+# Cada email pedido vira uma linha de ``k``, casada por lower() no SQL,
+# como no índice: Python e Postgres discordam da caixa fora do ASCII.
+# ``key`` volta na linha para o loader parear sem recalcular nada
+_EMAIL_KEYS = (
+    func.unnest(bindparam("emails", type_=ARRAY(_users.c.email.type)))
+    .table_valued(column("key", _users.c.email.type))
+    .render_derived(name="k")
+)
+_BY_EMAILS = select(*_COLUMNS, _EMAIL_KEYS.c.key).join_from(
+    _users,
+    _EMAIL_KEYS,
+    func.lower(_users.c.email) == func.lower(_EMAIL_KEYS.c.key),
+)
+
+
+def _page(descending: bool, keyset: bool):
+    key = tuple_(_users.c.created_at, _users.c.id)
+    stmt = select(*_COLUMNS).limit(bindparam("limit", type_=Integer))
+    if descending:
+        stmt = stmt.order_by(_users.c.created_at.desc(), _users.c.id.desc())
+    else:
+        stmt = stmt.order_by(_users.c.created_at, _users.c.id)
+    if keyset:
+        after = tuple_(
+            bindparam("after_created_at", type_=_users.c.created_at.type),
+            bindparam("after_id", type_=_users.c.id.type),
+        )
+        stmt = stmt.where(key < after if descending else key > after)
+    return stmt
+
+
+_PAGES = {
+    (descending, keyset): _page(descending, keyset)
+    for descending in (False, True)
+    for keyset in (False, True)
+}
+
+
+# Quão bem o termo casa com algum trecho do documento, de 0 a 1
+_SCORE = func.word_similarity(
+    bindparam("term", type_=String), USER_SEARCH_DOCUMENT, type_=Float
+)
+
+
+def _search(keyset: bool):
+    # O filtro é o ILIKE, que o índice de trigramas atende; o score só
+    # ordena o que o índice devolveu
+    stmt = (
+        select(*_COLUMNS, _SCORE.label("score"))
+        .where(USER_SEARCH_DOCUMENT.ilike(bindparam("pattern", type_=String)))
+        .order_by(_SCORE.desc(), _users.c.id.desc())
+        .limit(bindparam("limit", type_=Integer))
+    )
+    if keyset:
+        after = tuple_(
+            bindparam("after_score", type_=Float),
+            bindparam("after_id", type_=_users.c.id.type),
+        )
+        stmt = stmt.where(tuple_(_SCORE, _users.c.id) < after)
+    return stmt
+
+
+_SEARCHES = {keyset: _search(keyset) for keyset in (False, True)}
+
+
+def _like_pattern(term: str) -> str:
+    escaped = (
+        term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    )
+    return f"%{escaped}%"
+
+
+class UserReadRepository:
+    """Leituras quentes de usuário em Core, sem passar pelo ORM.
+
+    Devolve ``Row`` (tupla com acesso por atributo) em vez de
+    ``UserModel``: sem identity map, sem instrumentação de atributos e sem
+    objeto intermediário antes do ``UserRead``/``UserType``. Só leitura;
+    quem precisa alterar ou verificar senha usa o ``UserRepository``.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def _all(self, stmt, params: dict) -> List[Row]:
+        # Conexão da própria sessão: mesma transação, sem o pipeline ORM
+        connection = await self.session.connection()
+        result = await connection.execute(stmt, params)
+        return list(result)
+
+    async def _one(self, stmt, params: dict) -> Optional[Row]:
+        connection = await self.session.connection()
+        result = await connection.execute(stmt, params)
+        return result.one_or_none()
+
+    async def get_by_id(self, user_id: UUID) -> Optional[Row]:
+        return await self._one(_BY_ID, {"id": user_id})
+
+    async def get_by_email(self, email: str) -> Optional[Row]:
+        return await self._one(_BY_EMAIL, {"email": email})
+
+    async def get_by_ids(self, user_ids: Sequence[UUID]) -> List[Row]:
+        return await self._all(_BY_IDS, {"ids": list(user_ids)})
+
+    async def get_by_emails(self, emails: Sequence[str]) -> List[Row]:
+        """Usuários dos ``emails``, sem caixa; ``row.key`` é o pedido."""
+        return await self._all(_BY_EMAILS, {"emails": list(emails)})
+
+    async def get_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        descending: bool = False,
+    ) -> List[Row]:
+        """Página por keyset em ``(created_at, id)``, como no ORM."""
+        params = {"limit": limit}
+        if after is not None:
+            params["after_created_at"], params["after_id"] = after
+        return await self._all(_PAGES[(descending, after is not None)], params)
+
+    async def search(
+        self,
+        term: str,
+        limit: int,
+        after: Optional[Tuple[float, UUID]] = None,
+    ) -> List[Row]:
+        """Usuários cujo nome, username ou email contém ``term``.
+
+        Ordena por ``word_similarity`` (desc) e pagina por keyset em
+        ``(score, id)``. Termos com menos de três caracteres não geram
+        trigramas e fariam o índice ser lido inteiro: quem chama barra.
+        """
+        params = {
+            "term": term,
+            "pattern": _like_pattern(term),
+            "limit": limit,
+        }
+        if after is not None:
+            params["after_score"], params["after_id"] = after
+        return await self._all(_SEARCHES[after is not None], params)
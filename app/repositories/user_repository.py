@@ -1,27 +1,209 @@
+from datetime import datetime
+from functools import lru_cache
+from typing import Collection, FrozenSet, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import (
+    Row,
+    bindparam,
+    false,
+    func,
+    or_,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, undefer
 
 from app.models.user_model import UserModel
 
+# Colunas que uma projeção pode pedir; a senha nunca entra por aqui
+PROJECTABLE = frozenset(
+    name
+    for name in UserModel.__table__.columns.keys()
+    if name != "hashed_password"
+)
+
+# Statements quentes são montados uma vez por formato e reaproveitados:
+# os valores entram por ``bindparam``, então a chave de cache do SQL
+# compilado (e o prepared statement do asyncpg) é a mesma a cada chamada.
+# Os formatos são finitos (colunas, filtros), o que limita os caches.
+
+
+# username e email comparam sem caixa, casando com os índices lower()
+CASE_INSENSITIVE = frozenset({"username", "email"})
+
+
+def _equals(key: str):
+    column = getattr(UserModel, key)
+    if key in CASE_INSENSITIVE:
+        # Tipado: EXPLAIN com literal_binds precisa saber renderizar o valor
+        return func.lower(column) == func.lower(
+            bindparam(key, type_=column.type)
+        )
+    return column == bindparam(key)
+
+
+@lru_cache(maxsize=None)
+def _select_user(
+    key: str, columns: Optional[FrozenSet[str]], with_password: bool
+):
+    """``SELECT`` de um usuário por ``key`` com a projeção pedida.
+
+    ``hashed_password`` é deferred com raiseload no modelo: quem não
+    passa ``with_password`` nem lê a coluna nem pode acessá-la.
+    """
+    stmt = select(UserModel).where(_equals(key))
+    if columns:
+        stmt = stmt.options(
+            load_only(
+                *(getattr(UserModel, name) for name in sorted(columns)),
+                raiseload=True,
+            )
+        )
+    if with_password:
+        stmt = stmt.options(undefer(UserModel.hashed_password))
+    return stmt
+
+
+@lru_cache(maxsize=None)
+def _exists_by(keys: Tuple[str, ...]):
+    return select(
+        select(UserModel.id).where(*(_equals(key) for key in keys)).exists()
+    )
+
+
+@lru_cache(maxsize=None)
+def _find_conflicts(by_username: bool, by_email: bool, excluding: bool):
+    columns = [("username", by_username), ("email", by_email)]
+    stmt = select(
+        *(
+            func.coalesce(func.bool_or(_equals(key)), false())
+            if enabled
+            else false()
+            for key, enabled in columns
+        )
+    ).where(or_(*(_equals(key) for key, enabled in columns if enabled)))
+    if excluding:
+        stmt = stmt.where(UserModel.id != bindparam("exclude_id"))
+    return stmt
+
+
+# Tudo que o login lê está no índice ux_users_lower_email_login (chave
+# lower(email), demais colunas em INCLUDE): o plano é um Index Only Scan,
+# sem ir ao heap. Coluna nova aqui precisa entrar no INCLUDE também.
+_LOGIN_COLUMNS = (
+    UserModel.id,
+    UserModel.name,
+    UserModel.username,
+    UserModel.email,
+    UserModel.is_master,
+    UserModel.hashed_password,
+)
+_LOGIN_BY_EMAIL = select(*_LOGIN_COLUMNS).where(_equals("email"))
+
 
 class UserRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    async def get_by_id(self, user_id: UUID) -> UserModel | None:
-        result = await self.session.execute(
-            select(UserModel).filter_by(id=user_id)
-        )
+    def _projection(
+        self, columns: Optional[Collection[str]]
+    ) -> Optional[FrozenSet[str]]:
+        if not columns:
+            return None
+        return frozenset({"id", *columns} & PROJECTABLE)
+
+    async def get_by_id(
+        self,
+        user_id: UUID,
+        columns: Optional[Collection[str]] = None,
+        with_password: bool = False,
+    ) -> UserModel | None:
+        stmt = _select_user("id", self._projection(columns), with_password)
+        result = await self.session.execute(stmt, {"id": user_id})
         return result.scalar_one_or_none()
 
-    async def get_by_email(self, email: str) -> UserModel | None:
-        result = await self.session.execute(
-            select(UserModel).filter_by(email=email)
+    async def get_by_email(
+        self,
+        email: str,
+        columns: Optional[Collection[str]] = None,
+        with_password: bool = False,
+    ) -> UserModel | None:
+        stmt = _select_user("email", self._projection(columns), with_password)
+        result = await self.session.execute(stmt, {"email": email})
+        return result.scalar_one_or_none()
+
+    async def get_login_by_email(self, email: str) -> Optional[Row]:
+        """Só as colunas do login, servidas direto do índice de cobertura."""
+        result = await self.session.execute(_LOGIN_BY_EMAIL, {"email": email})
+        return result.one_or_none()
+
+    async def exists_by(self, **filters) -> bool:
+        stmt = _exists_by(tuple(sorted(filters)))
+        result = await self.session.execute(stmt, filters)
+        return bool(result.scalar())
+
+    async def find_conflicts(
+        self,
+        username: Optional[str] = None,
+        email: Optional[str] = None,
+        exclude_id: Optional[UUID] = None,
+    ) -> Tuple[bool, bool]:
+        """``(username_em_uso, email_em_uso)`` numa só ida aos índices."""
+        if not (username or email):
+            return False, False
+
+        stmt = _find_conflicts(
+            bool(username), bool(email), exclude_id is not None
         )
+        params = {
+            "username": username,
+            "email": email,
+            "exclude_id": exclude_id,
+        }
+        params = {key: value for key, value in params.items() if value}
+        username_taken, email_taken = (
+            await self.session.execute(stmt, params)
+        ).one()
+        return bool(username_taken), bool(email_taken)
+
+    async def insert_if_absent(self, **values) -> UserModel | None:
+        """INSERT que devolve ``None`` em vez de violar um índice único."""
+        stmt = (
+            insert(UserModel)
+            .values(**values)
+            .on_conflict_do_nothing()
+            .returning(UserModel)
+        )
+        result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def update_if_absent(
+        self, user_id: UUID, **values
+    ) -> UserModel | None:
+        """UPDATE que devolve ``None`` se outro usuário tomou o valor.
+
+        O Postgres não tem ``ON CONFLICT`` para UPDATE; o savepoint isola
+        a corrida rara entre a checagem e a escrita sem abortar a transação.
+        """
+        stmt = (
+            update(UserModel)
+            .where(UserModel.id == user_id)
+            .values(**values)
+            .returning(UserModel)
+            .execution_options(populate_existing=True)
+        )
+        try:
+            async with self.session.begin_nested():
+                result = await self.session.execute(stmt)
+                return result.scalar_one_or_none()
+        except IntegrityError:
+            return None
+
     async def add(self, user: UserModel) -> None:
         self.session.add(user)
 
@@ -30,3 +212,64 @@ class UserRepository:
 
     async def refresh(self, user: UserModel) -> None:
         await self.session.refresh(user)
+
+    async def get_password_batch(
+        self, after_id: Optional[UUID], limit: int
+    ) -> List[Tuple[UUID, str]]:
+        """Página de ``(id, hashed_password)`` por keyset em ``id``."""
+        stmt = (
+            select(UserModel.id, UserModel.hashed_password)
+            .order_by(UserModel.id)
+            .limit(limit)
+        )
+        if after_id is not None:
+            stmt = stmt.where(UserModel.id > after_id)
+
+        result = await self.session.execute(stmt)
+        return [(row.id, row.hashed_password) for row in result]
+
+    async def replace_hashed_password(
+        self, user_id: UUID, old_hash: str, new_hash: str
+    ) -> bool:
+        """Troca o hash só se ele não mudou desde a leitura."""
+        result = await self.session.execute(
+            update(UserModel)
+            .where(
+                UserModel.id == user_id,
+                UserModel.hashed_password == old_hash,
+            )
+            .values(hashed_password=new_hash)
+        )
+        return result.rowcount == 1
+
+    async def get_identity_batch(
+        self,
+        after_id: Optional[UUID],
+        limit: int,
+        updated_since: Optional[datetime] = None,
+    ) -> List[Tuple[UUID, str, str]]:
+        """Página de ``(id, username, email)`` por keyset em ``id``."""
+        stmt = (
+            select(UserModel.id, UserModel.username, UserModel.email)
+            .order_by(UserModel.id)
+            .limit(limit)
+        )
+        if after_id is not None:
+            stmt = stmt.where(UserModel.id > after_id)
+        if updated_since is not None:
+            stmt = stmt.where(UserModel.updated_at >= updated_since)
+
+        result = await self.session.execute(stmt)
+        return [(row.id, row.username, row.email) for row in result]
+
+    async def estimate_count(self) -> int:
+        """Total aproximado pelas estatísticas do planner, sem COUNT(*)."""
+        result = await self.session.execute(
+            text(
+                "SELECT reltuples::bigint FROM pg_class "
+                "WHERE oid = to_regclass(:table)"
+            ),
+            {"table": UserModel.__tablename__},
+        )
+        # reltuples é -1 numa tabela que nunca passou por ANALYZE
+        return max(result.scalar() or 0, 0)
@@ -0,0 +1,9 @@
+from .base_schema import AppBaseModel
+
+
+class ActiveUsersRead(AppBaseModel):
+    daily_active_users: int
+    weekly_active_users: int
+    monthly_active_users: int
+    daily_active_users_exact: int
+    concurrent_sessions: int
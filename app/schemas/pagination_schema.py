@@ -0,0 +1,8 @@
+from typing import Optional
+
+from .base_schema import AppBaseModel
+
+
+class PageInfoRead(AppBaseModel):
+    has_next_page: bool
+    end_cursor: Optional[str] = None
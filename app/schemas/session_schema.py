@@ -0,0 +1,13 @@
+from typing import Optional
+
+from app.schemas.user_schema import UserRead
+
+from .base_schema import AppBaseModel
+
+
+class SessionRead(AppBaseModel):
+    user: UserRead
+    version: int = 0
+    analytics_offset: Optional[int] = None
+    # LSN do primário após a última escrita desta sessão
+    write_lsn: Optional[int] = None
@@ -1,11 +1,16 @@
-from typing import Optional
+from enum import Enum
+from typing import List, Optional
 from uuid import UUID
 
 from pydantic import EmailStr, Field, field_validator, model_validator
 
-from app.utils.validators import validate_password_strength
+from app.utils.validators import (
+    validate_password_not_breached,
+    validate_password_strength,
+)
 
 from .base_schema import AppBaseModel
+from .pagination_schema import PageInfoRead
 
 
 class PasswordValidatedModel(AppBaseModel):
@@ -22,6 +27,11 @@ class UserCreate(PasswordValidatedModel):
     username: str = Field(..., min_length=3, max_length=64)
     email: EmailStr = Field(..., max_length=256)
 
+    @field_validator("password", mode="after")
+    @classmethod
+    def validate_password_not_breached(cls, password: str) -> str:
+        return validate_password_not_breached(password)
+
 
 class UserUpdate(PasswordValidatedModel):
     name: Optional[str] = Field(None, min_length=5, max_length=256)
@@ -46,7 +56,9 @@ class UserChangePassword(AppBaseModel):
     @field_validator("new_password", mode="after")
     @classmethod
     def validate_password(cls, password: str) -> str:
-        return validate_password_strength(password)
+        return validate_password_not_breached(
+            validate_password_strength(password)
+        )
 
     @model_validator(mode="after")
     def check_passwords_equals(cls, values):
@@ -63,9 +75,41 @@ class UserDelete(AppBaseModel):
     password: str = Field(..., min_length=8)
 
 
+class UserAvailabilityRead(AppBaseModel):
+    username: Optional[bool] = None
+    email: Optional[bool] = None
+
+
 class UserRead(AppBaseModel):
     id: UUID
     name: str
     username: str
     email: EmailStr
     is_master: bool
+
+
+class UserOrderBy(str, Enum):
+    CREATED_AT_ASC = "CREATED_AT_ASC"
+    CREATED_AT_DESC = "CREATED_AT_DESC"
+
+
+class UserEdgeRead(AppBaseModel):
+    cursor: str
+    node: UserRead
+
+
+class UserConnectionRead(AppBaseModel):
+    edges: List[UserEdgeRead]
+    page_info: PageInfoRead
+    total_count_estimate: int
+
+
+class UserSearchEdgeRead(AppBaseModel):
+    cursor: str
+    node: UserRead
+    score: float
+
+
+class UserSearchConnectionRead(AppBaseModel):
+    edges: List[UserSearchEdgeRead]
+    page_info: PageInfoRead
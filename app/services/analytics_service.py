@@ -0,0 +1,180 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional
+from uuid import UUID
+
+from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
+
+from app.core.settings import settings
+from app.schemas.analytics_schema import ActiveUsersRead
+
+logger = logging.getLogger(__name__)
+
+_ASSIGN_OFFSET = """
+local offset = redis.call('HGET', KEYS[1], ARGV[1])
+if offset then
+    return tonumber(offset)
+end
+offset = redis.call('INCR', KEYS[2]) - 1
+redis.call('HSET', KEYS[1], ARGV[1], offset)
+return offset
+"""
+
+
+class AnalyticsService:
+    """Usuários ativos em HyperLogLog e bitmaps diários, sem SCAN.
+
+    Cada usuário recebe um offset denso e fixo para os bitmaps; ele é
+    atribuído no login e guardado na sessão.
+    """
+
+    RETENTION = 35 * 24 * 60 * 60  # cobre a janela de MAU
+    OFFSETS_KEY = "analytics:user_offsets"
+    OFFSETS_COUNTER_KEY = "analytics:user_offsets:next"
+
+    def __init__(self, redis: Redis) -> None:
+        self.redis = redis
+        self._assign_offset = redis.register_script(_ASSIGN_OFFSET)
+
+    def _key_for_users(self, day: datetime) -> str:
+        return f"analytics:users:{day:%Y%m%d}"
+
+    def _key_for_users_bitmap(self, day: datetime) -> str:
+        return f"analytics:users_bitmap:{day:%Y%m%d}"
+
+    def _key_for_sessions(self, minute: datetime) -> str:
+        return f"analytics:sessions:{minute:%Y%m%d%H%M}"
+
+    async def assign_offset(self, user_id: UUID) -> int:
+        return int(
+            await self._assign_offset(
+                keys=[self.OFFSETS_KEY, self.OFFSETS_COUNTER_KEY],
+                args=[str(user_id)],
+            )
+        )
+
+    def track_activity(
+        self, session_id: UUID, user_id: UUID, offset: Optional[int] = None
+    ) -> None:
+        """Registra atividade sem esperar o Redis (fire-and-forget)."""
+        now = datetime.now(timezone.utc)
+        users_key = self._key_for_users(now)
+        sessions_key = self._key_for_sessions(now)
+        bitmap_key = self._key_for_users_bitmap(now)
+        sessions_ttl = settings.analytics_concurrency_window_minutes * 60
+
+        def write(pipe: Pipeline) -> None:
+            pipe.pfadd(users_key, str(user_id))
+            pipe.expire(users_key, self.RETENTION)
+            pipe.pfadd(sessions_key, str(session_id))
+            pipe.expire(sessions_key, sessions_ttl)
+            if offset is not None:
+                pipe.setbit(bitmap_key, offset, 1)
+                pipe.expire(bitmap_key, self.RETENTION)
+
+        activity_buffer.add(self.redis, write)
+
+    async def get_active_users(self) -> ActiveUsersRead:
+        now = datetime.now(timezone.utc)
+        days = [now - timedelta(days=i) for i in range(30)]
+        minutes = [
+            now - timedelta(minutes=i)
+            for i in range(settings.analytics_concurrency_window_minutes)
+        ]
+
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.pfcount(self._key_for_users(now))
+        pipe.pfcount(*(self._key_for_users(day) for day in days[:7]))
+        pipe.pfcount(*(self._key_for_users(day) for day in days))
+        pipe.bitcount(self._key_for_users_bitmap(now))
+        pipe.pfcount(*(self._key_for_sessions(minute) for minute in minutes))
+        dau, wau, mau, dau_exact, sessions = await pipe.execute()
+
+        return ActiveUsersRead(
+            daily_active_users=dau,
+            weekly_active_users=wau,
+            monthly_active_users=mau,
+            daily_active_users_exact=dau_exact,
+            concurrent_sessions=sessions,
+        )
+
+
+class ActivityBuffer:
+    """Fila das escritas de atividade, enviadas em lote num pipeline só.
+
+    Um único flush roda por vez: uma rajada de logins ocupa uma conexão do
+    pool em vez de uma por evento. Escritas que não couberem na fila ou cujo
+    pipeline falhar são descartadas e contadas em ``dropped_total``.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._pending: Dict[Redis, List[Callable[[Pipeline], None]]] = {}
+        self._size = 0
+        self._task: Optional[asyncio.Task] = None
+
+        self.written_total = 0
+        self.dropped_total = 0
+
+    def add(self, redis: Redis, write: Callable[[Pipeline], None]) -> None:
+        if self._size >= self.max_size:
+            self.dropped_total += 1
+            return
+
+        self._pending.setdefault(redis, []).append(write)
+        self._size += 1
+        if self._running() is None:
+            self._task = asyncio.create_task(self._drain())
+
+    async def flush(self) -> None:
+        """Espera a fila esvaziar; cada lote é limitado pelo timeout."""
+        task = self._running()
+        if task is not None:
+            await task
+        await self._drain()
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "pending": self._size,
+            "written_total": self.written_total,
+            "dropped_total": self.dropped_total,
+        }
+
+    def _running(self) -> Optional[asyncio.Task]:
+        # Tarefa de outro event loop (testes, reinício) não drena mais nada
+        task = self._task
+        if (
+            task is None
+            or task.done()
+            or task.get_loop() is not asyncio.get_running_loop()
+        ):
+            return None
+        return task
+
+    async def _drain(self) -> None:
+        while self._pending:
+            pending, self._pending = self._pending, {}
+            for redis, writes in pending.items():
+                self._size -= len(writes)
+                await self._send(redis, writes)
+
+    async def _send(
+        self, redis: Redis, writes: List[Callable[[Pipeline], None]]
+    ) -> None:
+        pipe = redis.pipeline(transaction=False)
+        for write in writes:
+            write(pipe)
+        try:
+            async with asyncio.timeout(settings.redis_command_timeout):
+                await pipe.execute()
+        except Exception:
+            # Métrica perdida não pode derrubar a autenticação
+            self.dropped_total += len(writes)
+            logger.warning("%d escritas de atividade descartadas", len(writes))
+        else:
+            self.written_total += len(writes)
+
+
+activity_buffer = ActivityBuffer(settings.analytics_buffer_max_size)
@@ -0,0 +1,170 @@
+import asyncio
+import hashlib
+import math
+import struct
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, List, Optional
+
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.redis import REDIS_UNAVAILABLE_ERRORS
+from app.core.settings import settings
+from app.repositories.user_repository import UserRepository
+from app.schemas.user_schema import UserAvailabilityRead
+
+# Só marca bits se o filtro existir: um filtro recriado pela metade
+# responderia "livre" para nomes que já estão no banco
+_ADD = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+for i = 1, #ARGV do
+    redis.call('SETBIT', KEYS[1], ARGV[i], 1)
+end
+return 1
+"""
+
+
+class AvailabilityService:
+    """Disponibilidade de username/email via Bloom filter num bitmap Redis.
+
+    Bit zerado significa "com certeza livre" e dispensa o banco; só um
+    possível acerto vai ao índice único. Remoções não apagam bits (Bloom
+    não permite): viram falsos positivos até o próximo ``rebuild``.
+    """
+
+    REBUILD_OVERLAP = timedelta(minutes=1)
+
+    def __init__(self, session: AsyncSession, redis: Redis) -> None:
+        self.session = session
+        self.redis = redis
+        self.repository = UserRepository(session)
+        self.num_bits = settings.availability_filter_bits
+        self.num_hashes = settings.availability_filter_hashes
+        self._add = redis.register_script(_ADD)
+
+    @property
+    def filter_key(self) -> str:
+        # Mudar o tamanho muda a chave: o filtro antigo não serve mais
+        return f"availability:bloom:{self.num_bits}:{self.num_hashes}"
+
+    def _positions(self, kind: str, value: str) -> List[int]:
+        item = f"{kind}:{value.lower()}".encode()
+        digest = hashlib.blake2b(item, digest_size=16).digest()
+        h1, h2 = struct.unpack("<QQ", digest)
+        h2 |= 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def _item_positions(
+        self, username: Optional[str], email: Optional[str]
+    ) -> List[int]:
+        positions = []
+        if username:
+            positions += self._positions("username", username)
+        if email:
+            positions += self._positions("email", email)
+        return positions
+
+    async def add(
+        self, username: Optional[str] = None, email: Optional[str] = None
+    ) -> None:
+        """Marca valores como ocupados; chamado antes de gravar no banco."""
+        positions = self._item_positions(username, email)
+        if not positions:
+            return
+        try:
+            async with asyncio.timeout(settings.redis_command_timeout):
+                await self._add(keys=[self.filter_key], args=positions)
+        except REDIS_UNAVAILABLE_ERRORS:
+            # O createUser continua protegido pelo índice único
+            pass
+
+    async def might_exist(self, kind: str, value: str) -> bool:
+        """False só quando o filtro garante que o valor nunca foi usado."""
+        positions = self._positions(kind, value)
+        try:
+            async with asyncio.timeout(settings.redis_command_timeout):
+                pipe = self.redis.pipeline(transaction=False)
+                pipe.exists(self.filter_key)
+                for position in positions:
+                    pipe.getbit(self.filter_key, position)
+                exists, *bits = await pipe.execute()
+        except REDIS_UNAVAILABLE_ERRORS:
+            return True
+
+        return not exists or all(bits)
+
+    async def is_username_available(self, username: str) -> bool:
+        if not await self.might_exist("username", username):
+            return True
+        return not await self.repository.exists_by(username=username)
+
+    async def is_email_available(self, email: str) -> bool:
+        if not await self.might_exist("email", email):
+            return True
+        return not await self.repository.exists_by(email=email)
+
+    async def check(
+        self, username: Optional[str], email: Optional[str]
+    ) -> UserAvailabilityRead:
+        return UserAvailabilityRead(
+            username=(
+                await self.is_username_available(username)
+                if username is not None
+                else None
+            ),
+            email=(
+                await self.is_email_available(email)
+                if email is not None
+                else None
+            ),
+        )
+
+    async def rebuild(self, batch_size: int = 1000) -> int:
+        """Recria o filtro a partir do banco e troca a chave atomicamente.
+
+        Cadastros feitos durante a varredura vão para o filtro antigo e se
+        perderiam no ``RENAME``; por isso os alterados desde o início (com
+        folga para transações longas) são reaplicados no final.
+        """
+        started_at = datetime.now(timezone.utc)
+        bits = bytearray(math.ceil(self.num_bits / 8))
+
+        count = 0
+        async for rows in self._batches(batch_size):
+            count += len(rows)
+            self._set_bits(bits, rows)
+
+        tmp_key = f"{self.filter_key}:rebuild"
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.set(tmp_key, bytes(bits))
+        pipe.rename(tmp_key, self.filter_key)
+        await pipe.execute()
+
+        async for rows in self._batches(
+            batch_size, started_at - self.REBUILD_OVERLAP
+        ):
+            for _, username, email in rows:
+                await self.add(username, email)
+
+        return count
+
+    async def _batches(
+        self, batch_size: int, updated_since: Optional[datetime] = None
+    ):
+        after_id = None
+        while True:
+            rows = await self.repository.get_identity_batch(
+                after_id, batch_size, updated_since
+            )
+            if not rows:
+                return
+            yield rows
+            after_id = rows[-1][0]
+
+    def _set_bits(self, bits: bytearray, rows: Iterable) -> None:
+        # Bit 0 do Redis é o bit mais significativo do primeiro byte
+        for _, username, email in rows:
+            for position in self._item_positions(username, email):
+                bits[position >> 3] |= 0x80 >> (position & 7)
@@ -0,0 +1,174 @@
+import asyncio
+import hashlib
+import hmac
+import json
+from typing import Any, Awaitable, Callable, Dict, Optional, Type, TypeVar
+from uuid import uuid4
+
+from pydantic import BaseModel
+from redis.asyncio import Redis
+
+from app.core.redis import REDIS_UNAVAILABLE_ERRORS
+from app.core.settings import settings
+from app.exceptions import (
+    IdempotencyKeyInProgressError,
+    IdempotencyKeyReusedError,
+    InvalidIdempotencyKeyError,
+)
+
+ResultT = TypeVar("ResultT", bound=BaseModel)
+
+_RELEASE_LOCK = """
+local current = redis.call('GET', KEYS[1])
+if current and cjson.decode(current)['token'] == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class IdempotencyService:
+    """Guarda o resultado de mutations por ``Idempotency-Key`` no Redis.
+
+    A primeira execução reserva a chave com ``SET NX``; repetições recebem
+    o resultado salvo e duplicatas concorrentes esperam a primeira
+    terminar. Falhas liberam a chave para o cliente tentar de novo, e com
+    o Redis indisponível a mutation roda sem proteção.
+    """
+
+    MAX_KEY_LENGTH = 128
+    POLL_INTERVAL = 0.05
+    MAX_POLL_INTERVAL = 0.5
+
+    def __init__(self, redis: Redis) -> None:
+        self.redis = redis
+        self._release_lock = redis.register_script(_RELEASE_LOCK)
+
+    def _key_for_operation(self, operation: str, scope: str, key: str) -> str:
+        return f"idempotency:{operation}:{scope}:{key}"
+
+    def fingerprint(self, payload: Dict[str, Any]) -> str:
+        """Resume a entrada para detectar a mesma chave com outro conteúdo.
+
+        Senhas entram no resumo (senão trocar a senha nova repetiria o
+        resultado antigo), mas por HMAC com a chave do servidor: o valor
+        no Redis não serve para testar senhas sem ela.
+        """
+        encoded = json.dumps(payload, sort_keys=True, default=str)
+        return hmac.new(
+            settings.secret_key.encode(), encoded.encode(), hashlib.sha256
+        ).hexdigest()
+
+    async def run(
+        self,
+        operation: str,
+        scope: str,
+        key: Optional[str],
+        payload: Dict[str, Any],
+        result_type: Type[ResultT],
+        func: Callable[[], Awaitable[ResultT]],
+    ) -> ResultT:
+        if key is None:
+            return await func()
+        if not key or len(key) > self.MAX_KEY_LENGTH:
+            raise InvalidIdempotencyKeyError(self.MAX_KEY_LENGTH)
+
+        redis_key = self._key_for_operation(operation, scope, key)
+        fingerprint = self.fingerprint(payload)
+        token = uuid4().hex
+
+        while True:
+            try:
+                acquired = await self._reserve(redis_key, fingerprint, token)
+            except REDIS_UNAVAILABLE_ERRORS:
+                return await func()
+            if acquired:
+                break
+
+            stored = await self._wait(redis_key, fingerprint, result_type)
+            if stored is not None:
+                return stored
+
+        try:
+            result = await func()
+        except BaseException:
+            await self._release(redis_key, token)
+            raise
+
+        await self._store(redis_key, fingerprint, result)
+        return result
+
+    async def _reserve(
+        self, redis_key: str, fingerprint: str, token: str
+    ) -> bool:
+        pending = json.dumps(
+            {"state": "pending", "fingerprint": fingerprint, "token": token}
+        )
+        async with asyncio.timeout(settings.redis_command_timeout):
+            return bool(
+                await self.redis.set(
+                    redis_key,
+                    pending,
+                    nx=True,
+                    ex=settings.idempotency_lock_seconds,
+                )
+            )
+
+    async def _store(
+        self, redis_key: str, fingerprint: str, result: BaseModel
+    ) -> None:
+        done = json.dumps(
+            {
+                "state": "done",
+                "fingerprint": fingerprint,
+                "result": result.model_dump(mode="json"),
+            }
+        )
+        try:
+            async with asyncio.timeout(settings.redis_command_timeout):
+                await self.redis.set(
+                    redis_key, done, ex=settings.idempotency_ttl_seconds
+                )
+        except REDIS_UNAVAILABLE_ERRORS:
+            # A mutation já aconteceu; perder o registro só tira a proteção
+            pass
+
+    async def _release(self, redis_key: str, token: str) -> None:
+        try:
+            async with asyncio.timeout(settings.redis_command_timeout):
+                await self._release_lock(keys=[redis_key], args=[token])
+        except REDIS_UNAVAILABLE_ERRORS:
+            # A reserva expira sozinha em idempotency_lock_seconds
+            pass
+
+    async def _wait(
+        self, redis_key: str, fingerprint: str, result_type: Type[ResultT]
+    ) -> Optional[ResultT]:
+        """Espera a execução em andamento e devolve o resultado salvo.
+
+        ``None`` indica que a primeira execução falhou e liberou a chave.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.idempotency_wait_seconds
+        interval = self.POLL_INTERVAL
+
+        while True:
+            try:
+                async with asyncio.timeout(settings.redis_command_timeout):
+                    raw = await self.redis.get(redis_key)
+            except REDIS_UNAVAILABLE_ERRORS:
+                raise IdempotencyKeyInProgressError()
+
+            if raw is None:
+                return None
+
+            entry = json.loads(raw)
+            if entry["fingerprint"] != fingerprint:
+                raise IdempotencyKeyReusedError()
+            if entry["state"] == "done":
+                return result_type.model_validate(entry["result"])
+
+            if loop.time() + interval > deadline:
+                raise IdempotencyKeyInProgressError()
+            await asyncio.sleep(interval)
+            interval = min(interval * 2, self.MAX_POLL_INTERVAL)
@@ -0,0 +1,116 @@
+import asyncio
+import math
+import time
+from typing import List, Optional, Tuple
+from uuid import uuid4
+
+from redis.asyncio import Redis
+
+from app.core.redis import REDIS_UNAVAILABLE_ERRORS
+from app.core.settings import settings
+from app.exceptions import TooManyLoginAttemptsError
+
+
+class LoginThrottleService:
+    """Limita tentativas de login por email e por IP antes do bcrypt.
+
+    Cada tentativa entra numa janela deslizante (sorted set com o horário
+    em ms). Estourar o limite tranca a chave por um tempo que dobra a cada
+    novo bloqueio. A verificação custa um único round trip em pipeline.
+    """
+
+    LEVEL_TTL = 24 * 60 * 60  # por quanto tempo o nível de bloqueio dura
+
+    def __init__(self, redis: Redis) -> None:
+        self.redis = redis
+
+    def _key_for_attempts(self, scope: str, value: str) -> str:
+        return f"login_attempts:{scope}:{value}"
+
+    def _key_for_lock(self, scope: str, value: str) -> str:
+        return f"login_lock:{scope}:{value}"
+
+    def _key_for_level(self, scope: str, value: str) -> str:
+        return f"login_lock_level:{scope}:{value}"
+
+    def _scopes(
+        self, email: str, client_ip: Optional[str]
+    ) -> List[Tuple[str, str, int]]:
+        scopes = [
+            ("email", email.lower(), settings.login_max_attempts_per_email)
+        ]
+        if client_ip:
+            scopes.append(
+                ("ip", client_ip, settings.login_max_attempts_per_ip)
+            )
+        return scopes
+
+    async def check(self, email: str, client_ip: Optional[str]) -> None:
+        """Registra a tentativa e recusa se email ou IP estiver bloqueado.
+
+        Com o Redis indisponível o login segue sem limitação.
+        """
+        try:
+            async with asyncio.timeout(settings.redis_command_timeout):
+                retry_after_ms = await self._register(email, client_ip)
+        except REDIS_UNAVAILABLE_ERRORS:
+            return
+
+        if retry_after_ms > 0:
+            raise TooManyLoginAttemptsError(math.ceil(retry_after_ms / 1000))
+
+    async def reset(self, email: str) -> None:
+        value = email.lower()
+        try:
+            async with asyncio.timeout(settings.redis_command_timeout):
+                await self.redis.delete(
+                    self._key_for_attempts("email", value),
+                    self._key_for_level("email", value),
+                )
+        except REDIS_UNAVAILABLE_ERRORS:
+            pass
+
+    async def _register(self, email: str, client_ip: Optional[str]) -> int:
+        now_ms = int(time.time() * 1000)
+        window_ms = settings.login_window_seconds * 1000
+        scopes = self._scopes(email, client_ip)
+
+        pipe = self.redis.pipeline(transaction=False)
+        for scope, value, _ in scopes:
+            attempts_key = self._key_for_attempts(scope, value)
+            pipe.zremrangebyscore(attempts_key, 0, now_ms - window_ms)
+            pipe.zadd(attempts_key, {f"{now_ms}:{uuid4().hex[:8]}": now_ms})
+            pipe.zcard(attempts_key)
+            pipe.pexpire(attempts_key, window_ms)
+            pipe.pttl(self._key_for_lock(scope, value))
+        results = await pipe.execute()
+
+        retry_after_ms = 0
+        for index, (scope, value, limit) in enumerate(scopes):
+            _, _, attempts, _, lock_ttl = results[index * 5 : index * 5 + 5]
+            if lock_ttl > 0:
+                retry_after_ms = max(retry_after_ms, lock_ttl)
+            elif attempts > limit:
+                lock_ms = await self._lock(scope, value)
+                retry_after_ms = max(retry_after_ms, lock_ms)
+
+        return retry_after_ms
+
+    async def _lock(self, scope: str, value: str) -> int:
+        level_key = self._key_for_level(scope, value)
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.incr(level_key)
+        pipe.expire(level_key, self.LEVEL_TTL)
+        level, _ = await pipe.execute()
+
+        lock_seconds = min(
+            settings.login_lockout_base_seconds * 2 ** (level - 1),
+            settings.login_lockout_max_seconds,
+        )
+        lock_ms = lock_seconds * 1000
+
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.set(self._key_for_lock(scope, value), 1, px=lock_ms)
+        pipe.delete(self._key_for_attempts(scope, value))
+        await pipe.execute()
+        return lock_ms
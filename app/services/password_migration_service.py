@@ -0,0 +1,112 @@
+import asyncio
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.user_repository import UserRepository
+from app.utils import security
+
+
+@dataclass
+class HashReport:
+    total: int = 0
+    stale: int = 0
+    wrapped: int = 0
+    by_scheme: Counter = field(default_factory=Counter)
+
+    def as_dict(self) -> Dict[str, object]:
+        return {
+            "total": self.total,
+            "stale": self.stale,
+            "wrapped": self.wrapped,
+            "by_scheme": {
+                f"{scheme}:{cost}": count
+                for (scheme, cost), count in sorted(
+                    self.by_scheme.items(), key=str
+                )
+            },
+        }
+
+
+class PasswordMigrationService:
+    """Varre ``users`` em lotes, contabiliza os hashes e protege os fracos.
+
+    Hashes defasados só podem ser refeitos no login, com a senha em claro.
+    Com ``wrap=True`` os que permitem (bcrypt) ganham um hash externo no
+    esquema padrão, e o login depois troca pelo hash direto.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        batch_size: int = 500,
+        cpu_fraction: float = 0.25,
+    ):
+        self.session = session
+        self.repository = UserRepository(session)
+        self.batch_size = batch_size
+        self.cpu_fraction = cpu_fraction
+
+    async def run(self, wrap: bool = False) -> HashReport:
+        report = HashReport()
+        after_id: Optional[UUID] = None
+
+        while True:
+            batch = await self.repository.get_password_batch(
+                after_id, self.batch_size
+            )
+            # Encerra a leitura antes de gastar CPU com hashes
+            await self.session.commit()
+            if not batch:
+                break
+
+            for user_id, hashed in batch:
+                await self._process(report, user_id, hashed, wrap)
+
+            after_id = batch[-1][0]
+
+        return report
+
+    async def _process(
+        self, report: HashReport, user_id: UUID, hashed: str, wrap: bool
+    ) -> None:
+        report.total += 1
+        scheme_cost: Tuple[str, Optional[int]] = security.describe_hash(hashed)
+        report.by_scheme[scheme_cost] += 1
+
+        if not security.needs_rehash(hashed):
+            return
+        report.stale += 1
+
+        if not wrap or not security.can_wrap(hashed):
+            return
+
+        # Hash e pausa fora de transação; o UPDATE confirma na hora, então
+        # o lock da linha não atrasa login nem updateUser desse usuário
+        new_hash = await self._throttled(security.wrap_hash, hashed)
+        replaced = await self.repository.replace_hashed_password(
+            user_id, hashed, new_hash
+        )
+        await self.session.commit()
+        if replaced:
+            report.wrapped += 1
+
+    async def _throttled(self, func, *args):
+        """Roda o hash fora do event loop e limita o uso de CPU.
+
+        Depois de cada hash dorme o suficiente para que o trabalho ocupe
+        no máximo ``cpu_fraction`` de um núcleo.
+        """
+        start = time.perf_counter()
+        result = await asyncio.to_thread(func, *args)
+        elapsed = time.perf_counter() - start
+
+        if self.cpu_fraction < 1:
+            await asyncio.sleep(
+                elapsed * (1 - self.cpu_fraction) / self.cpu_fraction
+            )
+        return result
@@ -1,45 +1,196 @@
 import json
+from contextlib import asynccontextmanager
+from typing import Optional
 from uuid import UUID, uuid4
 
 from redis.asyncio import Redis
 
+from app.core.redis import REDIS_UNAVAILABLE_ERRORS, ShardedRedis
+from app.core.redis_cache import ClientSideCache, LocalTTLCache
+from app.exceptions import SessionStoreUnavailableError
+from app.repositories.user_cache import user_version_key
+from app.schemas.session_schema import SessionRead
 from app.schemas.user_schema import UserRead
+from app.services.analytics_service import AnalyticsService
 
 
 class SessionService:
     TIME_TO_SESSION = 90 * 60  # 1h30min
 
-    def __init__(self, redis: Redis) -> None:
+    def __init__(
+        self,
+        redis: Redis,
+        cache: Optional[ClientSideCache] = None,
+        fallback: Optional[LocalTTLCache] = None,
+        shards: Optional[ShardedRedis] = None,
+        analytics: Optional[AnalyticsService] = None,
+    ) -> None:
         self.redis = redis
+        self.cache = cache
+        self.fallback = fallback
+        self.shards = shards
+        self.analytics = analytics
+
+    @asynccontextmanager
+    async def _available(self):
+        try:
+            yield
+        except REDIS_UNAVAILABLE_ERRORS as exc:
+            raise SessionStoreUnavailableError() from exc
 
     def _key_for_session(self, session_id: UUID) -> str:
         return f"session:{session_id}"
 
-    async def create_session(self, data: UserRead) -> UUID:
+    def _key_for_user_version(self, user_id: UUID) -> str:
+        return user_version_key(user_id)
+
+    def _redis_for_session(self, key: str) -> Redis:
+        if self.shards is None:
+            return self.redis
+        return self.shards.for_key(key)
+
+    async def _cached_get(
+        self, key: str, redis: Optional[Redis] = None
+    ) -> Optional[str]:
+        redis = redis or self.redis
+        if self.cache is None or not self.cache.is_active:
+            return await redis.get(key)
+
+        hit, value = self.cache.get(key)
+        if hit:
+            return value
+
+        self.cache.begin(key)
+        try:
+            value = await redis.get(key)
+            # Ausência também fica em cache: criar a chave (BCAST) invalida
+            self.cache.store(key, value)
+        finally:
+            self.cache.cancel(key)
+        return value
+
+    async def get_user_version(self, user_id: UUID) -> int:
+        async with self._available():
+            version = await self._cached_get(
+                self._key_for_user_version(user_id)
+            )
+        return int(version) if version else 0
+
+    async def bump_user_version(self, user_id: UUID) -> int:
+        """Invalida as sessões que guardaram uma versão anterior do usuário.
+
+        A chave não expira: se ela sumisse antes das sessões, um contador
+        recriado poderia voltar a coincidir com uma versão antiga.
+        """
+        async with self._available():
+            return await self.redis.incr(self._key_for_user_version(user_id))
+
+    async def create_session(
+        self, data: UserRead, write_lsn: Optional[int] = None
+    ) -> UUID:
         session_id = uuid4()
-        await self.redis.setex(
-            self._key_for_session(session_id),
-            self.TIME_TO_SESSION,
-            json.dumps(data.model_dump(mode="json")),
-        )
+        version = await self.get_user_version(data.id)
+
+        offset = None
+        if self.analytics is not None:
+            try:
+                offset = await self.analytics.assign_offset(data.id)
+            except REDIS_UNAVAILABLE_ERRORS:
+                pass
 
+        await self.save_session(session_id, data, version, offset, write_lsn)
+
+        if self.analytics is not None:
+            self.analytics.track_activity(session_id, data.id, offset)
         return session_id
 
-    async def get_user_id_from_session(
-        self, session_id: UUID
-    ) -> UserRead | None:
+    async def save_session(
+        self,
+        session_id: UUID,
+        data: UserRead,
+        version: int,
+        analytics_offset: Optional[int] = None,
+        write_lsn: Optional[int] = None,
+    ) -> None:
         key = self._key_for_session(session_id)
-        session_data = await self.redis.get(key)
+        record = SessionRead(
+            user=data,
+            version=version,
+            analytics_offset=analytics_offset,
+            write_lsn=write_lsn,
+        )
+        async with self._available():
+            await self._redis_for_session(key).set(
+                key,
+                json.dumps(record.model_dump(mode="json")),
+                ex=self.TIME_TO_SESSION,
+            )
+
+        if self.fallback is not None:
+            self.fallback.set(key, record, self.TIME_TO_SESSION)
+
+    async def get_session(self, session_id: UUID) -> SessionRead | None:
+        key = self._key_for_session(session_id)
+        try:
+            session_data = await self._read_session(key)
+        except SessionStoreUnavailableError:
+            if self.fallback is None:
+                raise
+
+            # Modo degradado: vale a última cópia vista por este processo
+            record = self.fallback.get(key)
+            if record is None:
+                raise
+            return record
 
         if not session_data:
             return None
 
-        await self.redis.expire(key, self.TIME_TO_SESSION)
+        record = SessionRead.model_validate(json.loads(session_data))
+        if self.fallback is not None:
+            self.fallback.set(key, record, self.TIME_TO_SESSION)
+        if self.analytics is not None:
+            self.analytics.track_activity(
+                session_id, record.user.id, record.analytics_offset
+            )
+        return record
+
+    async def mark_write(self, session_id: UUID, write_lsn: int) -> None:
+        """Guarda o LSN da escrita; réplicas atrás dele não leem por ela."""
+        record = await self.get_session(session_id)
+        if record is None or (record.write_lsn or 0) >= write_lsn:
+            return
+        await self.save_session(
+            session_id,
+            record.user,
+            record.version,
+            record.analytics_offset,
+            write_lsn,
+        )
+
+    async def _read_session(self, key: str) -> Optional[str]:
+        redis = self._redis_for_session(key)
+        async with self._available():
+            if self.cache is not None and self.cache.is_active:
+                session_data = await self._cached_get(key, redis)
+                if session_data and self.cache.needs_touch(key):
+                    await redis.expire(key, self.TIME_TO_SESSION)
+                return session_data
 
-        user_data = json.loads(session_data)
-        return UserRead.model_validate(user_data)
+            return await redis.getex(key, ex=self.TIME_TO_SESSION)
+
+    async def get_user_id_from_session(
+        self, session_id: UUID
+    ) -> UserRead | None:
+        session = await self.get_session(session_id)
+        return session.user if session else None
 
     async def delete_session(self, session_id: UUID) -> None:
         key = self._key_for_session(session_id)
-        if await self.redis.exists(key):
-            await self.redis.delete(key)
+        if self.fallback is not None:
+            self.fallback.delete(key)
+
+        redis = self._redis_for_session(key)
+        async with self._available():
+            if await redis.exists(key):
+                await redis.delete(key)
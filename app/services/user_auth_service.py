@@ -1,26 +1,60 @@
+import logging
 from contextlib import asynccontextmanager
+from typing import Optional
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.exceptions import (
     InvalidCredentialsError,
+    SessionStoreUnavailableError,
     UserNotFoundError,
 )
+from app.repositories.user_cache import UserCache
 from app.repositories.user_repository import UserRepository
 from app.schemas.user_schema import (
     UserChangePassword,
     UserLogin,
     UserRead,
 )
+from app.services.login_throttle_service import LoginThrottleService
+from app.services.session_service import SessionService
 from app.utils import security
 
+logger = logging.getLogger(__name__)
+
 
 class UserAuthService:
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self,
+        session: AsyncSession,
+        session_service: Optional[SessionService] = None,
+        throttle: Optional[LoginThrottleService] = None,
+        cache: Optional[UserCache] = None,
+    ):
         self.session = session
+        self.session_service = session_service
+        self.throttle = throttle
+        self.cache = cache
         self.repository = UserRepository(session)
 
+    async def _bump_user_version(self, user_id: UUID) -> None:
+        if self.session_service is None:
+            return
+        try:
+            await self.session_service.bump_user_version(user_id)
+        except SessionStoreUnavailableError:
+            # A escrita já foi confirmada: erro aqui faria o cliente repetir
+            # algo que aconteceu. Sessões antigas valem até expirar
+            logger.warning(
+                "Versão do usuário %s não incrementada: Redis indisponível",
+                user_id,
+            )
+
+    async def _invalidate_cache(self, user_id: UUID) -> None:
+        if self.cache is not None:
+            await self.cache.invalidate(user_id)
+
     @asynccontextmanager
     async def _transaction(self):
         try:
@@ -30,9 +64,14 @@ class UserAuthService:
             await self.session.rollback()
             raise
 
-    async def login_user(self, data: UserLogin) -> UserRead:
+    async def login_user(
+        self, data: UserLogin, client_ip: Optional[str] = None
+    ) -> UserRead:
+        if self.throttle is not None:
+            await self.throttle.check(data.email, client_ip)
+
         async with self._transaction():
-            user = await self.repository.get_by_email(data.email)
+            user = await self.repository.get_login_by_email(data.email)
             if not user:
                 raise UserNotFoundError()
 
@@ -41,13 +80,25 @@ class UserAuthService:
             ):
                 raise InvalidCredentialsError()
 
-            return UserRead.model_validate(user)
+            # Único momento com a senha em claro: migra hashes defasados
+            if security.needs_rehash(user.hashed_password):
+                await self.repository.replace_hashed_password(
+                    user.id,
+                    user.hashed_password,
+                    security.hash_password(data.password),
+                )
+
+            user_read = UserRead.model_validate(user)
+
+        if self.throttle is not None:
+            await self.throttle.reset(data.email)
+        return user_read
 
     async def change_password(
         self, user_id: UUID, data: UserChangePassword
     ) -> UserRead:
         async with self._transaction():
-            user = await self.repository.get_by_id(user_id)
+            user = await self.repository.get_by_id(user_id, with_password=True)
             if not user:
                 raise UserNotFoundError()
 
@@ -59,4 +110,8 @@ class UserAuthService:
             user.hashed_password = security.hash_password(data.new_password)
             await self.session.flush()
             await self.repository.refresh(user)
-            return UserRead.model_validate(user)
+            user_read = UserRead.model_validate(user)
+
+        await self._bump_user_version(user_id)
+        await self._invalidate_cache(user_id)
+        return user_read
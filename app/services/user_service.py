@@ -1,98 +1,318 @@
+import logging
 from contextlib import asynccontextmanager
+from typing import Collection, Optional
 from uuid import UUID
 
-from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.settings import settings
 from app.exceptions import (
+    ConflictError,
     DuplicateEmailError,
     DuplicateUsernameError,
     InvalidCredentialsError,
+    PageSizeOutOfRangeError,
+    SearchTermTooShortError,
+    SessionStoreUnavailableError,
     UserNotFoundError,
 )
 from app.models.user_model import UserModel
+from app.repositories.user_cache import UserCache
+from app.repositories.user_read_repository import UserReadRepository
 from app.repositories.user_repository import UserRepository
+from app.schemas.pagination_schema import PageInfoRead
 from app.schemas.user_schema import (
+    UserConnectionRead,
     UserCreate,
     UserDelete,
+    UserEdgeRead,
+    UserOrderBy,
     UserRead,
+    UserSearchConnectionRead,
+    UserSearchEdgeRead,
     UserUpdate,
 )
+from app.services.availability_service import AvailabilityService
+from app.services.session_service import SessionService
 from app.utils import security
+from app.utils.cursor import (
+    decode_cursor,
+    decode_rank_cursor,
+    encode_cursor,
+    encode_rank_cursor,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class UserService:
-    def __init__(self, session: AsyncSession):
+    # Abaixo de um trigrama o ILIKE não tem o que buscar no índice GIN e
+    # o Postgres lê o índice inteiro
+    SEARCH_MIN_LENGTH = 3
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        session_service: Optional[SessionService] = None,
+        availability: Optional[AvailabilityService] = None,
+        read_session: Optional[AsyncSession] = None,
+        cache: Optional[UserCache] = None,
+    ):
         self.session = session
+        self.session_service = session_service
+        self.availability = availability
+        self.cache = cache
         self.repository = UserRepository(session)
+        self.reader = UserReadRepository(session)
+        # Leituras que toleram réplica; escritas ficam sempre no primário
+        self._replica_repository = (
+            UserRepository(read_session)
+            if read_session is not None and read_session is not session
+            else None
+        )
+
+    @property
+    def read_repository(self) -> UserRepository:
+        return self._replica_repository or self.repository
+
+    async def _bump_user_version(self, user_id: UUID) -> None:
+        if self.session_service is None:
+            return
+        try:
+            await self.session_service.bump_user_version(user_id)
+        except SessionStoreUnavailableError:
+            # A escrita já foi confirmada: erro aqui faria o cliente repetir
+            # algo que aconteceu. Sessões antigas valem até expirar
+            logger.warning(
+                "Versão do usuário %s não incrementada: Redis indisponível",
+                user_id,
+            )
+
+    async def _invalidate_cache(self, user_id: UUID) -> None:
+        if self.cache is not None:
+            await self.cache.invalidate(user_id)
+
+    async def _mark_taken(self, username=None, email=None) -> None:
+        # Antes do INSERT: se ele falhar, sobra só um falso positivo
+        if self.availability is not None:
+            await self.availability.add(username, email)
 
     @asynccontextmanager
-    async def _transaction(self, *, email=None, username=None):
+    async def _transaction(self):
         try:
             yield
             await self.session.commit()
-        except IntegrityError as exc_info:
-            await self.session.rollback()
-
-            error_str = str(exc_info.orig)
-            if email and "ix_users_email" in error_str:
-                raise DuplicateEmailError(str(email))
-            if username and "ix_users_username" in error_str:
-                raise DuplicateUsernameError(str(username))
-
-            raise
         except Exception:
             await self.session.rollback()
             raise
 
+    async def _ensure_available(
+        self,
+        username: Optional[str],
+        email: Optional[str],
+        exclude_id: Optional[UUID] = None,
+    ) -> None:
+        username_taken, email_taken = await self.repository.find_conflicts(
+            username, email, exclude_id
+        )
+        if email_taken:
+            raise DuplicateEmailError(str(email))
+        if username_taken:
+            raise DuplicateUsernameError(str(username))
+
     async def create_user(self, data: UserCreate) -> UserRead:
-        async with self._transaction(email=data.email, username=data.username):
-            user = UserModel(
+        await self._mark_taken(data.username, data.email)
+        async with self._transaction():
+            # Duplicata é descoberta antes de gastar um bcrypt
+            await self._ensure_available(data.username, data.email)
+
+        # Entre as transações: o bcrypt não segura conexão do pool
+        hashed_password = security.hash_password(data.password)
+
+        async with self._transaction():
+            user = await self.repository.insert_if_absent(
                 name=data.name,
                 username=data.username,
                 email=data.email,
-                hashed_password=security.hash_password(data.password),
+                hashed_password=hashed_password,
             )
-            await self.repository.add(user)
-            await self.session.flush()
-            await self.repository.refresh(user)
+            if user is None:
+                # Outro cadastro venceu a corrida depois da checagem
+                await self._ensure_available(data.username, data.email)
+                raise ConflictError()
+
             return UserRead.model_validate(user)
 
     async def update_user(self, user_id: UUID, data: UserUpdate) -> UserRead:
-        async with self._transaction(email=data.email, username=data.username):
-            user = await self.repository.get_by_id(user_id)
+        await self._mark_taken(data.username, data.email)
+        async with self._transaction():
+            user = await self.repository.get_by_id(user_id, with_password=True)
             if not user:
                 raise UserNotFoundError()
 
-            if not security.verify_password(data.password, user.hashed_password):
+            if not security.verify_password(
+                data.password, user.hashed_password
+            ):
                 raise InvalidCredentialsError()
 
-            for field, value in data.model_dump(
-                exclude_unset=True, exclude_none=True
-            ).items():
-                if field != "password":
-                    setattr(user, field, value)
+            values = data.model_dump(
+                exclude_unset=True, exclude_none=True, exclude={"password"}
+            )
+            await self._ensure_available(
+                data.username, data.email, exclude_id=user_id
+            )
 
-            await self.session.flush()
-            await self.repository.refresh(user)
-            return UserRead.model_validate(user)
+            updated = await self.repository.update_if_absent(user_id, **values)
+            if updated is None:
+                await self._ensure_available(
+                    data.username, data.email, exclude_id=user_id
+                )
+                raise ConflictError()
+
+            user_read = UserRead.model_validate(updated)
+
+        await self._bump_user_version(user_id)
+        await self._invalidate_cache(user_id)
+        return user_read
+
+    async def get_user_by_id(
+        self, user_id: UUID, fields: Optional[Collection[str]] = None
+    ) -> UserRead:
+        """Busca o usuário lendo só as colunas de ``fields``, se informado.
+
+        Com projeção o ``UserRead`` volta parcial (sem validação), contendo
+        apenas os campos pedidos; serve para montar a resposta GraphQL.
+        Com cache, só o miss lido da réplica é projetado: ele não é gravado.
+        No primário o miss carrega o registro completo, que vai para o cache
+        e serve a qualquer seleção seguinte.
+        """
+        if self.cache is not None:
+            # Leitura de réplica pode estar atrasada: não vai ao cache
+            store = self.read_repository is self.repository
+            user_read = await self.cache.get_or_load(
+                user_id,
+                lambda: self._load_user(user_id, None if store else fields),
+                store=store,
+            )
+            if user_read is None:
+                raise UserNotFoundError()
+            return user_read
 
-    async def get_user_by_id(self, user_id: UUID) -> UserRead:
         async with self._transaction():
-            user = await self.repository.get_by_id(user_id)
+            user = await self.read_repository.get_by_id(
+                user_id, columns=fields
+            )
             if not user:
                 raise UserNotFoundError()
+            return self._to_read(user, fields)
 
+    async def _load_user(
+        self, user_id: UUID, fields: Optional[Collection[str]] = None
+    ) -> Optional[UserRead]:
+        async with self._transaction():
+            user = await self.read_repository.get_by_id(
+                user_id, columns=fields
+            )
+            return self._to_read(user, fields) if user else None
+
+    @staticmethod
+    def _to_read(
+        user: UserModel, fields: Optional[Collection[str]]
+    ) -> UserRead:
+        if not fields:
             return UserRead.model_validate(user)
 
+        names = {"id", *fields} & UserRead.model_fields.keys()
+        return UserRead.model_construct(
+            **{name: getattr(user, name) for name in names}
+        )
+
+    async def list_users(
+        self,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+        order_by: UserOrderBy = UserOrderBy.CREATED_AT_ASC,
+    ) -> UserConnectionRead:
+        if first is None:
+            first = settings.users_page_default_size
+        if not 1 <= first <= settings.users_page_max_size:
+            raise PageSizeOutOfRangeError(settings.users_page_max_size)
+
+        position = decode_cursor(after) if after else None
+
+        async with self._transaction():
+            # Um a mais para saber se existe próxima página
+            users = await self.reader.get_page(
+                first + 1,
+                position,
+                descending=order_by == UserOrderBy.CREATED_AT_DESC,
+            )
+            total_count_estimate = await self.repository.estimate_count()
+
+        edges = [
+            UserEdgeRead(
+                cursor=encode_cursor(user.created_at, user.id),
+                node=UserRead.model_validate(user),
+            )
+            for user in users[:first]
+        ]
+        return UserConnectionRead(
+            edges=edges,
+            page_info=PageInfoRead(
+                has_next_page=len(users) > first,
+                end_cursor=edges[-1].cursor if edges else None,
+            ),
+            total_count_estimate=total_count_estimate,
+        )
+
+    async def search_users(
+        self,
+        term: str,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+    ) -> UserSearchConnectionRead:
+        term = term.strip()
+        if len(term) < self.SEARCH_MIN_LENGTH:
+            raise SearchTermTooShortError(self.SEARCH_MIN_LENGTH)
+        if first is None:
+            first = settings.users_page_default_size
+        if not 1 <= first <= settings.users_page_max_size:
+            raise PageSizeOutOfRangeError(settings.users_page_max_size)
+
+        position = decode_rank_cursor(after) if after else None
+
+        async with self._transaction():
+            users = await self.reader.search(term, first + 1, position)
+
+        edges = [
+            UserSearchEdgeRead(
+                cursor=encode_rank_cursor(user.score, user.id),
+                node=UserRead.model_validate(user),
+                score=user.score,
+            )
+            for user in users[:first]
+        ]
+        return UserSearchConnectionRead(
+            edges=edges,
+            page_info=PageInfoRead(
+                has_next_page=len(users) > first,
+                end_cursor=edges[-1].cursor if edges else None,
+            ),
+        )
+
     async def delete_user(self, user_id: UUID, data: UserDelete) -> None:
         async with self._transaction():
-            user = await self.repository.get_by_id(user_id)
+            user = await self.repository.get_by_id(user_id, with_password=True)
             if not user:
                 raise UserNotFoundError()
 
-            if not security.verify_password(data.password, user.hashed_password):
+            if not security.verify_password(
+                data.password, user.hashed_password
+            ):
                 raise InvalidCredentialsError()
 
             await self.repository.delete(user)
             await self.session.flush()
+
+        await self._bump_user_version(user_id)
+        await self._invalidate_cache(user_id)
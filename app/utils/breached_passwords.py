@@ -0,0 +1,113 @@
+import hashlib
+import math
+import mmap
+import os
+import struct
+from functools import lru_cache
+from typing import Iterable, Optional
+
+from app.core.settings import settings
+
+MAGIC = b"PWBLOOM1"
+_HEADER = struct.Struct("<8sQI")  # magic, número de bits, número de hashes
+_MASK64 = (1 << 64) - 1
+
+
+def password_digest(password: str) -> bytes:
+    """SHA-1 da senha, o mesmo formato das listas públicas de vazamentos."""
+    return hashlib.sha1(password.encode("utf-8")).digest()
+
+
+def _positions(digest: bytes, num_bits: int, num_hashes: int):
+    # Double hashing (Kirsch–Mitzenmacher) sobre os 128 bits iniciais
+    h1, h2 = struct.unpack_from("<QQ", digest)
+    h2 |= 1
+    for i in range(num_hashes):
+        yield ((h1 + i * h2) & _MASK64) % num_bits
+
+
+class BreachedPasswordFilter:
+    """Bloom filter de senhas vazadas lido direto de um arquivo mapeado.
+
+    O arquivo é aberto com ``mmap`` somente leitura: as páginas ficam no
+    page cache do sistema e são compartilhadas entre os workers, sem cópia
+    no heap de cada processo. Falsos positivos são possíveis na taxa usada
+    no build; falsos negativos não.
+    """
+
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, self.num_bits, self.num_hashes = _HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            self._mmap.close()
+            raise ValueError(f"{path} não é um filtro de senhas vazadas")
+
+        expected = _HEADER.size + math.ceil(self.num_bits / 8)
+        if len(self._mmap) != expected:
+            self._mmap.close()
+            raise ValueError(f"{path} está truncado ou corrompido")
+
+    def __contains__(self, password: str) -> bool:
+        return self.contains_digest(password_digest(password))
+
+    def contains_digest(self, digest: bytes) -> bool:
+        data = self._mmap
+        offset = _HEADER.size
+        for position in _positions(digest, self.num_bits, self.num_hashes):
+            if not data[offset + (position >> 3)] & (1 << (position & 7)):
+                return False
+        return True
+
+    def close(self) -> None:
+        self._mmap.close()
+
+
+def optimal_parameters(count: int, false_positive_rate: float):
+    num_bits = math.ceil(
+        -count * math.log(false_positive_rate) / math.log(2) ** 2
+    )
+    num_bits = max(num_bits, 8)
+    num_hashes = max(1, round(num_bits / max(count, 1) * math.log(2)))
+    return num_bits, num_hashes
+
+
+def build_filter(
+    digests: Iterable[bytes],
+    count: int,
+    path: str,
+    false_positive_rate: float = 1e-6,
+) -> None:
+    """Grava o filtro em ``path`` de forma atômica.
+
+    ``count`` é o número (ou uma estimativa por cima) de senhas na lista;
+    ele dimensiona o filtro para a taxa de falso positivo pedida.
+    """
+    num_bits, num_hashes = optimal_parameters(count, false_positive_rate)
+    bits = bytearray(math.ceil(num_bits / 8))
+
+    for digest in digests:
+        for position in _positions(digest, num_bits, num_hashes):
+            bits[position >> 3] |= 1 << (position & 7)
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as file:
+        file.write(_HEADER.pack(MAGIC, num_bits, num_hashes))
+        file.write(bits)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(tmp_path, path)
+
+
+@lru_cache(maxsize=1)
+def get_breached_filter() -> Optional[BreachedPasswordFilter]:
+    """Filtro configurado em ``breached_passwords_path``, aberto uma vez."""
+    if not settings.breached_passwords_path:
+        return None
+    return BreachedPasswordFilter(settings.breached_passwords_path)
+
+
+def is_breached(password: str) -> bool:
+    breached_filter = get_breached_filter()
+    return breached_filter is not None and password in breached_filter
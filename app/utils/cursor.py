@@ -0,0 +1,35 @@
+import base64
+from datetime import datetime
+from typing import Tuple
+from uuid import UUID
+
+from app.exceptions import InvalidCursorError
+
+
+def encode_cursor(created_at: datetime, user_id: UUID) -> str:
+    raw = f"{created_at.isoformat()}|{user_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        created_at, user_id = raw.split("|")
+        return datetime.fromisoformat(created_at), UUID(user_id)
+    except ValueError as exc:
+        raise InvalidCursorError() from exc
+
+
+def encode_rank_cursor(score: float, user_id: UUID) -> str:
+    # repr devolve o float exato; a comparação do keyset não perde nada
+    raw = f"{score!r}|{user_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_rank_cursor(cursor: str) -> Tuple[float, UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        score, user_id = raw.split("|")
+        return float(score), UUID(user_id)
+    except ValueError as exc:
+        raise InvalidCursorError() from exc
@@ -6,5 +6,6 @@ class ErrorCode(str, Enum):
     INVALID_ARGUMENT_VALUE = "InvalidArgumentValueError"
     INVALID_QUERY_FIELD = "InvalidQueryFieldError"
     MISSING_REQUIRED_INPUT = "MissingRequiredInputError"
+    SERVICE_OVERLOADED = "ServiceOverloadedError"
     UNEXPECTED_INPUT = "UnexpectedInputError"
     UNKNOWN_ERROR = "UnknownError"
@@ -0,0 +1,78 @@
+import secrets
+import threading
+import time
+from uuid import UUID, uuid4
+
+from app.core.settings import settings
+
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+# Mesmo layout do uuid7() abaixo, para o DEFAULT do Postgres (< 18 não
+# tem uuidv7()): parte de um v4 e grava por cima os 48 bits de
+# milissegundos e a versão (0100 -> 0111 ligando os bits 52 e 53)
+UUID7_FUNCTION = """
+CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid
+LANGUAGE sql VOLATILE AS $$
+    SELECT encode(
+        set_bit(
+            set_bit(
+                overlay(
+                    uuid_send(gen_random_uuid())
+                    PLACING substring(
+                        int8send(
+                            floor(
+                                extract(epoch FROM clock_timestamp()) * 1000
+                            )::bigint
+                        )
+                        FROM 3
+                    )
+                    FROM 1 FOR 6
+                ),
+                52, 1
+            ),
+            53, 1
+        ),
+        'hex'
+    )::uuid
+$$
+"""
+
+
+def uuid7() -> UUID:
+    """UUIDv7 (RFC 9562): 48 bits de milissegundos Unix, depois aleatório.
+
+    Chaves crescem com o tempo, então INSERTs caem nas últimas páginas do
+    B-tree em vez de espalhar splits pelo índice. Dentro do mesmo
+    milissegundo os 12 bits de ``rand_a`` viram contador (método 1 da
+    RFC), o que mantém a ordem também entre ids do mesmo processo.
+    """
+    global _last_ms, _counter
+    with _lock:
+        now_ms = time.time_ns() // 1_000_000
+        if now_ms > _last_ms:
+            _last_ms = now_ms
+            # Começa na metade de baixo: sobra espaço para o contador
+            _counter = secrets.randbits(11)
+        else:
+            _counter += 1
+            if _counter > 0xFFF:
+                # Contador esgotado: empresta o próximo milissegundo
+                _last_ms += 1
+                _counter = 0
+        timestamp, counter = _last_ms, _counter
+
+    value = (timestamp & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76
+    value |= counter << 64
+    value |= 0b10 << 62
+    value |= secrets.randbits(62)
+    return UUID(int=value)
+
+
+def new_id() -> UUID:
+    """Chave primária nova na versão configurada em ``id_uuid_version``."""
+    if settings.id_uuid_version == 7:
+        return uuid7()
+    return uuid4()
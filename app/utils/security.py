@@ -1,9 +1,101 @@
-from passlib.hash import bcrypt
+from typing import Optional, Tuple
+
+import bcrypt
+from passlib.context import CryptContext
+
+from app.core.settings import Settings, settings
+
+
+def build_context(config: Optional[Settings] = None) -> CryptContext:
+    """Monta o contexto de hash a partir de ``Settings``.
+
+    Hashes em esquema que não seja o padrão, ou com custo abaixo do
+    configurado, são marcados para atualização (``needs_rehash``).
+    """
+    config = config or settings
+    return CryptContext(
+        schemes=config.password_schemes,
+        default=config.password_schemes[0],
+        deprecated="auto",
+        bcrypt__rounds=config.bcrypt_rounds,
+        bcrypt__min_rounds=config.bcrypt_rounds,
+        argon2__type="ID",
+        argon2__rounds=config.argon2_time_cost,
+        argon2__min_rounds=config.argon2_time_cost,
+        argon2__memory_cost=config.argon2_memory_cost,
+        argon2__parallelism=config.argon2_parallelism,
+        scrypt__rounds=config.scrypt_rounds,
+        scrypt__min_rounds=config.scrypt_rounds,
+        scrypt__block_size=config.scrypt_block_size,
+        scrypt__parallelism=config.scrypt_parallelism,
+    )
+
+
+pwd_context = build_context()
+
+# Hash bcrypt antigo envolvido por um hash externo no esquema padrão:
+# "wrapped:<config bcrypt sem checksum>|<hash externo do bcrypt completo>"
+WRAPPED_PREFIX = "wrapped:"
+_BCRYPT_CONFIG_SIZE = 29  # $2b$ + custo + $ + salt de 22 caracteres
 
 
 def hash_password(password: str) -> str:
-    return bcrypt.hash(password)
+    return pwd_context.hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return bcrypt.verify(plain_password, hashed_password)
+    if hashed_password.startswith(WRAPPED_PREFIX):
+        config, outer = _split_wrapped(hashed_password)
+        inner = bcrypt.hashpw(plain_password.encode(), config.encode())
+        return pwd_context.verify(inner.decode(), outer)
+
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+def can_wrap(hashed_password: str) -> bool:
+    """Só bcrypt permite recalcular o hash antigo a partir da senha.
+
+    O salt e o custo ficam no prefixo do próprio hash.
+    """
+    try:
+        return pwd_context.identify(hashed_password) == "bcrypt"
+    except ValueError:
+        return False
+
+
+def wrap_hash(hashed_password: str) -> str:
+    """Protege um hash bcrypt fraco sem conhecer a senha."""
+    config = hashed_password[:_BCRYPT_CONFIG_SIZE]
+    return f"{WRAPPED_PREFIX}{config}|{pwd_context.hash(hashed_password)}"
+
+
+def _split_wrapped(hashed_password: str) -> Tuple[str, str]:
+    config, outer = hashed_password[len(WRAPPED_PREFIX) :].split("|", 1)
+    return config, outer
+
+
+def describe_hash(hashed_password: str) -> Tuple[str, Optional[int]]:
+    """Retorna o esquema e o custo (rounds) de um hash armazenado."""
+    if hashed_password.startswith(WRAPPED_PREFIX):
+        config, _ = _split_wrapped(hashed_password)
+        return "wrapped_bcrypt", int(config[4:6])
+
+    try:
+        scheme = pwd_context.identify(hashed_password)
+        handler = pwd_context.handler(scheme)
+        return scheme, getattr(
+            handler.from_string(hashed_password), "rounds", None
+        )
+    except ValueError:
+        return "unknown", None
+
+
+def needs_rehash(hashed_password: str) -> bool:
+    if hashed_password.startswith(WRAPPED_PREFIX):
+        return True
+
+    try:
+        return pwd_context.needs_update(hashed_password)
+    except ValueError:
+        # Hash em formato desconhecido: nem dá para verificar a senha
+        return False
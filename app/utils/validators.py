@@ -1,7 +1,9 @@
 import re
-from typing import Any
+from typing import Any, Tuple
 from uuid import UUID
 
+from app.utils.breached_passwords import is_breached
+
 
 def validate_password_strength(password: str) -> str:
     if len(password) < 8:
@@ -21,9 +23,21 @@ def validate_password_strength(password: str) -> str:
     return password
 
 
-def is_uuid4(value: Any) -> bool:
+def validate_password_not_breached(password: str) -> str:
+    """Só para senhas novas: a atual de quem já existe precisa logar."""
+    if is_breached(password):
+        raise ValueError(
+            "Essa senha já apareceu em vazamentos conhecidos, escolha outra"
+        )
+
+    return password
+
+
+def is_uuid(value: Any, versions: Tuple[int, ...] = (4, 7)) -> bool:
+    """UUID em texto numa das ``versions`` (v4 aleatório, v7 ordenado)."""
     try:
-        val = UUID(value, version=4)
+        # Sem ``version=``: o construtor sobrescreveria a versão do valor
+        val = UUID(value)
     except (ValueError, AttributeError, TypeError):
         return False
-    return val.version == 4
+    return val.version in versions
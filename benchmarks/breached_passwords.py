@@ -0,0 +1,132 @@
+"""Latência e memória por worker do filtro de senhas vazadas.
+
+Gera uma lista sintética, monta o Bloom filter num diretório temporário e
+compara, em processos separados, a memória privada (RssAnon) e a
+compartilhada (RssFile) de abrir o filtro com ``mmap`` contra carregar os
+mesmos digests num ``set`` do Python.
+
+Uso:
+    python -m benchmarks.breached_passwords --count 1000000
+    python -m benchmarks.breached_passwords --filter breached.bloom
+"""
+
+import argparse
+import multiprocessing
+import os
+import statistics
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+from app.utils.breached_passwords import (
+    BreachedPasswordFilter,
+    build_filter,
+    password_digest,
+)
+
+
+def _synthetic(count: int, prefix: str = "vazada") -> List[str]:
+    return [f"{prefix}-{i}" for i in range(count)]
+
+
+def _rss() -> Dict[str, int]:
+    """RssAnon/RssFile do processo atual em KB (Linux)."""
+    values = {}
+    with open("/proc/self/status") as status:
+        for line in status:
+            name, _, rest = line.partition(":")
+            if name in ("RssAnon", "RssFile"):
+                values[name] = int(rest.split()[0])
+    return values
+
+
+def _lookup_us(contains, passwords: List[str]) -> float:
+    timings = []
+    for password in passwords:
+        start = time.perf_counter()
+        contains(password)
+        timings.append((time.perf_counter() - start) * 1_000_000)
+    return statistics.median(timings)
+
+
+def _mmap_worker(path: str, probes: List[str], queue) -> None:
+    before = _rss()
+    breached = BreachedPasswordFilter(path)
+    latency = _lookup_us(breached.__contains__, probes)
+    after = _rss()
+    queue.put(("mmap", before, after, latency))
+
+
+def _set_worker(count: int, probes: List[str], queue) -> None:
+    before = _rss()
+    digests = {password_digest(p) for p in _synthetic(count)}
+    latency = _lookup_us(lambda p: password_digest(p) in digests, probes)
+    after = _rss()
+    queue.put(("set", before, after, latency))
+
+
+def _run_isolated(target, *args):
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(target=target, args=(*args, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--false-positive-rate", type=float, default=1e-6)
+    parser.add_argument("--probes", type=int, default=10_000)
+    parser.add_argument(
+        "--filter", help="usa um filtro existente em vez do sintético"
+    )
+    parser.add_argument(
+        "--skip-set", action="store_true", help="não mede o set em memória"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path: Optional[str] = args.filter
+        if path is None:
+            path = os.path.join(tmp, "breached.bloom")
+            start = time.perf_counter()
+            build_filter(
+                (password_digest(p) for p in _synthetic(args.count)),
+                args.count,
+                path,
+                args.false_positive_rate,
+            )
+            print(
+                f"build: {args.count} senhas em "
+                f"{time.perf_counter() - start:.1f}s, "
+                f"{os.path.getsize(path) / 1024 / 1024:.1f} MB"
+            )
+
+        misses = _synthetic(args.probes, prefix="inedita")
+        breached = BreachedPasswordFilter(path)
+        false_positives = sum(1 for p in misses if p in breached)
+        breached.close()
+        print(
+            f"falsos positivos: {false_positives}/{args.probes} "
+            f"(alvo {args.false_positive_rate:g})"
+        )
+
+        runs = [_run_isolated(_mmap_worker, path, misses)]
+        if args.filter is None and not args.skip_set:
+            runs.append(_run_isolated(_set_worker, args.count, misses))
+
+    print(
+        f"\n{'modo':<6} {'lookup µs':>10} {'privada MB':>11} "
+        f"{'compartilhada MB':>17}"
+    )
+    for mode, before, after, latency in runs:
+        private = (after["RssAnon"] - before["RssAnon"]) / 1024
+        shared = (after["RssFile"] - before["RssFile"]) / 1024
+        print(f"{mode:<6} {latency:>10.2f} {private:>11.1f} {shared:>17.1f}")
+
+
+if __name__ == "__main__":
+    main()
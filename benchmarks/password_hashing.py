@@ -0,0 +1,133 @@
+"""Calibra o custo dos hashes de senha para uma latência alvo.
+
+Mede cada esquema suportado por ``app.utils.security`` em custos
+crescentes, recomenda o maior custo dentro da latência alvo e estima
+quantos logins (verify) e cadastros (hash) por segundo um núcleo aguenta.
+
+Uso:
+    python -m benchmarks.password_hashing --target-ms 250
+    python -m benchmarks.password_hashing --schemes argon2 --samples 10
+"""
+
+import argparse
+import statistics
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+from app.core.settings import Settings
+from app.utils.security import build_context
+
+PASSWORD = "Senh@Benchmark123"
+
+# Parâmetro de custo de cada esquema e a faixa avaliada
+COST_FIELDS: Dict[str, str] = {
+    "bcrypt": "bcrypt_rounds",
+    "argon2": "argon2_time_cost",
+    "scrypt": "scrypt_rounds",
+}
+COST_RANGES: Dict[str, range] = {
+    "bcrypt": range(8, 17),
+    "argon2": range(1, 11),
+    "scrypt": range(12, 19),
+}
+
+
+@dataclass
+class Measurement:
+    scheme: str
+    cost: int
+    hash_ms: float
+    verify_ms: float
+
+    @property
+    def logins_per_core(self) -> float:
+        return 1000 / self.verify_ms
+
+    @property
+    def signups_per_core(self) -> float:
+        return 1000 / self.hash_ms
+
+
+def _median_ms(func, samples: int) -> float:
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def measure(scheme: str, cost: int, samples: int = 5) -> Measurement:
+    config = Settings(password_schemes=[scheme], **{COST_FIELDS[scheme]: cost})
+    context = build_context(config)
+    hashed = context.hash(PASSWORD)
+
+    return Measurement(
+        scheme=scheme,
+        cost=cost,
+        hash_ms=_median_ms(lambda: context.hash(PASSWORD), samples),
+        verify_ms=_median_ms(
+            lambda: context.verify(PASSWORD, hashed), samples
+        ),
+    )
+
+
+def calibrate(
+    scheme: str, target_ms: float, samples: int = 5
+) -> List[Measurement]:
+    """Mede custos crescentes até passar do dobro da latência alvo."""
+    results = []
+    for cost in COST_RANGES[scheme]:
+        result = measure(scheme, cost, samples)
+        results.append(result)
+        if result.verify_ms > target_ms * 2:
+            break
+    return results
+
+
+def recommend(
+    results: Iterable[Measurement], target_ms: float
+) -> Optional[Measurement]:
+    within = [r for r in results if r.verify_ms <= target_ms]
+    return max(within, key=lambda r: r.cost) if within else None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--target-ms", type=float, default=250.0)
+    parser.add_argument("--samples", type=int, default=5)
+    parser.add_argument(
+        "--schemes", nargs="+", default=list(COST_FIELDS), choices=COST_FIELDS
+    )
+    args = parser.parse_args()
+
+    header = (
+        f"{'scheme':<8} {'cost':>5} {'hash ms':>9} {'verify ms':>10} "
+        f"{'logins/s/core':>14}"
+    )
+    for scheme in args.schemes:
+        results = calibrate(scheme, args.target_ms, args.samples)
+
+        print(f"\n{header}")
+        for r in results:
+            print(
+                f"{r.scheme:<8} {r.cost:>5} {r.hash_ms:>9.1f} "
+                f"{r.verify_ms:>10.1f} {r.logins_per_core:>14.1f}"
+            )
+
+        best = recommend(results, args.target_ms)
+        if best is None:
+            print(f"⚠️  {scheme}: nenhum custo cabe em {args.target_ms} ms")
+            continue
+
+        print(
+            f"✅ {scheme}: {COST_FIELDS[scheme].upper()}={best.cost} "
+            f"({best.verify_ms:.1f} ms) → "
+            f"{best.logins_per_core:.1f} logins/s e "
+            f"{best.signups_per_core:.1f} createUser/s por núcleo"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Vazão de sessões com 1..N shards Redis.
+
+Uso:
+    docker compose -f docker-redis.yml -f docker-redis-shards.yml up -d
+    python -m benchmarks.session_sharding \\
+        --urls redis://localhost:6380 redis://localhost:6381 \\
+               redis://localhost:6382
+"""
+
+import argparse
+import asyncio
+import time
+from uuid import uuid4
+
+from redis.asyncio import Redis
+
+from app.core.redis import ShardedRedis, node_name
+from app.schemas.user_schema import UserRead
+from app.services.session_service import SessionService
+
+
+def _user() -> UserRead:
+    return UserRead(
+        id=uuid4(),
+        name="Benchmark User",
+        username=f"bench-{uuid4().hex[:8]}",
+        email="bench@example.com",
+        is_master=False,
+    )
+
+
+async def _worker(service: SessionService, operations: int) -> None:
+    for _ in range(operations):
+        session_id = await service.create_session(_user())
+        await service.get_session(session_id)
+
+
+async def run_shards(
+    version_url: str, urls: list[str], operations: int, concurrency: int
+) -> float:
+    clients = {
+        node_name(url): Redis.from_url(
+            url, decode_responses=True, max_connections=concurrency
+        )
+        for url in urls
+    }
+    version_client = Redis.from_url(version_url, decode_responses=True)
+    service = SessionService(version_client, shards=ShardedRedis(clients))
+
+    try:
+        per_worker = operations // concurrency
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(_worker(service, per_worker) for _ in range(concurrency))
+        )
+        elapsed = time.perf_counter() - start
+
+        # Cada operação é create_session + get_session
+        return per_worker * concurrency * 2 / elapsed
+    finally:
+        for client in clients.values():
+            await client.flushdb()
+            await client.aclose()
+        await version_client.aclose()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--urls", nargs="+", required=True)
+    parser.add_argument("--version-url", default="redis://localhost:6379")
+    parser.add_argument("--operations", type=int, default=20_000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    args = parser.parse_args()
+
+    print(f"{'shards':>6} {'ops/s':>12}")
+    for count in range(1, len(args.urls) + 1):
+        ops = await run_shards(
+            args.version_url,
+            args.urls[:count],
+            args.operations,
+            args.concurrency,
+        )
+        print(f"{count:>6} {ops:>12.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
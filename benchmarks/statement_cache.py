@@ -0,0 +1,134 @@
+"""Statements/s de ``get_by_id`` por perfil de cache.
+
+Compara, contra o mesmo banco:
+
+- ``rebuild``: ``select()`` montado a cada chamada, como antes;
+- ``cached``: statement montado uma vez (``UserRepository``) com os caches
+  de prepared statements das configurações;
+- ``pgbouncer``: o mesmo statement com prepares desligados, como no perfil
+  ``db_pgbouncer``.
+
+Uso:
+    docker compose up -d
+    python -m benchmarks.statement_cache --operations 20000 --concurrency 10
+"""
+
+import argparse
+import asyncio
+import time
+from typing import List
+from uuid import UUID
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from app.core.database import engine_options
+from app.core.settings import settings
+from app.models.user_model import UserModel
+from app.repositories.user_repository import UserRepository
+
+PREFIX = "bench-stmt-"
+
+
+async def _seed(engine: AsyncEngine, count: int) -> List[UUID]:
+    async with AsyncSession(engine) as session:
+        users = [
+            UserModel(
+                name=f"Benchmark User {i}",
+                username=f"{PREFIX}{i}",
+                email=f"{PREFIX}{i}@example.com",
+                hashed_password="hash",
+            )
+            for i in range(count)
+        ]
+        session.add_all(users)
+        await session.commit()
+        return [user.id for user in users]
+
+
+async def _cleanup(engine: AsyncEngine) -> None:
+    async with engine.begin() as connection:
+        await connection.execute(
+            delete(UserModel).where(UserModel.username.startswith(PREFIX))
+        )
+
+
+async def _rebuild(session: AsyncSession, user_id: UUID) -> None:
+    result = await session.execute(select(UserModel).filter_by(id=user_id))
+    result.scalar_one_or_none()
+
+
+async def _cached(session: AsyncSession, user_id: UUID) -> None:
+    await UserRepository(session).get_by_id(user_id)
+
+
+async def run_profile(
+    name: str,
+    pgbouncer: bool,
+    ids: List[UUID],
+    operations: int,
+    concurrency: int,
+) -> float:
+    options = engine_options(pgbouncer=pgbouncer)
+    options["echo"] = False
+    engine = create_async_engine(
+        settings.database_url_async, pool_size=concurrency, **options
+    )
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    read = _rebuild if name == "rebuild" else _cached
+
+    async def worker(offset: int, count: int) -> None:
+        async with sessions() as session:
+            for i in range(count):
+                await read(session, ids[(offset + i) % len(ids)])
+                # Sem identity map acumulado entre leituras
+                session.expunge_all()
+
+    try:
+        per_worker = operations // concurrency
+        # Aquece o pool e os caches antes de medir
+        await asyncio.gather(*(worker(i, 10) for i in range(concurrency)))
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(worker(i, per_worker) for i in range(concurrency))
+        )
+        return per_worker * concurrency / (time.perf_counter() - start)
+    finally:
+        await engine.dispose()
+
+
+async def main_async(users: int, operations: int, concurrency: int) -> None:
+    engine = create_async_engine(settings.database_url_async)
+    try:
+        ids = await _seed(engine, users)
+        print(f"{'perfil':<10} {'statements/s':>13}")
+        for name, pgbouncer in (
+            ("rebuild", False),
+            ("cached", False),
+            ("pgbouncer", True),
+        ):
+            rate = await run_profile(
+                name, pgbouncer, ids, operations, concurrency
+            )
+            print(f"{name:<10} {rate:>13.0f}")
+    finally:
+        await _cleanup(engine)
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--operations", type=int, default=20_000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main_async(args.users, args.operations, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
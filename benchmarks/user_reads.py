@@ -0,0 +1,121 @@
+"""Leituras de usuário pelo ORM contra o caminho Core (``Row``).
+
+Insere usuários sintéticos numa transação que é desfeita no final e mede,
+para leitura única e em lote, µs por linha e objetos Python que cada
+resultado mantém vivos (``gc.get_objects``), do SELECT até o
+``UserRead`` que a camada GraphQL consome.
+
+Uso:
+    docker compose up -d
+    python -m benchmarks.user_reads --users 1000 --rounds 200
+"""
+
+import argparse
+import asyncio
+import gc
+import statistics
+import time
+from typing import Awaitable, Callable, List
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import engine
+from app.models.user_model import UserModel
+from app.repositories.user_read_repository import UserReadRepository
+from app.schemas.user_schema import UserRead
+
+
+async def _orm_by_id(session: AsyncSession, ids: List) -> list:
+    user = await session.get(UserModel, ids[0])
+    return [UserRead.model_validate(user)]
+
+
+async def _orm_by_ids(session: AsyncSession, ids: List) -> list:
+    result = await session.execute(
+        select(UserModel).where(UserModel.id.in_(ids))
+    )
+    return [UserRead.model_validate(user) for user in result.scalars()]
+
+
+async def _core_by_id(session: AsyncSession, ids: List) -> list:
+    # Linha vai direto para o ``UserType``; sem cópia intermediária
+    return [await UserReadRepository(session).get_by_id(ids[0])]
+
+
+async def _core_by_ids(session: AsyncSession, ids: List) -> list:
+    return await UserReadRepository(session).get_by_ids(ids)
+
+
+async def _measure(
+    session: AsyncSession,
+    read: Callable[[AsyncSession, List], Awaitable[list]],
+    ids: List,
+    rounds: int,
+) -> tuple[float, float]:
+    timings, objects = [], []
+    for _ in range(rounds):
+        # Identity map vazio: o ORM paga a hidratação completa toda vez
+        session.expunge_all()
+        gc.collect()
+        gc.disable()
+        before = len(gc.get_objects())
+        start = time.perf_counter()
+        rows = await read(session, ids)
+        elapsed = time.perf_counter() - start
+        after = len(gc.get_objects())
+        gc.enable()
+        timings.append(elapsed * 1_000_000 / len(rows))
+        objects.append((after - before) / len(rows))
+        del rows
+    return statistics.median(timings), statistics.median(objects)
+
+
+async def run(users: int, batch: int, rounds: int) -> None:
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        session = AsyncSession(bind=connection, expire_on_commit=False)
+        try:
+            session.add_all(
+                UserModel(
+                    name=f"Benchmark User {i}",
+                    username=f"bench-{i}",
+                    email=f"bench-{i}@example.com",
+                    hashed_password="hash",
+                )
+                for i in range(users)
+            )
+            await session.flush()
+            ids = list(
+                (await session.execute(select(UserModel.id))).scalars()
+            )[:batch]
+
+            print(f"{'leitura':<14} {'µs/linha':>10} {'objetos/linha':>14}")
+            cases = [
+                ("orm único", _orm_by_id, ids[:1]),
+                ("core único", _core_by_id, ids[:1]),
+                (f"orm lote {batch}", _orm_by_ids, ids),
+                (f"core lote {batch}", _core_by_ids, ids),
+            ]
+            for name, read, keys in cases:
+                # Aquece o cache de compilação antes de medir
+                await read(session, keys)
+                micros, objects = await _measure(session, read, keys, rounds)
+                print(f"{name:<14} {micros:>10.1f} {objects:>14.1f}")
+        finally:
+            await session.close()
+            await transaction.rollback()
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--batch", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(run(args.users, args.batch, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
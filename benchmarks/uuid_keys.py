@@ -0,0 +1,80 @@
+"""Vazão de INSERT e tamanho do índice: chaves uuid4 contra uuid7.
+
+Cria duas tabelas temporárias só com ``id uuid PRIMARY KEY`` e um
+payload, insere as mesmas quantidades em lotes com ids gerados no Python
+e compara linhas/s e o tamanho final do índice da PK. Com chaves
+aleatórias cada lote toca páginas espalhadas pelo B-tree e os splits
+deixam páginas pela metade; com v7 as inserções vão para a borda direita.
+
+Uso:
+    docker compose up -d
+    python -m benchmarks.uuid_keys --rows 1000000 --batch 1000
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Callable
+from uuid import UUID, uuid4
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+
+from app.core.settings import settings
+from app.utils.ids import uuid7
+
+
+async def _run(
+    connection: AsyncConnection,
+    table: str,
+    make_id: Callable[[], UUID],
+    rows: int,
+    batch: int,
+) -> tuple[float, int]:
+    await connection.execute(
+        text(
+            f"CREATE TEMP TABLE {table} "
+            "(id uuid PRIMARY KEY, payload text NOT NULL)"
+        )
+    )
+    insert = text(f"INSERT INTO {table} (id, payload) VALUES (:id, :payload)")
+
+    start = time.perf_counter()
+    for _ in range(rows // batch):
+        await connection.execute(
+            insert,
+            [{"id": make_id(), "payload": "x" * 64} for _ in range(batch)],
+        )
+    elapsed = time.perf_counter() - start
+
+    size = await connection.scalar(
+        text(f"SELECT pg_relation_size('{table}_pkey')")
+    )
+    return rows // batch * batch / elapsed, size
+
+
+async def main_async(rows: int, batch: int) -> None:
+    engine = create_async_engine(settings.database_url_async)
+    try:
+        async with engine.connect() as connection:
+            print(f"{'chave':<6} {'linhas/s':>10} {'índice MB':>10}")
+            for name, make_id in (("uuid4", uuid4), ("uuid7", uuid7)):
+                rate, size = await _run(
+                    connection, f"bench_{name}", make_id, rows, batch
+                )
+                print(f"{name:<6} {rate:>10.0f} {size / 1024 / 1024:>10.1f}")
+            await connection.rollback()
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--batch", type=int, default=1000)
+    args = parser.parse_args()
+    asyncio.run(main_async(args.rows, args.batch))
+
+
+if __name__ == "__main__":
+    main()
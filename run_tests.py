@@ -2,6 +2,11 @@ import subprocess
 import sys
 import time
 
+COMPOSE = (
+    "docker compose -f docker-tests.yml -f docker-redis.yml "
+    "-f docker-redis-shards.yml"
+)
+
 
 def run(cmd, check=True):
     print(f">>> Executando: {cmd}")
@@ -43,14 +48,14 @@ def wait_for_db_health(container, timeout=60):
 
 
 def main():
-    run("docker compose -f docker-tests.yml -f docker-redis.yml down -v")
-    run("docker compose -f docker-tests.yml -f docker-redis.yml up -d")
+    run(f"{COMPOSE} down -v")
+    run(f"{COMPOSE} up -d")
     wait_for_db_health("test-postgres")
 
     exit_code = run("pytest tests/", check=False)
 
     print("🧹 Finalizando containers...")
-    run("docker compose -f docker-tests.yml -f docker-redis.yml down -v")
+    run(f"{COMPOSE} down -v")
 
     sys.exit(exit_code)
 
@@ -0,0 +1,175 @@
+from uuid import uuid4
+
+import pytest
+from faker import Faker
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.models.user_model import UserModel
+from app.repositories import user_read_repository
+from app.repositories.user_repository import (
+    _LOGIN_BY_EMAIL,
+    UserRepository,
+    _exists_by,
+    _find_conflicts,
+    _select_user,
+)
+from tests.helpers import (
+    explain,
+    has_seq_scan,
+    plan_nodes,
+    scanned_indexes,
+)
+
+faker = Faker()
+
+
+@pytest.mark.anyio
+class TestCaseInsensitiveLookups:
+    @pytest.fixture(autouse=True)
+    def setup(self, async_session: AsyncSession):
+        self.db = async_session
+        self.repository = UserRepository(async_session)
+
+    async def _add_user(self, **kwargs) -> UserModel:
+        data = {
+            "name": faker.name(),
+            "username": faker.unique.user_name(),
+            "email": faker.unique.email(),
+            "hashed_password": faker.sha256(),
+        }
+        data.update(kwargs)
+        user = UserModel(**data)
+        self.db.add(user)
+        await self.db.commit()
+        return user
+
+    async def test_get_by_email_ignores_case(self):
+        user = await self._add_user(email="Foo.Bar@Example.com")
+
+        found = await self.repository.get_by_email("foo.bar@example.COM")
+
+        assert found.id == user.id
+
+    async def test_find_conflicts_ignores_case(self):
+        await self._add_user(username="Ragnar", email="ragnar@vik.com")
+
+        taken = await self.repository.find_conflicts(
+            "ragnar", "RAGNAR@vik.com"
+        )
+
+        assert taken == (True, True)
+
+    async def test_unique_ignores_case(self):
+        await self._add_user(email="dup@example.com")
+
+        with pytest.raises(IntegrityError):
+            await self._add_user(email="DUP@example.com")
+
+    @pytest.mark.parametrize(
+        "stmt, params, index",
+        [
+            (
+                _select_user("email", None, True),
+                {"email": "a@b.com"},
+                "ux_users_lower_email_login",
+            ),
+            (
+                _select_user("username", None, False),
+                {"username": "Ragnar"},
+                "ux_users_lower_username",
+            ),
+            (
+                _exists_by(("email",)),
+                {"email": "a@b.com"},
+                "ux_users_lower_email_login",
+            ),
+            (
+                user_read_repository._BY_EMAIL,
+                {"email": "a@b.com"},
+                "ux_users_lower_email_login",
+            ),
+            (
+                user_read_repository._BY_EMAILS,
+                {"emails": ["a@b.com", "C@d.com"]},
+                "ux_users_lower_email_login",
+            ),
+        ],
+    )
+    async def test_lookup_uses_lower_index(self, stmt, params, index):
+        await self._add_user()
+
+        plan = await explain(self.db, stmt, params)
+
+        assert index in scanned_indexes(plan), plan
+        assert not has_seq_scan(plan), plan
+
+    async def test_find_conflicts_uses_both_indexes(self):
+        plan = await explain(
+            self.db,
+            _find_conflicts(True, True, False),
+            {"username": "ragnar", "email": "a@b.com"},
+        )
+
+        assert {
+            "ux_users_lower_username",
+            "ux_users_lower_email_login",
+        } <= scanned_indexes(plan), plan
+        assert not has_seq_scan(plan), plan
+
+    async def test_get_login_by_email_success_narrow_row(self):
+        user = await self._add_user(email="Login@Example.com")
+
+        row = await self.repository.get_login_by_email("login@example.com")
+
+        assert row.id == user.id
+        assert row.hashed_password == user.hashed_password
+        assert set(row._fields) == {
+            "id",
+            "name",
+            "username",
+            "email",
+            "is_master",
+            "hashed_password",
+        }
+
+    async def test_login_lookup_is_index_only(self, engine: AsyncEngine):
+        user = await self._add_user()
+        # Index Only Scan depende das páginas all-visible no visibility map
+        async with engine.connect() as connection:
+            connection = await connection.execution_options(
+                isolation_level="AUTOCOMMIT"
+            )
+            await connection.exec_driver_sql("VACUUM (ANALYZE) users")
+
+        plan = await explain(
+            self.db,
+            _LOGIN_BY_EMAIL,
+            {"email": user.email.upper()},
+            # enable_indexscan também desliga Index Only Scan: fica ligado
+            disable=("seqscan", "bitmapscan"),
+            analyze=True,
+        )
+
+        scans = [node for node in plan_nodes(plan) if "Index Name" in node]
+        assert [node["Node Type"] for node in scans] == ["Index Only Scan"]
+        assert scans[0]["Index Name"] == "ux_users_lower_email_login"
+        assert scans[0]["Heap Fetches"] == 0, plan
+
+    async def test_search_uses_trigram_index(self):
+        await self._add_user(name="Drizzt Do'Urden")
+
+        plan = await explain(
+            self.db,
+            user_read_repository._SEARCHES[True],
+            {
+                "term": "urden",
+                "pattern": "%urden%",
+                "limit": 10,
+                "after_score": 1.0,
+                "after_id": uuid4(),
+            },
+        )
+
+        assert "ix_users_search_trgm" in scanned_indexes(plan), plan
+        assert not has_seq_scan(plan), plan
@@ -3,10 +3,15 @@ from uuid import UUID
 
 import pytest
 from faker import Faker
-from sqlalchemy.exc import IntegrityError, StatementError
+from sqlalchemy.exc import (
+    IntegrityError,
+    InvalidRequestError,
+    StatementError,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user_model import UserModel
+from app.repositories.user_repository import UserRepository
 
 faker = Faker()
 
@@ -108,6 +113,20 @@ class TestUserModel:
             await self.db.commit()
         assert user.id is None
 
+    @pytest.mark.parametrize(
+        "field,max_octets", [("email", 254), ("hashed_password", 512)]
+    )
+    async def test_create_user_failure_exceed_max_octets(
+        self, field, max_octets
+    ):
+        # Cabe no varchar, mas estouraria a linha do índice de login
+        data = self._make_data(**{field: "a" * (max_octets + 1)})
+        user = UserModel(**data)
+
+        self.db.add(user)
+        await self._assert_commit_raises_integrity()
+        assert user.id is None
+
     async def test_create_user_default_is_master_false(self):
         data = self._make_data()
         data.pop("is_master", None)
@@ -117,3 +136,36 @@ class TestUserModel:
         await self.db.commit()
         await self.db.refresh(user)
         assert user.is_master is False
+
+    async def test_hashed_password_not_loaded_by_default(self):
+        data = self._make_data()
+        user = UserModel(**data)
+        self.db.add(user)
+        await self.db.commit()
+        self.db.expunge_all()
+
+        repository = UserRepository(self.db)
+        loaded = await repository.get_by_id(user.id)
+        with pytest.raises(InvalidRequestError):
+            loaded.hashed_password
+
+        self.db.expunge_all()
+        loaded = await repository.get_by_id(user.id, with_password=True)
+        assert loaded.hashed_password == data["hashed_password"]
+
+    async def test_projection_loads_only_requested_columns(self):
+        user = UserModel(**self._make_data())
+        self.db.add(user)
+        await self.db.commit()
+        self.db.expunge_all()
+
+        repository = UserRepository(self.db)
+        loaded = await repository.get_by_email(
+            user.email, columns={"username", "hashed_password"}
+        )
+
+        assert loaded.username == user.username
+        with pytest.raises(InvalidRequestError):
+            loaded.name
+        with pytest.raises(InvalidRequestError):
+            loaded.hashed_password
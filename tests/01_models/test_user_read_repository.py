@@ -0,0 +1,97 @@
+import pytest
+from faker import Faker
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.user_model import UserModel
+from app.repositories.user_read_repository import UserReadRepository
+from app.schemas.user_schema import UserRead
+
+faker = Faker()
+
+
+@pytest.mark.anyio
+class TestUserReadRepository:
+    @pytest.fixture(autouse=True)
+    def setup(self, async_session: AsyncSession):
+        self.db = async_session
+        self.repository = UserReadRepository(async_session)
+
+    async def _add_users(self, count: int):
+        users = [
+            UserModel(
+                name=faker.name(),
+                username=faker.unique.user_name(),
+                email=faker.unique.email(),
+                hashed_password=faker.sha256(),
+            )
+            for _ in range(count)
+        ]
+        self.db.add_all(users)
+        await self.db.commit()
+        self.db.expunge_all()
+        return users
+
+    async def test_get_by_id_success_returns_row(self):
+        (user,) = await self._add_users(1)
+
+        row = await self.repository.get_by_id(user.id)
+
+        assert isinstance(row, Row)
+        assert UserRead.model_validate(row).username == user.username
+        assert "hashed_password" not in row._fields
+        # Nada entrou no identity map da sessão
+        assert not list(self.db.identity_map.values())
+
+    async def test_get_by_email_failure_nonexistent(self):
+        assert await self.repository.get_by_email(faker.email()) is None
+
+    async def test_get_by_ids_success_batch(self):
+        users = await self._add_users(3)
+
+        rows = await self.repository.get_by_ids([u.id for u in users])
+
+        assert {row.id for row in rows} == {u.id for u in users}
+
+    async def test_get_page_success_keyset(self):
+        await self._add_users(5)
+
+        first = await self.repository.get_page(3)
+        rest = await self.repository.get_page(
+            3, (first[-1].created_at, first[-1].id)
+        )
+        newest = await self.repository.get_page(1, descending=True)
+
+        keys = [(row.created_at, row.id) for row in first + rest]
+        assert len(keys) == 5
+        assert keys == sorted(keys)
+        assert newest[0].id == rest[-1].id
+
+    async def test_search_success_ranked_keyset(self):
+        names = ["Drizzt Do'Urden", "Drizzt", "Zaknafein Do'Urden"]
+        self.db.add_all(
+            UserModel(
+                name=name,
+                username=faker.unique.user_name(),
+                email=faker.unique.email(),
+                hashed_password=faker.sha256(),
+            )
+            for name in names
+        )
+        await self.db.commit()
+
+        first = await self.repository.search("do'urden", 1)
+        rest = await self.repository.search(
+            "do'urden", 10, (first[0].score, first[0].id)
+        )
+        rows = first + rest
+
+        assert sorted(row.name for row in rows) == sorted([names[0], names[2]])
+        assert [row.score for row in rows] == sorted(
+            (row.score for row in rows), reverse=True
+        )
+
+    async def test_search_escapes_wildcards(self):
+        await self._add_users(2)
+
+        assert await self.repository.search("%_%", 10) == []
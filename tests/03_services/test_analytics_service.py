@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+from faker import Faker
+from redis.asyncio import Redis
+
+from app.services import analytics_service
+from app.services.analytics_service import AnalyticsService
+
+faker = Faker()
+
+
+@pytest.mark.anyio
+class TestAnalyticsService:
+    @pytest.fixture
+    async def service(self, async_redis: Redis) -> AnalyticsService:
+        await async_redis.flushdb()
+        return AnalyticsService(async_redis)
+
+    async def _flush(self):
+        async with asyncio.timeout(1):
+            await analytics_service.activity_buffer.flush()
+
+    async def test_assign_offset_success_stable_and_dense(
+        self, service: AnalyticsService
+    ):
+        first = faker.uuid4(cast_to=None)
+        second = faker.uuid4(cast_to=None)
+
+        assert await service.assign_offset(first) == 0
+        assert await service.assign_offset(second) == 1
+        assert await service.assign_offset(first) == 0
+
+    async def test_get_active_users_success(self, service: AnalyticsService):
+        users = [faker.uuid4(cast_to=None) for _ in range(5)]
+        for user_id in users:
+            offset = await service.assign_offset(user_id)
+            for _ in range(3):
+                service.track_activity(
+                    faker.uuid4(cast_to=None), user_id, offset
+                )
+        await self._flush()
+
+        stats = await service.get_active_users()
+
+        assert stats.daily_active_users == 5
+        assert stats.weekly_active_users == 5
+        assert stats.monthly_active_users == 5
+        assert stats.daily_active_users_exact == 5
+        assert stats.concurrent_sessions == 15
+
+    async def test_get_active_users_success_empty(
+        self, service: AnalyticsService
+    ):
+        stats = await service.get_active_users()
+
+        assert stats.daily_active_users == 0
+        assert stats.concurrent_sessions == 0
+
+    async def test_track_activity_success_single_pipeline(
+        self, service: AnalyticsService, monkeypatch
+    ):
+        pipelines = []
+        pipeline = service.redis.pipeline
+
+        def spy(*args, **kwargs):
+            pipelines.append(pipeline(*args, **kwargs))
+            return pipelines[-1]
+
+        monkeypatch.setattr(service.redis, "pipeline", spy)
+        for _ in range(15):
+            service.track_activity(
+                faker.uuid4(cast_to=None), faker.uuid4(cast_to=None)
+            )
+        await self._flush()
+
+        assert len(pipelines) == 1
+        assert (await service.get_active_users()).concurrent_sessions == 15
+
+    async def test_track_activity_failure_buffer_full_counted(
+        self, service: AnalyticsService, monkeypatch
+    ):
+        buffer = analytics_service.activity_buffer
+        monkeypatch.setattr(buffer, "max_size", 2)
+        dropped = buffer.dropped_total
+
+        for _ in range(3):
+            service.track_activity(
+                faker.uuid4(cast_to=None), faker.uuid4(cast_to=None)
+            )
+        await self._flush()
+
+        assert buffer.dropped_total == dropped + 1
+        assert (await service.get_active_users()).concurrent_sessions == 2
@@ -0,0 +1,98 @@
+import pytest
+from faker import Faker
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.settings import settings
+from app.models.user_model import UserModel
+from app.services.availability_service import AvailabilityService
+
+faker = Faker()
+
+
+@pytest.mark.anyio
+class TestAvailabilityService:
+    @pytest.fixture
+    async def service(
+        self, async_session: AsyncSession, async_redis: Redis, monkeypatch
+    ):
+        monkeypatch.setattr(settings, "availability_filter_bits", 2**16)
+        svc = AvailabilityService(async_session, async_redis)
+        await async_redis.delete(svc.filter_key)
+        try:
+            yield svc
+        finally:
+            await async_redis.delete(svc.filter_key)
+
+    async def _add_user(self, session: AsyncSession) -> UserModel:
+        user = UserModel(
+            name=faker.name(),
+            username=faker.unique.user_name(),
+            email=faker.unique.email(),
+            hashed_password="hash",
+        )
+        session.add(user)
+        await session.commit()
+        return user
+
+    async def test_check_success_without_filter_uses_database(
+        self, async_session, service: AvailabilityService
+    ):
+        user = await self._add_user(async_session)
+
+        result = await service.check(user.username, faker.unique.email())
+
+        assert result.username is False
+        assert result.email is True
+
+    async def test_might_exist_success_after_rebuild(
+        self, async_session, service: AvailabilityService
+    ):
+        user = await self._add_user(async_session)
+
+        assert await service.rebuild() == 1
+
+        assert await service.might_exist("username", user.username.upper())
+        assert await service.might_exist("email", user.email)
+        assert not await service.might_exist("email", faker.unique.email())
+
+    async def test_check_success_filter_hit_confirmed_in_database(
+        self, async_session, service: AvailabilityService
+    ):
+        user = await self._add_user(async_session)
+        await service.rebuild()
+
+        result = await service.check(user.username, user.email)
+
+        assert result.username is False
+        assert result.email is False
+
+    async def test_add_success_marks_values(
+        self, service: AvailabilityService
+    ):
+        await service.rebuild()
+        username = faker.unique.user_name()
+
+        await service.add(username=username)
+
+        assert await service.might_exist("username", username)
+
+    async def test_add_success_ignored_without_filter(
+        self, async_redis: Redis, service: AvailabilityService
+    ):
+        await service.add(username=faker.unique.user_name())
+
+        assert not await async_redis.exists(service.filter_key)
+
+    async def test_check_success_deleted_user_available(
+        self, async_session, service: AvailabilityService
+    ):
+        user = await self._add_user(async_session)
+        await service.rebuild()
+        await async_session.delete(user)
+        await async_session.commit()
+
+        result = await service.check(user.username, None)
+
+        assert result.username is True
+        assert result.email is None
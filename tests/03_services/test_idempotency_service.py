@@ -0,0 +1,129 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+from pydantic import BaseModel
+from redis.asyncio import Redis
+
+from app.core.settings import settings
+from app.exceptions import (
+    DuplicateEmailError,
+    IdempotencyKeyReusedError,
+    InvalidIdempotencyKeyError,
+)
+from app.services.idempotency_service import IdempotencyService
+
+
+class Result(BaseModel):
+    value: int
+
+
+@pytest.mark.anyio
+class TestIdempotencyService:
+    @pytest.fixture
+    def service(self, async_redis: Redis) -> IdempotencyService:
+        return IdempotencyService(async_redis)
+
+    def _counter(self, delay: float = 0):
+        calls = []
+
+        async def func() -> Result:
+            calls.append(1)
+            await asyncio.sleep(delay)
+            return Result(value=len(calls))
+
+        return calls, func
+
+    async def test_run_success_without_key(self, service: IdempotencyService):
+        calls, func = self._counter()
+        await service.run("op", "anonymous", None, {}, Result, func)
+        await service.run("op", "anonymous", None, {}, Result, func)
+
+        assert len(calls) == 2
+
+    async def test_run_success_replays_stored_result(
+        self, service: IdempotencyService
+    ):
+        calls, func = self._counter()
+        key = str(uuid4())
+
+        first = await service.run("op", "anonymous", key, {}, Result, func)
+        second = await service.run("op", "anonymous", key, {}, Result, func)
+
+        assert first == second
+        assert len(calls) == 1
+
+    async def test_run_success_concurrent_duplicates_wait(
+        self, service: IdempotencyService
+    ):
+        calls, func = self._counter(delay=0.2)
+        key = str(uuid4())
+
+        results = await asyncio.gather(
+            *(
+                service.run("op", "anonymous", key, {}, Result, func)
+                for _ in range(3)
+            )
+        )
+
+        assert len(calls) == 1
+        assert all(result.value == 1 for result in results)
+
+    async def test_run_success_failure_releases_key(
+        self, service: IdempotencyService
+    ):
+        key = str(uuid4())
+
+        async def fail() -> Result:
+            raise DuplicateEmailError("a@a.com")
+
+        with pytest.raises(DuplicateEmailError):
+            await service.run("op", "anonymous", key, {}, Result, fail)
+
+        calls, func = self._counter()
+        await service.run("op", "anonymous", key, {}, Result, func)
+        assert len(calls) == 1
+
+    async def test_run_failure_key_reused_with_other_payload(
+        self, service: IdempotencyService
+    ):
+        _, func = self._counter()
+        key = str(uuid4())
+
+        await service.run("op", "anonymous", key, {"a": 1}, Result, func)
+        with pytest.raises(IdempotencyKeyReusedError):
+            await service.run("op", "anonymous", key, {"a": 2}, Result, func)
+
+    async def test_run_failure_invalid_key(self, service: IdempotencyService):
+        _, func = self._counter()
+        with pytest.raises(InvalidIdempotencyKeyError):
+            await service.run("op", "anonymous", "x" * 129, {}, Result, func)
+
+    async def test_run_failure_key_reused_with_other_password(
+        self, service: IdempotencyService
+    ):
+        calls, func = self._counter()
+        key = str(uuid4())
+        payload = {"current_password": "Senh@123", "new_password": "Nov@1234"}
+
+        await service.run("op", "user", key, payload, Result, func)
+        with pytest.raises(IdempotencyKeyReusedError):
+            await service.run(
+                "op",
+                "user",
+                key,
+                {**payload, "new_password": "Outr@1234"},
+                Result,
+                func,
+            )
+        assert len(calls) == 1
+
+    async def test_fingerprint_success_keyed_hmac(
+        self, service: IdempotencyService, monkeypatch
+    ):
+        payload = {"new_password": "Nov@1234"}
+        before = service.fingerprint(payload)
+
+        monkeypatch.setattr(settings, "secret_key", "outra-chave")
+
+        assert service.fingerprint(payload) != before
@@ -0,0 +1,75 @@
+import pytest
+from faker import Faker
+from redis.asyncio import Redis
+
+from app.core.settings import settings
+from app.exceptions import TooManyLoginAttemptsError
+from app.services.login_throttle_service import LoginThrottleService
+
+faker = Faker()
+
+
+@pytest.mark.anyio
+class TestLoginThrottleService:
+    @pytest.fixture
+    def service(self, async_redis: Redis, monkeypatch) -> LoginThrottleService:
+        monkeypatch.setattr(settings, "login_max_attempts_per_email", 3)
+        monkeypatch.setattr(settings, "login_max_attempts_per_ip", 5)
+        monkeypatch.setattr(settings, "login_lockout_base_seconds", 60)
+        return LoginThrottleService(async_redis)
+
+    async def test_check_success_below_limit(
+        self, service: LoginThrottleService
+    ):
+        email = faker.email()
+        for _ in range(3):
+            await service.check(email, faker.ipv4())
+
+    async def test_check_failure_email_limit(
+        self, service: LoginThrottleService
+    ):
+        email = faker.email()
+        for _ in range(3):
+            await service.check(email, faker.ipv4())
+
+        with pytest.raises(TooManyLoginAttemptsError) as exc_info:
+            await service.check(email.upper(), faker.ipv4())
+
+        assert exc_info.value.extensions["retry_after"] == 60
+
+    async def test_check_failure_ip_limit(self, service: LoginThrottleService):
+        ip = faker.ipv4()
+        for _ in range(5):
+            await service.check(faker.email(), ip)
+
+        with pytest.raises(TooManyLoginAttemptsError):
+            await service.check(faker.email(), ip)
+
+    async def test_check_failure_lockout_doubles(
+        self, async_redis: Redis, service: LoginThrottleService
+    ):
+        email = faker.email()
+        for _ in range(3):
+            await service.check(email, None)
+        with pytest.raises(TooManyLoginAttemptsError):
+            await service.check(email, None)
+
+        await async_redis.delete(service._key_for_lock("email", email))
+        for _ in range(3):
+            await service.check(email, None)
+
+        with pytest.raises(TooManyLoginAttemptsError) as exc_info:
+            await service.check(email, None)
+
+        assert exc_info.value.extensions["retry_after"] == 120
+
+    async def test_reset_success_clears_attempts(
+        self, service: LoginThrottleService
+    ):
+        email = faker.email()
+        for _ in range(3):
+            await service.check(email, None)
+
+        await service.reset(email)
+
+        await service.check(email, None)
@@ -0,0 +1,90 @@
+import pytest
+from faker import Faker
+from passlib.hash import bcrypt
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.settings import Settings
+from app.models.user_model import UserModel
+from app.services.password_migration_service import PasswordMigrationService
+from app.utils import security
+
+faker = Faker()
+
+PASSWORD = "Senh@123"
+
+
+@pytest.mark.anyio
+class TestPasswordMigrationService:
+    @pytest.fixture(autouse=True)
+    def fast_context(self, monkeypatch):
+        context = security.build_context(
+            Settings(password_schemes=["bcrypt", "scrypt"], bcrypt_rounds=5)
+        )
+        monkeypatch.setattr(security, "pwd_context", context)
+
+    async def _add_user(self, session: AsyncSession, hashed: str) -> UserModel:
+        user = UserModel(
+            name=faker.name(),
+            username=faker.unique.user_name(),
+            email=faker.unique.email(),
+            hashed_password=hashed,
+        )
+        session.add(user)
+        await session.commit()
+        return user
+
+    async def test_run_success_report_only(self, async_session):
+        await self._add_user(
+            async_session, bcrypt.using(rounds=4).hash(PASSWORD)
+        )
+        await self._add_user(async_session, security.hash_password(PASSWORD))
+
+        service = PasswordMigrationService(async_session, batch_size=1)
+        report = await service.run()
+
+        assert report.total == 2
+        assert report.stale == 1
+        assert report.wrapped == 0
+        assert report.by_scheme == {("bcrypt", 4): 1, ("bcrypt", 5): 1}
+
+    async def test_run_success_wrap_stale_hashes(self, async_session):
+        weak = bcrypt.using(rounds=4).hash(PASSWORD)
+        user = await self._add_user(async_session, weak)
+
+        service = PasswordMigrationService(
+            async_session, batch_size=10, cpu_fraction=1
+        )
+        report = await service.run(wrap=True)
+
+        await async_session.refresh(user, ["hashed_password"])
+        assert report.wrapped == 1
+        assert user.hashed_password.startswith(security.WRAPPED_PREFIX)
+        assert weak not in user.hashed_password
+        assert security.verify_password(PASSWORD, user.hashed_password)
+        assert not security.verify_password("Senh@124", user.hashed_password)
+        assert security.needs_rehash(user.hashed_password)
+
+        report = await service.run(wrap=True)
+        assert report.by_scheme == {("wrapped_bcrypt", 4): 1}
+        assert report.wrapped == 0
+
+    async def test_run_success_hashes_outside_transaction(
+        self, async_session, monkeypatch
+    ):
+        for _ in range(2):
+            await self._add_user(
+                async_session, bcrypt.using(rounds=4).hash(PASSWORD)
+            )
+
+        service = PasswordMigrationService(async_session, batch_size=10)
+        in_transaction = []
+
+        async def throttled(func, *args):
+            in_transaction.append(async_session.in_transaction())
+            return func(*args)
+
+        monkeypatch.setattr(service, "_throttled", throttled)
+        report = await service.run(wrap=True)
+
+        assert report.wrapped == 2
+        assert in_transaction == [False, False]
@@ -5,7 +5,12 @@ from uuid import UUID
 import pytest
 from faker import Faker
 from pydantic import ValidationError
+from redis.exceptions import TimeoutError as RedisTimeoutError
 
+from app.core.circuit_breaker import CircuitOpenError
+from app.core.redis_cache import ClientSideCache, LocalTTLCache
+from app.exceptions import SessionStoreUnavailableError
+from app.schemas.session_schema import SessionRead
 from app.schemas.user_schema import UserRead
 from app.services.session_service import SessionService
 
@@ -40,15 +45,21 @@ class TestSessionService:
             is_master=False,
         )
 
-        redis_mock.setex = AsyncMock()
+        redis_mock.set = AsyncMock()
+        redis_mock.get = AsyncMock(return_value="3")
 
         session_id = await service.create_session(user)
 
         assert isinstance(session_id, UUID)
-        redis_mock.setex.assert_awaited_once_with(
+        redis_mock.get.assert_awaited_once_with(
+            service._key_for_user_version(user.id)
+        )
+        redis_mock.set.assert_awaited_once_with(
             service._key_for_session(session_id),
-            service.TIME_TO_SESSION,
-            json.dumps(user.model_dump(mode="json")),
+            json.dumps(
+                SessionRead(user=user, version=3).model_dump(mode="json")
+            ),
+            ex=service.TIME_TO_SESSION,
         )
 
     async def test_get_user_id_from_session_success(
@@ -62,43 +73,92 @@ class TestSessionService:
             is_master=False,
         )
 
-        redis_mock.get = AsyncMock(
-            return_value=json.dumps(user.model_dump(mode="json"))
+        redis_mock.getex = AsyncMock(
+            return_value=json.dumps(
+                SessionRead(user=user, version=2).model_dump(mode="json")
+            )
         )
 
-        redis_mock.expire = AsyncMock()
-
         session_id = faker.uuid4(cast_to=None)
         key = service._key_for_session(session_id)
         result = await service.get_user_id_from_session(session_id)
 
         assert isinstance(result, UserRead)
         assert result.id == user.id
-        redis_mock.get.assert_awaited_once_with(key)
-        redis_mock.expire.assert_awaited_once_with(
-            key, service.TIME_TO_SESSION
+        redis_mock.getex.assert_awaited_once_with(
+            key, ex=service.TIME_TO_SESSION
+        )
+
+    async def test_get_session_success(
+        self, redis_mock, service: SessionService
+    ):
+        user = UserRead(
+            id=faker.uuid4(cast_to=None),
+            name=faker.name(),
+            username=faker.first_name(),
+            email=faker.email(),
+            is_master=False,
+        )
+        record = SessionRead(user=user, version=5)
+
+        redis_mock.getex = AsyncMock(
+            return_value=json.dumps(record.model_dump(mode="json"))
+        )
+
+        result = await service.get_session(faker.uuid4(cast_to=None))
+
+        assert result == record
+
+    async def test_mark_write_success(
+        self, redis_mock, service: SessionService
+    ):
+        user = UserRead(
+            id=faker.uuid4(cast_to=None),
+            name=faker.name(),
+            username=faker.first_name(),
+            email=faker.email(),
+            is_master=False,
+        )
+        record = SessionRead(user=user, version=2, write_lsn=10)
+        redis_mock.getex = AsyncMock(
+            return_value=json.dumps(record.model_dump(mode="json"))
+        )
+        redis_mock.set = AsyncMock()
+        session_id = faker.uuid4(cast_to=None)
+
+        await service.mark_write(session_id, 5)
+        redis_mock.set.assert_not_awaited()
+
+        await service.mark_write(session_id, 20)
+        redis_mock.set.assert_awaited_once_with(
+            service._key_for_session(session_id),
+            json.dumps(
+                record.model_copy(update={"write_lsn": 20}).model_dump(
+                    mode="json"
+                )
+            ),
+            ex=service.TIME_TO_SESSION,
         )
 
     async def test_get_user_id_from_session_failure_not_found(
         self, redis_mock, service: SessionService
     ):
-        redis_mock.get = AsyncMock(return_value=None)
+        redis_mock.getex = AsyncMock(return_value=None)
 
         session_id = faker.uuid4(cast_to=None)
 
         result = await service.get_user_id_from_session(session_id)
 
         assert result is None
-        redis_mock.get.assert_awaited_once_with(
-            service._key_for_session(session_id)
+        redis_mock.getex.assert_awaited_once_with(
+            service._key_for_session(session_id), ex=service.TIME_TO_SESSION
         )
-        redis_mock.expire.assert_not_awaited()
 
     async def test_get_user_id_from_session_failure_invalid_schema(
         self, redis_mock, service: SessionService
     ):
-        redis_mock.get = AsyncMock(
-            return_value=json.dumps({"username": "ash"})
+        redis_mock.getex = AsyncMock(
+            return_value=json.dumps({"user": {"username": "ash"}})
         )
 
         session_id = faker.uuid4(cast_to=None)
@@ -106,8 +166,37 @@ class TestSessionService:
         with pytest.raises(ValidationError):
             await service.get_user_id_from_session(session_id)
 
+        redis_mock.getex.assert_awaited_once_with(
+            service._key_for_session(session_id), ex=service.TIME_TO_SESSION
+        )
+
+    async def test_get_user_version_success(
+        self, redis_mock, service: SessionService
+    ):
+        redis_mock.get = AsyncMock(return_value="7")
+        user_id = faker.uuid4(cast_to=None)
+
+        assert await service.get_user_version(user_id) == 7
         redis_mock.get.assert_awaited_once_with(
-            service._key_for_session(session_id)
+            service._key_for_user_version(user_id)
+        )
+
+    async def test_get_user_version_success_missing_key(
+        self, redis_mock, service: SessionService
+    ):
+        redis_mock.get = AsyncMock(return_value=None)
+
+        assert await service.get_user_version(faker.uuid4(cast_to=None)) == 0
+
+    async def test_bump_user_version_success(
+        self, redis_mock, service: SessionService
+    ):
+        redis_mock.incr = AsyncMock(return_value=1)
+        user_id = faker.uuid4(cast_to=None)
+
+        assert await service.bump_user_version(user_id) == 1
+        redis_mock.incr.assert_awaited_once_with(
+            service._key_for_user_version(user_id)
         )
 
     async def test_delete_session_success(
@@ -138,3 +227,78 @@ class TestSessionService:
             service._key_for_session(session_id)
         )
         redis_mock.delete.assert_not_awaited()
+
+    async def test_get_session_success_from_client_cache(self, redis_mock):
+        user = UserRead(
+            id=faker.uuid4(cast_to=None),
+            name=faker.name(),
+            username=faker.first_name(),
+            email=faker.email(),
+            is_master=False,
+        )
+        record = json.dumps(
+            SessionRead(user=user, version=0).model_dump(mode="json")
+        )
+
+        cache = ClientSideCache(prefixes=("session:",))
+        cache._active = True
+        service = SessionService(redis_mock, cache)
+
+        redis_mock.get = AsyncMock(return_value=record)
+        redis_mock.getex = AsyncMock()
+
+        session_id = faker.uuid4(cast_to=None)
+        first = await service.get_session(session_id)
+        second = await service.get_session(session_id)
+
+        assert first == second
+        redis_mock.get.assert_awaited_once_with(
+            service._key_for_session(session_id)
+        )
+        redis_mock.getex.assert_not_awaited()
+        assert cache.stats.hits == 1
+
+    async def test_get_user_version_success_missing_key_cached(
+        self, redis_mock
+    ):
+        cache = ClientSideCache(prefixes=("user_version:",))
+        cache._active = True
+        service = SessionService(redis_mock, cache)
+        redis_mock.get = AsyncMock(return_value=None)
+
+        user_id = faker.uuid4(cast_to=None)
+        assert await service.get_user_version(user_id) == 0
+        assert await service.get_user_version(user_id) == 0
+
+        redis_mock.get.assert_awaited_once()
+        assert not cache._pending
+
+    async def test_get_session_failure_redis_unavailable(
+        self, redis_mock, service: SessionService
+    ):
+        redis_mock.getex = AsyncMock(side_effect=CircuitOpenError())
+
+        with pytest.raises(SessionStoreUnavailableError):
+            await service.get_session(faker.uuid4(cast_to=None))
+
+    async def test_get_session_success_local_fallback(self, redis_mock):
+        user = UserRead(
+            id=faker.uuid4(cast_to=None),
+            name=faker.name(),
+            username=faker.first_name(),
+            email=faker.email(),
+            is_master=False,
+        )
+        service = SessionService(redis_mock, fallback=LocalTTLCache())
+
+        redis_mock.get = AsyncMock(return_value="0")
+        redis_mock.set = AsyncMock()
+        session_id = await service.create_session(user)
+
+        redis_mock.getex = AsyncMock(side_effect=RedisTimeoutError())
+        result = await service.get_session(session_id)
+
+        assert result == SessionRead(user=user, version=0)
+
+        with pytest.raises(SessionStoreUnavailableError):
+            await service.get_session(faker.uuid4(cast_to=None))
@@ -0,0 +1,74 @@
+import os
+from typing import AsyncGenerator, Dict
+
+import pytest
+from faker import Faker
+from redis.asyncio import Redis
+
+from app.core.redis import ShardedRedis, node_name
+from app.schemas.user_schema import UserRead
+from app.services.session_service import SessionService
+
+faker = Faker()
+
+SHARD_URLS = os.getenv(
+    "TEST_REDIS_SHARD_URLS",
+    "redis://localhost:6380,redis://localhost:6381,redis://localhost:6382",
+).split(",")
+
+
+@pytest.mark.anyio
+class TestSessionSharding:
+    @pytest.fixture
+    async def shards(self) -> AsyncGenerator[ShardedRedis, None]:
+        clients: Dict[str, Redis] = {
+            node_name(url): Redis.from_url(url, decode_responses=True)
+            for url in SHARD_URLS
+        }
+        try:
+            for client in clients.values():
+                await client.flushdb()
+            yield ShardedRedis(clients)
+        finally:
+            for client in clients.values():
+                await client.aclose()
+
+    def make_user(self) -> UserRead:
+        return UserRead(
+            id=faker.uuid4(cast_to=None),
+            name=faker.name(),
+            username=faker.first_name(),
+            email=faker.email(),
+            is_master=False,
+        )
+
+    async def test_create_session_success_routed_to_single_shard(
+        self, async_redis, shards: ShardedRedis
+    ):
+        service = SessionService(async_redis, shards=shards)
+
+        session_ids = [
+            await service.create_session(self.make_user()) for _ in range(30)
+        ]
+
+        used = set()
+        for session_id in session_ids:
+            key = service._key_for_session(session_id)
+            owner = shards.ring.get_node(key)
+            used.add(owner)
+            for node, client in shards.clients.items():
+                assert bool(await client.exists(key)) == (node == owner)
+
+            assert await service.get_session(session_id) is not None
+
+        assert len(used) > 1
+
+    async def test_delete_session_success_on_owner_shard(
+        self, async_redis, shards: ShardedRedis
+    ):
+        service = SessionService(async_redis, shards=shards)
+        session_id = await service.create_session(self.make_user())
+
+        await service.delete_session(session_id)
+
+        assert await service.get_session(session_id) is None
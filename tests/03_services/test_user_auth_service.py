@@ -4,7 +4,11 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from faker import Faker
 
-from app.exceptions import InvalidCredentialsError, UserNotFoundError
+from app.exceptions import (
+    InvalidCredentialsError,
+    TooManyLoginAttemptsError,
+    UserNotFoundError,
+)
 from app.models.user_model import UserModel
 from app.schemas.user_schema import UserChangePassword, UserLogin, UserRead
 from app.services.user_auth_service import UserAuthService
@@ -30,6 +34,7 @@ class TestUserAuthService:
         repository.refresh = AsyncMock()
         repository.get_by_id = AsyncMock()
         repository.delete = AsyncMock()
+        repository.replace_hashed_password = AsyncMock(return_value=True)
         return repository
 
     @pytest.fixture
@@ -75,8 +80,8 @@ class TestUserAuthService:
         user_model = self.mock_user_model(**data)
         user_login = UserLogin(email=data["email"], password=data["password"])
 
-        repository_mock.get_by_email = AsyncMock()
-        repository_mock.get_by_email.return_value = user_model
+        repository_mock.get_login_by_email = AsyncMock()
+        repository_mock.get_login_by_email.return_value = user_model
 
         service.session.commit = AsyncMock()
 
@@ -93,9 +98,74 @@ class TestUserAuthService:
         expected = UserRead.model_validate(user_model)
         assert result.model_dump() == expected.model_dump()
 
-        repository_mock.get_by_email.assert_awaited_once_with(user_login.email)
+        repository_mock.get_login_by_email.assert_awaited_once_with(
+            user_login.email
+        )
+        service.session.commit.assert_awaited_once()
+
+    async def test_login_user_success_rehash_deprecated_hash(
+        self, repository_mock, service: UserAuthService
+    ):
+        data = self.make_data()
+        user_model = self.mock_user_model(**data)
+        user_login = UserLogin(email=data["email"], password=data["password"])
+
+        repository_mock.get_login_by_email = AsyncMock(return_value=user_model)
+
+        with (
+            patch.object(security, "verify_password", return_value=True),
+            patch.object(security, "needs_rehash", return_value=True),
+            patch.object(
+                security, "hash_password", return_value="upgraded_hash"
+            ) as mock_hash,
+        ):
+            await service.login_user(user_login)
+
+        mock_hash.assert_called_once_with(user_login.password)
+        repository_mock.replace_hashed_password.assert_awaited_once_with(
+            user_model.id, "fake_hashed", "upgraded_hash"
+        )
         service.session.commit.assert_awaited_once()
 
+    async def test_login_user_success_keeps_current_hash(
+        self, repository_mock, service: UserAuthService
+    ):
+        data = self.make_data()
+        user_model = self.mock_user_model(**data)
+        user_login = UserLogin(email=data["email"], password=data["password"])
+
+        repository_mock.get_login_by_email = AsyncMock(return_value=user_model)
+
+        with (
+            patch.object(security, "verify_password", return_value=True),
+            patch.object(security, "needs_rehash", return_value=False),
+            patch.object(security, "hash_password") as mock_hash,
+        ):
+            await service.login_user(user_login)
+
+        mock_hash.assert_not_called()
+        repository_mock.replace_hashed_password.assert_not_awaited()
+
+    async def test_login_user_failure_throttled_before_lookup(
+        self, repository_mock, service: UserAuthService
+    ):
+        user_login = UserLogin(
+            email=faker.email(), password=self.strong_password()
+        )
+        service.throttle = AsyncMock()
+        service.throttle.check.side_effect = TooManyLoginAttemptsError(60)
+        repository_mock.get_login_by_email = AsyncMock()
+
+        with patch.object(security, "verify_password") as mock_verify:
+            with pytest.raises(TooManyLoginAttemptsError):
+                await service.login_user(user_login, client_ip="10.0.0.1")
+
+        service.throttle.check.assert_awaited_once_with(
+            user_login.email, "10.0.0.1"
+        )
+        repository_mock.get_login_by_email.assert_not_awaited()
+        mock_verify.assert_not_called()
+
     async def test_login_user_failure_nonexistent_user(
         self, repository_mock, service: UserAuthService
     ):
@@ -105,13 +175,15 @@ class TestUserAuthService:
 
         service.session.rollback = AsyncMock()
 
-        repository_mock.get_by_email = AsyncMock()
-        repository_mock.get_by_email.return_value = None
+        repository_mock.get_login_by_email = AsyncMock()
+        repository_mock.get_login_by_email.return_value = None
 
         with pytest.raises(UserNotFoundError):
             await service.login_user(user_login)
 
-        repository_mock.get_by_email.assert_awaited_once_with(user_login.email)
+        repository_mock.get_login_by_email.assert_awaited_once_with(
+            user_login.email
+        )
         service.session.rollback.assert_awaited_once()
 
     async def test_login_user_failure_invalid_password(
@@ -123,8 +195,8 @@ class TestUserAuthService:
 
         service.session.rollback = AsyncMock()
 
-        repository_mock.get_by_email = AsyncMock()
-        repository_mock.get_by_email.return_value = user_model
+        repository_mock.get_login_by_email = AsyncMock()
+        repository_mock.get_login_by_email.return_value = user_model
 
         with patch.object(
             security, "verify_password", return_value=False
@@ -136,7 +208,9 @@ class TestUserAuthService:
             user_login.password, user_model.hashed_password
         )
 
-        repository_mock.get_by_email.assert_awaited_once_with(user_login.email)
+        repository_mock.get_login_by_email.assert_awaited_once_with(
+            user_login.email
+        )
         service.session.rollback.assert_awaited_once()
 
     async def test_login_user_failure_propagate_generic_error(
@@ -149,16 +223,18 @@ class TestUserAuthService:
         service.session.rollback = AsyncMock()
         service.session.commit = AsyncMock()
         service.session.flush = AsyncMock()
-        repository_mock.get_by_email = AsyncMock()
+        repository_mock.get_login_by_email = AsyncMock()
 
-        repository_mock.get_by_email.side_effect = Exception(
+        repository_mock.get_login_by_email.side_effect = Exception(
             "unexpected error"
         )
 
         with pytest.raises(Exception, match="unexpected error"):
             await service.login_user(user_login)
 
-        repository_mock.get_by_email.assert_awaited_once_with(user_login.email)
+        repository_mock.get_login_by_email.assert_awaited_once_with(
+            user_login.email
+        )
         service.session.rollback.assert_awaited_once()
         service.session.commit.assert_not_awaited()
         service.session.flush.assert_not_awaited()
@@ -201,11 +277,37 @@ class TestUserAuthService:
         )
         mock_hash.assert_called_once_with(user_change_pass.new_password)
 
-        repository_mock.get_by_id.assert_awaited_once_with(user_model.id)
+        repository_mock.get_by_id.assert_awaited_once_with(
+            user_model.id, with_password=True
+        )
         service.session.flush.assert_awaited_once()
         service.session.commit.assert_awaited_once()
         repository_mock.refresh.assert_awaited_once_with(user_model)
 
+    async def test_change_password_success_bumps_user_version(
+        self, repository_mock, service: UserAuthService
+    ):
+        user_model = self.mock_user_model(**self.make_data())
+        repository_mock.get_by_id = AsyncMock(return_value=user_model)
+
+        service.session_service = AsyncMock()
+
+        with patch.object(security, "verify_password", return_value=True):
+            with patch.object(
+                security, "hash_password", return_value="new_hashed"
+            ):
+                await service.change_password(
+                    user_model.id,
+                    UserChangePassword(
+                        current_password=self.strong_password(),
+                        new_password=self.strong_password(),
+                    ),
+                )
+
+        service.session_service.bump_user_version.assert_awaited_once_with(
+            user_model.id
+        )
+
     async def test_change_password_failure_nonexistent_user(
         self, repository_mock, service: UserAuthService
     ):
@@ -224,7 +326,9 @@ class TestUserAuthService:
         with pytest.raises(UserNotFoundError):
             await service.change_password(user_id, user_change_pass)
 
-        repository_mock.get_by_id.assert_awaited_once_with(user_id)
+        repository_mock.get_by_id.assert_awaited_once_with(
+            user_id, with_password=True
+        )
         service.session.commit.assert_not_awaited()
         service.session.rollback.assert_awaited_once()
 
@@ -253,7 +357,9 @@ class TestUserAuthService:
             user_change_pass.current_password, user_model.hashed_password
         )
 
-        repository_mock.get_by_id.assert_awaited_once_with(user_model.id)
+        repository_mock.get_by_id.assert_awaited_once_with(
+            user_model.id, with_password=True
+        )
         service.session.commit.assert_not_awaited()
         service.session.rollback.assert_awaited_once()
 
@@ -276,7 +382,9 @@ class TestUserAuthService:
         with pytest.raises(Exception, match="unexpected error"):
             await service.change_password(user_id, user_change_pass)
 
-        repository_mock.get_by_id.assert_awaited_once_with(user_id)
+        repository_mock.get_by_id.assert_awaited_once_with(
+            user_id, with_password=True
+        )
         service.session.flush.assert_not_awaited()
         service.session.commit.assert_not_awaited()
         service.session.rollback.assert_awaited_once()
@@ -0,0 +1,115 @@
+import json
+from uuid import uuid4
+
+import pytest
+from faker import Faker
+from redis.asyncio import Redis
+
+from app.repositories import user_cache
+from app.repositories.user_cache import UserCache, user_version_key
+from app.schemas.user_schema import UserRead
+
+faker = Faker()
+
+
+@pytest.mark.anyio
+class TestUserCache:
+    @pytest.fixture
+    def cache(self, async_redis: Redis) -> UserCache:
+        return UserCache(async_redis)
+
+    def _user(self) -> UserRead:
+        return UserRead(
+            id=uuid4(),
+            name=faker.name(),
+            username=faker.user_name(),
+            email=faker.email(),
+            is_master=False,
+        )
+
+    def _loader(self, user):
+        calls = []
+
+        async def load():
+            calls.append(1)
+            return user
+
+        return calls, load
+
+    async def test_get_or_load_success_read_through(self, cache: UserCache):
+        user = self._user()
+        calls, load = self._loader(user)
+
+        assert await cache.get_or_load(user.id, load, local=False) == user
+        assert await cache.get_or_load(user.id, load, local=False) == user
+
+        assert len(calls) == 1
+
+    async def test_get_or_load_success_local_hit(self, cache: UserCache):
+        user = self._user()
+        calls, load = self._loader(user)
+        hits = user_cache.user_cache_stats.local_hits
+
+        await cache.get_or_load(user.id, load)
+        await cache.get_or_load(user.id, load)
+
+        assert len(calls) == 1
+        assert user_cache.user_cache_stats.local_hits == hits + 1
+
+    async def test_get_or_load_version_bump_misses(
+        self, cache: UserCache, async_redis: Redis
+    ):
+        user = self._user()
+        calls, load = self._loader(user)
+
+        await cache.get_or_load(user.id, load, local=False)
+        await async_redis.incr(user_version_key(user.id))
+        await cache.get_or_load(user.id, load, local=False)
+
+        assert len(calls) == 2
+
+    async def test_get_or_load_no_store(self, cache: UserCache):
+        user = self._user()
+        calls, load = self._loader(user)
+
+        await cache.get_or_load(user.id, load, store=False, local=False)
+        await cache.get_or_load(user.id, load, store=False, local=False)
+
+        assert len(calls) == 2
+
+    async def test_get_or_load_early_refresh_near_expiry(
+        self, cache: UserCache, async_redis: Redis
+    ):
+        user = self._user()
+        calls, load = self._loader(user)
+        await cache.get_or_load(user.id, load, local=False)
+
+        key = cache._key(user.id)
+        record = json.loads(await async_redis.get(key))
+        record["expires_at"] = record["stored_at"]
+        await async_redis.set(key, json.dumps(record))
+
+        await cache.get_or_load(user.id, load, local=False)
+
+        assert len(calls) == 2
+
+    async def test_invalidate_success(self, cache: UserCache):
+        user = self._user()
+        calls, load = self._loader(user)
+
+        await cache.get_or_load(user.id, load)
+        await cache.invalidate(user.id)
+        await cache.get_or_load(user.id, load)
+
+        assert len(calls) == 2
+
+    async def test_metrics_success(self, cache: UserCache):
+        user = self._user()
+        _, load = self._loader(user)
+        await cache.get_or_load(user.id, load)
+        await cache.get_or_load(user.id, load)
+
+        metrics = user_cache.metrics()
+
+        assert metrics["hit_rate"] > 0
+        assert metrics["served_age_avg"] >= 0
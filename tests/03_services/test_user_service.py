@@ -3,12 +3,12 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from faker import Faker
-from sqlalchemy.exc import IntegrityError
 
 from app.exceptions import (
     DuplicateEmailError,
     DuplicateUsernameError,
     InvalidCredentialsError,
+    SessionStoreUnavailableError,
     UserNotFoundError,
 )
 from app.models.user_model import UserModel
@@ -41,6 +41,9 @@ class TestUserService:
         repository.refresh = AsyncMock()
         repository.get_by_id = AsyncMock()
         repository.delete = AsyncMock()
+        repository.find_conflicts = AsyncMock(return_value=(False, False))
+        repository.insert_if_absent = AsyncMock()
+        repository.update_if_absent = AsyncMock()
         return repository
 
     @pytest.fixture
@@ -84,12 +87,7 @@ class TestUserService:
     ):
         user_create = UserCreate(**self.make_data())
         user_model = self.mock_user_model(**user_create.model_dump())
-
-        async def refresh_side_effect(user):
-            user.id = user_model.id
-            user.is_master = user_model.is_master
-
-        repository_mock.refresh.side_effect = refresh_side_effect
+        repository_mock.insert_if_absent.return_value = user_model
 
         with patch.object(
             security, "hash_password", return_value=user_model.hashed_password
@@ -101,14 +99,19 @@ class TestUserService:
         assert isinstance(result, UserRead)
         expected = UserRead.model_validate(user_model)
         assert result.model_dump() == expected.model_dump()
-        repository_mock.add.assert_awaited_once()
+        repository_mock.insert_if_absent.assert_awaited_once_with(
+            name=user_create.name,
+            username=user_create.username,
+            email=user_create.email,
+            hashed_password=user_model.hashed_password,
+        )
 
     @pytest.mark.parametrize(
         "override",
         [
-            {"orig": "ix_users_email", "error_class": DuplicateEmailError},
+            {"conflicts": (False, True), "error_class": DuplicateEmailError},
             {
-                "orig": "ix_users_username",
+                "conflicts": (True, False),
                 "error_class": DuplicateUsernameError,
             },
         ],
@@ -117,26 +120,58 @@ class TestUserService:
         self, override, repository_mock, service: UserService
     ):
         user_create = UserCreate(**self.make_data())
-
-        repository_mock.add.side_effect = IntegrityError(
-            statement="INSERT INTO users ...",
-            params={},
-            orig=Exception(
-                f'duplicate key value violates unique constraint "{override["orig"]}"'
-            ),
-        )
+        repository_mock.find_conflicts.return_value = override["conflicts"]
 
         service.session.rollback = AsyncMock()
 
-        with pytest.raises(override["error_class"]) as exc_info:
-            await service.create_user(user_create)
+        with patch.object(security, "hash_password") as mock_hash:
+            with pytest.raises(override["error_class"]) as exc_info:
+                await service.create_user(user_create)
 
+        mock_hash.assert_not_called()
+        repository_mock.insert_if_absent.assert_not_awaited()
         service.session.rollback.assert_awaited_once()
 
-        assert {
-            "ix_users_email": user_create.email,
-            "ix_users_username": user_create.username,
-        }[override["orig"]] in str(exc_info.value)
+        expected = (
+            user_create.email
+            if override["error_class"] is DuplicateEmailError
+            else user_create.username
+        )
+        assert expected in str(exc_info.value)
+
+    async def test_create_user_failure_duplicated_after_check(
+        self, repository_mock, service: UserService
+    ):
+        user_create = UserCreate(**self.make_data())
+        repository_mock.find_conflicts.side_effect = [
+            (False, False),
+            (False, True),
+        ]
+        repository_mock.insert_if_absent.return_value = None
+
+        with patch.object(security, "hash_password", return_value="hash"):
+            with pytest.raises(DuplicateEmailError):
+                await service.create_user(user_create)
+
+        repository_mock.insert_if_absent.assert_awaited_once()
+
+    async def test_create_user_success_hashes_outside_transaction(
+        self, session_mock, repository_mock, service: UserService
+    ):
+        user_create = UserCreate(**self.make_data())
+        user_model = self.mock_user_model(**user_create.model_dump())
+        repository_mock.insert_if_absent.return_value = user_model
+        calls = []
+        session_mock.commit.side_effect = lambda: calls.append("commit")
+
+        def hash_password(password):
+            calls.append("hash")
+            return user_model.hashed_password
+
+        with patch.object(security, "hash_password", hash_password):
+            await service.create_user(user_create)
+
+        assert calls == ["commit", "hash", "commit"]
 
     async def test_update_user_success_all_fields(
         self, repository_mock, service: UserService
@@ -151,12 +186,12 @@ class TestUserService:
 
         repository_mock.get_by_id.return_value = user_model
 
-        async def refresh_side_effect(user):
-            user.name = user_update.name
-            user.username = user_update.username
-            user.email = user_update.email
+        async def update_side_effect(user_id, **values):
+            for key, value in values.items():
+                setattr(user_model, key, value)
+            return user_model
 
-        repository_mock.refresh.side_effect = refresh_side_effect
+        repository_mock.update_if_absent.side_effect = update_side_effect
 
         with patch.object(
             security, "verify_password", return_value=True
@@ -172,7 +207,7 @@ class TestUserService:
         assert result.username == user_update.username
         assert result.email == user_update.email
         assert result.is_master == user_model.is_master
-        repository_mock.refresh.assert_awaited_once()
+        repository_mock.update_if_absent.assert_awaited_once()
 
     @pytest.mark.parametrize(
         "kwargs",
@@ -187,16 +222,16 @@ class TestUserService:
     ):
         user_model = self.mock_user_model(**self.make_data())
         user_update = UserUpdate(password="Senh@123", **kwargs)
+        original_data = UserRead.model_validate(user_model).model_dump()
 
         repository_mock.get_by_id.return_value = user_model
 
-        async def refresh_side_effect(user):
-            for key, value in user_update.model_dump(
-                exclude_unset=True
-            ).items():
-                setattr(user, key, value)
+        async def update_side_effect(user_id, **values):
+            for key, value in values.items():
+                setattr(user_model, key, value)
+            return user_model
 
-        repository_mock.refresh.side_effect = refresh_side_effect
+        repository_mock.update_if_absent.side_effect = update_side_effect
 
         with patch.object(
             security, "verify_password", return_value=True
@@ -210,7 +245,6 @@ class TestUserService:
         assert isinstance(result, UserRead)
 
         result_data = result.model_dump()
-        original_data = UserRead.model_validate(user_model).model_dump()
 
         for key, original_value in original_data.items():
             if key in kwargs:
@@ -218,7 +252,67 @@ class TestUserService:
             else:
                 assert result_data[key] == original_value
 
-        repository_mock.refresh.assert_awaited_once()
+        repository_mock.update_if_absent.assert_awaited_once_with(
+            user_model.id, **kwargs
+        )
+
+    async def test_update_user_success_bumps_user_version(
+        self, repository_mock, service: UserService
+    ):
+        user_model = self.mock_user_model(**self.make_data())
+        repository_mock.get_by_id.return_value = user_model
+        repository_mock.update_if_absent.return_value = user_model
+
+        service.session_service = AsyncMock()
+        service.cache = AsyncMock()
+
+        with patch.object(security, "verify_password", return_value=True):
+            await service.update_user(
+                user_model.id, UserUpdate(password="Senh@123", username="Red")
+            )
+
+        service.session_service.bump_user_version.assert_awaited_once_with(
+            user_model.id
+        )
+        service.cache.invalidate.assert_awaited_once_with(user_model.id)
+
+    async def test_update_user_success_session_store_down(
+        self, repository_mock, service: UserService
+    ):
+        user_model = self.mock_user_model(**self.make_data())
+        repository_mock.get_by_id.return_value = user_model
+        repository_mock.update_if_absent.return_value = user_model
+
+        service.session_service = AsyncMock()
+        service.session_service.bump_user_version.side_effect = (
+            SessionStoreUnavailableError()
+        )
+
+        with patch.object(security, "verify_password", return_value=True):
+            result = await service.update_user(
+                user_model.id, UserUpdate(password="Senh@123", username="Red")
+            )
+
+        # O UPDATE já foi confirmado: a falha do Redis não vira erro
+        assert result.id == user_model.id
+        service.session.commit.assert_awaited_once()
+
+    async def test_update_user_failure_invalid_password_keeps_version(
+        self, repository_mock, service: UserService
+    ):
+        user_model = self.mock_user_model(**self.make_data())
+        repository_mock.get_by_id.return_value = user_model
+
+        service.session_service = AsyncMock()
+
+        with patch.object(security, "verify_password", return_value=False):
+            with pytest.raises(InvalidCredentialsError):
+                await service.update_user(
+                    user_model.id,
+                    UserUpdate(password="Senh@123", username="Red"),
+                )
+
+        service.session_service.bump_user_version.assert_not_awaited()
 
     async def test_update_user_failure_nonexistent_user(
         self, repository_mock, service: UserService
@@ -232,7 +326,9 @@ class TestUserService:
         with pytest.raises(UserNotFoundError):
             await service.update_user(user_id, data)
 
-        repository_mock.get_by_id.assert_awaited_once_with(user_id)
+        repository_mock.get_by_id.assert_awaited_once_with(
+            user_id, with_password=True
+        )
         service.session.rollback.assert_awaited_once()
 
     async def test_update_user_failure_invalid_password(
@@ -255,15 +351,17 @@ class TestUserService:
             user_update.password, user_model.hashed_password
         )
 
-        repository_mock.get_by_id.assert_awaited_once_with(user_model.id)
+        repository_mock.get_by_id.assert_awaited_once_with(
+            user_model.id, with_password=True
+        )
         service.session.rollback.assert_awaited_once()
 
     @pytest.mark.parametrize(
         "override",
         [
-            {"orig": "ix_users_email", "error_class": DuplicateEmailError},
+            {"conflicts": (False, True), "error_class": DuplicateEmailError},
             {
-                "orig": "ix_users_username",
+                "conflicts": (True, False),
                 "error_class": DuplicateUsernameError,
             },
         ],
@@ -281,15 +379,7 @@ class TestUserService:
         )
 
         repository_mock.get_by_id.return_value = user_model
-
-        service.session.flush = AsyncMock()
-        service.session.flush.side_effect = IntegrityError(
-            statement="UPDATE users ...",
-            params={},
-            orig=Exception(
-                f'duplicate key value violates unique constraint "{override["orig"]}"'
-            ),
-        )
+        repository_mock.find_conflicts.return_value = override["conflicts"]
 
         service.session.rollback = AsyncMock()
 
@@ -303,13 +393,18 @@ class TestUserService:
             user_update.password, user_model.hashed_password
         )
 
-        service.session.flush.assert_awaited_once()
+        repository_mock.find_conflicts.assert_awaited_once_with(
+            user_update.username, user_update.email, user_model.id
+        )
+        repository_mock.update_if_absent.assert_not_awaited()
         service.session.rollback.assert_awaited_once()
 
-        assert {
-            "ix_users_email": getattr(user_update, "email", ""),
-            "ix_users_username": getattr(user_update, "username", ""),
-        }[override["orig"]] in str(exc_info.value)
+        expected = (
+            user_update.email
+            if override["error_class"] is DuplicateEmailError
+            else user_update.username
+        )
+        assert expected in str(exc_info.value)
 
     async def test_get_user_by_id_success(
         self, repository_mock, service: UserService
@@ -326,9 +421,97 @@ class TestUserService:
         expected = UserRead.model_validate(user_model)
         assert result.model_dump() == expected.model_dump()
 
-        repository_mock.get_by_id.assert_awaited_once_with(user_model.id)
+        repository_mock.get_by_id.assert_awaited_once_with(
+            user_model.id, columns=None
+        )
         service.session.commit.assert_awaited_once()
 
+    async def test_get_user_by_id_success_projected(
+        self, repository_mock, service: UserService
+    ):
+        user_model = self.mock_user_model(**self.make_data())
+        repository_mock.get_by_id.return_value = user_model
+
+        result = await service.get_user_by_id(user_model.id, {"username"})
+
+        assert result.id == user_model.id
+        assert result.username == user_model.username
+        assert result.model_fields_set == {"id", "username"}
+        repository_mock.get_by_id.assert_awaited_once_with(
+            user_model.id, columns={"username"}
+        )
+
+    async def test_get_user_by_id_success_from_cache(
+        self, repository_mock, service: UserService
+    ):
+        user = UserRead(
+            id=faker.uuid4(cast_to=None),
+            name=faker.name(),
+            username=faker.first_name(),
+            email=faker.email(),
+            is_master=False,
+        )
+        service.cache = AsyncMock()
+        service.cache.get_or_load.return_value = user
+
+        result = await service.get_user_by_id(user.id, {"username"})
+
+        assert result == user
+        repository_mock.get_by_id.assert_not_awaited()
+
+    def cache_loading(self) -> AsyncMock:
+        cache = AsyncMock()
+
+        async def get_or_load(user_id, load, store=True):
+            return await load()
+
+        cache.get_or_load.side_effect = get_or_load
+        return cache
+
+    async def test_get_user_by_id_success_cache_miss_loads_full_row(
+        self, repository_mock, service: UserService
+    ):
+        # O registro vai para o cache e precisa servir a qualquer seleção
+        user_model = self.mock_user_model(**self.make_data())
+        repository_mock.get_by_id.return_value = user_model
+        service.cache = self.cache_loading()
+
+        result = await service.get_user_by_id(user_model.id, {"username"})
+
+        assert result.model_dump() == (
+            UserRead.model_validate(user_model).model_dump()
+        )
+        repository_mock.get_by_id.assert_awaited_once_with(
+            user_model.id, columns=None
+        )
+        assert service.cache.get_or_load.call_args.kwargs["store"] is True
+
+    async def test_get_user_by_id_success_cache_miss_replica_projected(
+        self, service: UserService
+    ):
+        user_model = self.mock_user_model(**self.make_data())
+        replica_repository = MagicMock()
+        replica_repository.get_by_id = AsyncMock(return_value=user_model)
+        service._replica_repository = replica_repository
+        service.cache = self.cache_loading()
+
+        result = await service.get_user_by_id(user_model.id, {"username"})
+
+        assert result.model_fields_set == {"id", "username"}
+        replica_repository.get_by_id.assert_awaited_once_with(
+            user_model.id, columns={"username"}
+        )
+        assert service.cache.get_or_load.call_args.kwargs["store"] is False
+
+    async def test_read_repository_uses_replica_session(self, session_mock):
+        replica = AsyncMock()
+
+        with_replica = UserService(session_mock, read_session=replica)
+        primary_only = UserService(session_mock, read_session=session_mock)
+
+        assert with_replica.read_repository.session is replica
+        assert primary_only.read_repository is primary_only.repository
+
     async def test_get_user_by_id_failure_nonexistent_user(
         self, repository_mock, service: UserService
     ):
@@ -341,7 +524,9 @@ class TestUserService:
         with pytest.raises(UserNotFoundError):
             await service.get_user_by_id(user_id)
 
-        repository_mock.get_by_id.assert_awaited_once_with(user_id)
+        repository_mock.get_by_id.assert_awaited_once_with(
+            user_id, columns=None
+        )
         service.session.rollback.assert_awaited_once()
 
     async def test_delete_user_success(
@@ -367,6 +552,24 @@ class TestUserService:
         repository_mock.delete.assert_awaited_once_with(user_model)
         service.session.flush.assert_awaited_once()
 
+    async def test_delete_user_success_bumps_user_version(
+        self, repository_mock, service: UserService
+    ):
+        user_model = self.mock_user_model(**self.make_data())
+        repository_mock.get_by_id.return_value = user_model
+        repository_mock.update_if_absent.return_value = user_model
+
+        service.session_service = AsyncMock()
+
+        with patch.object(security, "verify_password", return_value=True):
+            await service.delete_user(
+                user_model.id, UserDelete(password="Senh@123")
+            )
+
+        service.session_service.bump_user_version.assert_awaited_once_with(
+            user_model.id
+        )
+
     async def test_delete_user_failure_nonexistent_user(
         self, repository_mock, service: UserService
     ):
@@ -380,7 +583,9 @@ class TestUserService:
         with pytest.raises(UserNotFoundError):
             await service.delete_user(user_id, user_delete)
 
-        repository_mock.get_by_id.assert_awaited_once_with(user_id)
+        repository_mock.get_by_id.assert_awaited_once_with(
+            user_id, with_password=True
+        )
         service.session.rollback.assert_awaited_once()
 
     async def test_delete_user_failure_invalid_password(
@@ -403,7 +608,9 @@ class TestUserService:
             user_delete.password, user_model.hashed_password
         )
 
-        repository_mock.get_by_id.assert_awaited_once_with(user_model.id)
+        repository_mock.get_by_id.assert_awaited_once_with(
+            user_model.id, with_password=True
+        )
         service.session.rollback.assert_awaited_once()
 
     @pytest.mark.parametrize(
@@ -450,6 +657,7 @@ class TestUserService:
 
         repository_mock.get_by_id.side_effect = side_effect
         repository_mock.add.side_effect = side_effect
+        repository_mock.insert_if_absent.side_effect = side_effect
         repository_mock.delete.side_effect = side_effect
         service.session.flush.side_effect = side_effect
 
@@ -459,4 +667,6 @@ class TestUserService:
             await method(*args)
 
         service.session.rollback.assert_awaited_once()
-        service.session.commit.assert_not_awaited()
+        # create_user encerra a checagem de duplicatas antes do bcrypt
+        expected_commits = 1 if method_name == "create_user" else 0
+        assert service.session.commit.await_count == expected_commits
@@ -10,6 +10,14 @@ from app.graphql.context import Context
 from app.main import app
 
 
+@pytest.fixture(autouse=True)
+async def clear_login_throttle(async_redis: Redis):
+    """Zera o limite de logins: todas as requisições saem do mesmo IP"""
+    keys = [key async for key in async_redis.scan_iter(match="login_*")]
+    if keys:
+        await async_redis.delete(*keys)
+
+
 @pytest.fixture
 async def graphql_client() -> AsyncGenerator[AsyncClient, None]:
     transport = ASGITransport(app=app)
@@ -0,0 +1,57 @@
+from uuid import UUID
+
+import pytest
+from sqlalchemy import update
+
+from app.models.user_model import UserModel
+from tests.utils.base_graphql_test import TestGraphQLWithUser
+
+ACTIVE_USERS_FIELDS = (
+    "dailyActiveUsers weeklyActiveUsers monthlyActiveUsers "
+    "dailyActiveUsersExact concurrentSessions"
+)
+
+
+@pytest.mark.anyio
+class TestAnalyticsQuery(TestGraphQLWithUser):
+    async def test_active_users_success(
+        self,
+        graphql_client,
+        graphql_context,
+        fixture_create_user,
+        fixture_login_user,
+    ):
+        user = await fixture_create_user(graphql_client)
+        await graphql_context.session.execute(
+            update(UserModel)
+            .where(UserModel.id == UUID(user["id"]))
+            .values(is_master=True)
+        )
+        await graphql_context.session.commit()
+        await fixture_login_user(graphql_client, user)
+
+        query = self.build_query("activeUsers", ACTIVE_USERS_FIELDS)
+        response = await self.graphql_success(graphql_client, query)
+
+        data = response["activeUsers"]
+        assert data["dailyActiveUsers"] >= 1, data
+        assert data["concurrentSessions"] >= 1, data
+
+    async def test_active_users_failure_not_master(
+        self, graphql_client, fixture_create_user, fixture_login_user
+    ):
+        user = await fixture_create_user(graphql_client)
+        await fixture_login_user(graphql_client, user)
+
+        query = self.build_query("activeUsers", ACTIVE_USERS_FIELDS)
+        response = await self.graphql_expect_error(graphql_client, query)
+
+        assert response[0]["code"] == "MasterPermissionRequiredError"
+
+    async def test_active_users_failure_not_authenticated(
+        self, graphql_client
+    ):
+        query = self.build_query("activeUsers", ACTIVE_USERS_FIELDS)
+        response = await self.graphql_expect_error(graphql_client, query)
+
+        assert response[0]["code"] == "PermissionDeniedError", response
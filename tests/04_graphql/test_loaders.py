@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+from faker import Faker
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.graphql.loaders import UserLoaders, loader_metrics
+from app.models.user_model import UserModel
+from app.schemas.user_schema import UserRead
+
+faker = Faker()
+
+
+@pytest.mark.anyio
+class TestUserLoaders:
+    async def _add_users(self, session: AsyncSession, count: int):
+        users = [
+            UserModel(
+                name=faker.name(),
+                username=faker.unique.user_name(),
+                email=faker.unique.email(),
+                hashed_password="hash",
+            )
+            for _ in range(count)
+        ]
+        session.add_all(users)
+        await session.commit()
+        return users
+
+    async def test_by_id_success_single_batch(
+        self, async_session: AsyncSession
+    ):
+        users = await self._add_users(async_session, 3)
+        loaders = UserLoaders(async_session)
+        batches = loader_metrics.batches["user_by_id"]
+
+        results = await asyncio.gather(
+            *(loaders.by_id.load(user.id) for user in users),
+            loaders.by_id.load(faker.uuid4(cast_to=None)),
+        )
+
+        assert [r.id for r in results[:3]] == [u.id for u in users]
+        assert results[3] is None
+        assert loader_metrics.batches["user_by_id"] == batches + 1
+
+    async def test_by_email_success(self, async_session: AsyncSession):
+        (user,) = await self._add_users(async_session, 1)
+        loaders = UserLoaders(async_session)
+
+        result, other_case = await loaders.by_email.load_many(
+            [user.email, user.email.upper()]
+        )
+
+        assert result.id == other_case.id == user.id
+
+    async def test_prime_success_skips_database(
+        self, async_session: AsyncSession
+    ):
+        user = UserRead(
+            id=faker.uuid4(cast_to=None),
+            name=faker.name(),
+            username=faker.user_name(),
+            email=faker.email(),
+            is_master=False,
+        )
+        loaders = UserLoaders(async_session)
+        batches = loader_metrics.batches["user_by_id"]
+
+        loaders.prime(user)
+
+        assert await loaders.by_id.load(user.id) == user
+        assert await loaders.by_email.load(user.email) == user
+        assert loader_metrics.batches["user_by_id"] == batches
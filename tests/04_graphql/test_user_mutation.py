@@ -1,6 +1,7 @@
 import pytest
 from faker import Faker
 
+from app.core.settings import settings
 from app.utils.error_code import ErrorCode
 from tests.utils.base_graphql_test import TestGraphQLWithUser
 
@@ -125,6 +126,20 @@ class TestUserMutation(TestGraphQLWithUser):
         assert error["code"] == code_erro, response
         assert "".join(override.values()) in error["message"], response
 
+    async def test_create_user_success_idempotency_key_replays(
+        self, graphql_client
+    ):
+        mutation = self.mutation_create_user()
+        variables = {"input": self._input_create_user()}
+        graphql_client.headers["Idempotency-Key"] = faker.uuid4()
+
+        first = await self.graphql_success(graphql_client, mutation, variables)
+        second = await self.graphql_success(
+            graphql_client, mutation, variables
+        )
+
+        assert first["createUser"] == second["createUser"]
+
     async def test_login_user_success(
         self, graphql_client, fixture_create_user
     ):
@@ -163,6 +178,28 @@ class TestUserMutation(TestGraphQLWithUser):
         )
         assert response[0]["code"] == code_error, response
 
+    async def test_login_user_failure_too_many_attempts(
+        self, graphql_client, fixture_create_user
+    ):
+        user = await fixture_create_user(graphql_client)
+
+        mutation = self.mutation_login_user()
+        variables = {
+            "input": {"email": user["email"], "password": "Err@d0Senha"}
+        }
+
+        for _ in range(settings.login_max_attempts_per_email):
+            response = await self.graphql_expect_error(
+                graphql_client, mutation, variables
+            )
+            assert response[0]["code"] == "InvalidCredentialsError", response
+
+        variables["input"]["password"] = user["password"]
+        response = await self.graphql_expect_error(
+            graphql_client, mutation, variables
+        )
+        assert response[0]["code"] == "TooManyLoginAttemptsError", response
+
     @pytest.mark.parametrize("field", ["email", "password"])
     async def test_login_user_failure_missing_fields(
         self, graphql_client, fixture_create_user, field
@@ -2,7 +2,10 @@ from uuid import UUID
 
 import pytest
 from faker import Faker
+from sqlalchemy import update
 
+from app.core.settings import settings
+from app.models.user_model import UserModel
 from app.schemas.user_schema import UserDelete
 from app.utils.error_code import ErrorCode
 from tests.utils.base_graphql_test import TestGraphQLWithUser
@@ -27,6 +30,27 @@ class TestUserQuery(TestGraphQLWithUser):
         assert data["name"] == user["name"]
         assert data["email"] == user["email"]
 
+    async def test_me_success_after_user_version_bump(
+        self,
+        graphql_client,
+        fixture_create_user,
+        fixture_login_user,
+        graphql_context,
+    ):
+        user = await fixture_create_user(graphql_client)
+        await fixture_login_user(graphql_client, user)
+
+        await graphql_context.session_service.bump_user_version(
+            UUID(user["id"])
+        )
+
+        query = self.build_query(query_name="me", fields="id name email")
+        response = await self.graphql_success(graphql_client, query)
+        assert response["me"]["id"] == user["id"]
+
+        response = await self.graphql_success(graphql_client, query)
+        assert response["me"]["id"] == user["id"]
+
     async def test_me_failure_not_authenticated(self, graphql_client):
         query = self.build_query(query_name="me", fields="id name email")
         response = await self.graphql_expect_error(graphql_client, query, {})
@@ -103,3 +127,262 @@ class TestUserQuery(TestGraphQLWithUser):
         query = self.build_query(query_name="logout", fields="success")
         response = await self.graphql_expect_error(graphql_client, query)
         assert response[0]["code"] == "ExpiredSessionError", response
+
+    async def test_is_available_success(
+        self, graphql_client, fixture_create_user
+    ):
+        user = await fixture_create_user(graphql_client)
+        query = """
+            query IsAvailable($username: String, $email: String) {
+                isAvailable(username: $username, email: $email) {
+                    username
+                    email
+                }
+            }
+        """
+        variables = {"username": user["username"], "email": faker.email()}
+
+        response = await self.graphql_success(graphql_client, query, variables)
+
+        assert response["isAvailable"] == {"username": False, "email": True}
+
+    USERS_QUERY = """
+        query Users($first: Int, $after: String, $orderBy: UserOrderBy) {
+            users(first: $first, after: $after, orderBy: $orderBy) {
+                edges { cursor node { id username } }
+                pageInfo { hasNextPage endCursor }
+                totalCountEstimate
+            }
+        }
+    """
+
+    async def _login_master(
+        self, graphql_client, graphql_context, create_user, login_user
+    ):
+        user = await create_user(graphql_client)
+        await graphql_context.session.execute(
+            update(UserModel)
+            .where(UserModel.id == UUID(user["id"]))
+            .values(is_master=True)
+        )
+        await graphql_context.session.commit()
+        await login_user(graphql_client, user)
+        return user
+
+    async def test_users_success_paginates_without_gaps(
+        self,
+        graphql_client,
+        graphql_context,
+        fixture_create_user,
+        fixture_login_user,
+    ):
+        master = await self._login_master(
+            graphql_client,
+            graphql_context,
+            fixture_create_user,
+            fixture_login_user,
+        )
+        created = [master["id"]]
+        for _ in range(4):
+            created.append((await fixture_create_user(graphql_client))["id"])
+
+        seen, after = [], None
+        for _ in range(3):
+            response = await self.graphql_success(
+                graphql_client, self.USERS_QUERY, {"first": 2, "after": after}
+            )
+            page = response["users"]
+            seen += [edge["node"]["id"] for edge in page["edges"]]
+            after = page["pageInfo"]["endCursor"]
+            if not page["pageInfo"]["hasNextPage"]:
+                break
+
+        assert seen == created
+        assert page["totalCountEstimate"] >= 0
+
+    async def test_users_success_order_desc(
+        self,
+        graphql_client,
+        graphql_context,
+        fixture_create_user,
+        fixture_login_user,
+    ):
+        await self._login_master(
+            graphql_client,
+            graphql_context,
+            fixture_create_user,
+            fixture_login_user,
+        )
+        last = await fixture_create_user(graphql_client)
+
+        response = await self.graphql_success(
+            graphql_client,
+            self.USERS_QUERY,
+            {"first": 1, "orderBy": "CREATED_AT_DESC"},
+        )
+
+        page = response["users"]
+        assert page["edges"][0]["node"]["id"] == last["id"]
+        assert page["pageInfo"]["hasNextPage"] is True
+
+    @pytest.mark.parametrize(
+        "variables, code",
+        [
+            ({"first": 0}, "PageSizeOutOfRangeError"),
+            (
+                {"first": settings.users_page_max_size + 1},
+                "PageSizeOutOfRangeError",
+            ),
+            ({"after": "cursor-invalido"}, "InvalidCursorError"),
+        ],
+    )
+    async def test_users_failure_invalid_arguments(
+        self,
+        graphql_client,
+        graphql_context,
+        fixture_create_user,
+        fixture_login_user,
+        variables,
+        code,
+    ):
+        await self._login_master(
+            graphql_client,
+            graphql_context,
+            fixture_create_user,
+            fixture_login_user,
+        )
+
+        response = await self.graphql_expect_error(
+            graphql_client, self.USERS_QUERY, variables
+        )
+        assert response[0]["code"] == code, response
+
+    async def test_users_failure_not_master(
+        self, graphql_client, fixture_create_user, fixture_login_user
+    ):
+        user = await fixture_create_user(graphql_client)
+        await fixture_login_user(graphql_client, user)
+
+        response = await self.graphql_expect_error(
+            graphql_client, self.USERS_QUERY, {}
+        )
+        assert response[0]["code"] == "MasterPermissionRequiredError"
+
+    async def test_users_by_ids_success(
+        self,
+        graphql_client,
+        graphql_context,
+        fixture_create_user,
+        fixture_login_user,
+    ):
+        master = await self._login_master(
+            graphql_client,
+            graphql_context,
+            fixture_create_user,
+            fixture_login_user,
+        )
+        other = await fixture_create_user(graphql_client)
+        missing = faker.uuid4()
+        query = """
+            query UsersByIds($ids: [UUID!]!) {
+                usersByIds(ids: $ids) { id username }
+            }
+        """
+
+        response = await self.graphql_success(
+            graphql_client,
+            query,
+            {"ids": [other["id"], missing, master["id"]]},
+        )
+
+        users = response["usersByIds"]
+        assert users[0]["id"] == other["id"]
+        assert users[1] is None
+        assert users[2]["id"] == master["id"]
+
+    SEARCH_QUERY = """
+        query Search($term: String!, $first: Int, $after: String) {
+            searchUsers(term: $term, first: $first, after: $after) {
+                edges { cursor score node { id username } }
+                pageInfo { hasNextPage endCursor }
+            }
+        }
+    """
+
+    async def test_search_users_success(
+        self,
+        graphql_client,
+        graphql_context,
+        fixture_create_user,
+        fixture_login_user,
+    ):
+        await self._login_master(
+            graphql_client,
+            graphql_context,
+            fixture_create_user,
+            fixture_login_user,
+        )
+        target = await fixture_create_user(graphql_client)
+
+        response = await self.graphql_success(
+            graphql_client,
+            self.SEARCH_QUERY,
+            {"term": target["username"].upper()},
+        )
+
+        edges = response["searchUsers"]["edges"]
+        assert [edge["node"]["id"] for edge in edges] == [target["id"]]
+        assert 0 < edges[0]["score"] <= 1
+
+    @pytest.mark.parametrize(
+        "variables, code",
+        [
+            ({"term": "ab"}, "SearchTermTooShortError"),
+            ({"term": "   ab   "}, "SearchTermTooShortError"),
+            ({"term": "abc", "first": 0}, "PageSizeOutOfRangeError"),
+            (
+                {"term": "abc", "after": "cursor-invalido"},
+                "InvalidCursorError",
+            ),
+        ],
+    )
+    async def test_search_users_failure_invalid_arguments(
+        self,
+        graphql_client,
+        graphql_context,
+        fixture_create_user,
+        fixture_login_user,
+        variables,
+        code,
+    ):
+        await self._login_master(
+            graphql_client,
+            graphql_context,
+            fixture_create_user,
+            fixture_login_user,
+        )
+
+        response = await self.graphql_expect_error(
+            graphql_client, self.SEARCH_QUERY, variables
+        )
+        assert response[0]["code"] == code, response
+
+    async def test_me_success_projected_fields(
+        self, graphql_client, fixture_create_user, fixture_login_user
+    ):
+        user = await fixture_create_user(graphql_client)
+        await fixture_login_user(graphql_client, user)
+        query = """
+            query {
+                me { ...Identity __typename }
+            }
+            fragment Identity on UserType { id username }
+        """
+
+        response = await self.graphql_success(graphql_client, query)
+
+        assert response["me"] == {
+            "id": user["id"],
+            "username": user["username"],
+            "__typename": "UserType",
+        }
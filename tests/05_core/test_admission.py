@@ -0,0 +1,171 @@
+import asyncio
+from uuid import uuid4
+
+import orjson
+import pytest
+
+from app.core.admission import (
+    AdmissionController,
+    AdmissionControlMiddleware,
+    Priority,
+    classify,
+)
+
+
+class TestClassify:
+    def test_authenticated_query_is_high(self):
+        assert classify("query { me { id } }", True) == Priority.HIGH
+        assert classify("{ me { id } }", True) == Priority.HIGH
+
+    def test_anonymous_query_is_normal(self):
+        assert classify("query { me { id } }", False) == Priority.NORMAL
+
+    def test_login_and_create_user_are_low(self):
+        login = 'mutation { login(loginInput: {email: "a"}) { id } }'
+        create = (
+            "mutation Cria($d: UserCreateInput!) "
+            "{ createUser(data: $d) { id } }"
+        )
+        assert classify(login, False) == Priority.LOW
+        assert classify(create, True) == Priority.LOW
+
+    def test_other_mutations_are_normal(self):
+        query = "# login(\nmutation { updateUser(data: {}) { id } }"
+        assert classify(query, True) == Priority.NORMAL
+
+    def test_leading_comment_and_fragment_use_operation_type(self):
+        commented = "# senha fraca\nmutation { login(loginInput: {}) { id } }"
+        fragment_first = (
+            "fragment F on UserType { id }\n"
+            "mutation { createUser(data: {}) { ...F } }"
+        )
+        assert classify(commented, True) == Priority.LOW
+        assert classify(fragment_first, True) == Priority.LOW
+
+    def test_operation_name_selects_operation(self):
+        document = (
+            "query Me { me { id } }\n"
+            "mutation Entra { login(loginInput: {}) { id } }"
+        )
+        assert classify(document, True, "Me") == Priority.HIGH
+        assert classify(document, True, "Entra") == Priority.LOW
+        # Ambíguo sem operationName: o Strawberry recusa
+        assert classify(document, True) == Priority.NORMAL
+
+    def test_invalid_document_is_normal(self):
+        assert classify("{ me {", True) == Priority.NORMAL
+
+
+@pytest.mark.anyio
+class TestAdmissionController:
+    async def test_admits_until_cap_then_queues(self):
+        controller = AdmissionController(max_in_flight=1, queue_timeout=1)
+        assert await controller.acquire(Priority.HIGH)
+
+        waiter = asyncio.create_task(controller.acquire(Priority.LOW))
+        await asyncio.sleep(0)
+        assert controller.metrics()["queued"] == 1
+
+        controller.release()
+        assert await waiter
+        assert controller.metrics()["in_flight"] == 1
+
+    async def test_release_prefers_higher_priority(self):
+        controller = AdmissionController(max_in_flight=1, queue_timeout=1)
+        await controller.acquire(Priority.HIGH)
+
+        low = asyncio.create_task(controller.acquire(Priority.LOW))
+        await asyncio.sleep(0)
+        high = asyncio.create_task(controller.acquire(Priority.HIGH))
+        await asyncio.sleep(0)
+
+        controller.release()
+        assert await high
+        assert not low.done()
+
+        controller.release()
+        assert await low
+
+    async def test_full_queue_sheds_lower_priority(self):
+        controller = AdmissionController(
+            max_in_flight=1, max_queue=1, queue_timeout=1
+        )
+        await controller.acquire(Priority.HIGH)
+
+        low = asyncio.create_task(controller.acquire(Priority.LOW))
+        await asyncio.sleep(0)
+        high = asyncio.create_task(controller.acquire(Priority.HIGH))
+        await asyncio.sleep(0)
+
+        assert await low is False
+        assert not await controller.acquire(Priority.LOW)
+
+        controller.release()
+        assert await high
+        assert controller.metrics()["shed"] == 2
+
+    async def test_queue_timeout_rejects(self):
+        controller = AdmissionController(max_in_flight=1, queue_timeout=0.05)
+        await controller.acquire(Priority.HIGH)
+
+        assert not await controller.acquire(Priority.NORMAL)
+        assert controller.metrics()["timed_out"] == 1
+        assert controller.metrics()["queued"] == 0
+
+
+@pytest.mark.anyio
+class TestAdmissionControlMiddleware:
+    async def _call(self, middleware, body: bytes, headers=()):
+        sent = []
+
+        async def receive():
+            return {"type": "http.request", "body": body}
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {"type": "http", "path": "/graphql", "headers": list(headers)}
+        await middleware(scope, receive, send)
+        return sent
+
+    async def test_rejects_with_retry_after_when_overloaded(self):
+        controller = AdmissionController(max_in_flight=0, max_queue=0)
+
+        async def app(scope, receive, send):
+            raise AssertionError("não deveria chegar aqui")
+
+        middleware = AdmissionControlMiddleware(app, controller, retry_after=3)
+        sent = await self._call(middleware, b'{"query": "{ me { id } }"}')
+
+        assert sent[0]["status"] == 503
+        assert (b"retry-after", b"3") in sent[0]["headers"]
+        error = orjson.loads(sent[1]["body"])["errors"][0]
+        assert error["code"] == "ServiceOverloadedError"
+
+    async def test_replays_body_and_releases(self):
+        controller = AdmissionController(max_in_flight=1)
+        received = []
+
+        async def app(scope, receive, send):
+            received.append(await receive())
+
+        middleware = AdmissionControlMiddleware(app, controller)
+        body = b'{"query": "{ me { id } }"}'
+        await self._call(middleware, body)
+
+        assert received[0]["body"] == body
+        assert controller.metrics()["in_flight"] == 0
+
+    @pytest.mark.parametrize(
+        "cookie, expected",
+        [
+            (b"session=x", False),
+            (b"theme=dark; session=" + str(uuid4()).encode(), True),
+            (b"nosession=" + str(uuid4()).encode(), False),
+        ],
+    )
+    def test_has_session_requires_uuid_cookie(self, cookie, expected):
+        middleware = AdmissionControlMiddleware(None, AdmissionController())
+        scope = {"headers": [(b"cookie", cookie)]}
+
+        assert middleware._has_session(scope) is expected
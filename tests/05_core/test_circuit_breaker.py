@@ -0,0 +1,131 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from app.core.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+)
+
+
+async def _ok():
+    return "ok"
+
+
+async def _fail():
+    raise ConnectionError("down")
+
+
+async def _slow():
+    await asyncio.sleep(1)
+
+
+@pytest.mark.anyio
+class TestCircuitBreaker:
+    @pytest.fixture
+    def breaker(self) -> CircuitBreaker:
+        return CircuitBreaker(
+            failure_rate=0.5,
+            minimum_calls=4,
+            window_seconds=10,
+            open_seconds=5,
+            failure_exceptions=(ConnectionError,),
+        )
+
+    async def _trip(self, breaker: CircuitBreaker):
+        for _ in range(4):
+            with pytest.raises(ConnectionError):
+                await breaker.call(_fail())
+
+    async def test_call_success(self, breaker: CircuitBreaker):
+        assert await breaker.call(_ok()) == "ok"
+        assert breaker.state is CircuitState.CLOSED
+
+    async def test_call_failure_below_minimum_calls_keeps_closed(
+        self, breaker: CircuitBreaker
+    ):
+        for _ in range(3):
+            with pytest.raises(ConnectionError):
+                await breaker.call(_fail())
+
+        assert breaker.state is CircuitState.CLOSED
+
+    async def test_call_failure_opens_and_rejects(
+        self, breaker: CircuitBreaker
+    ):
+        await self._trip(breaker)
+
+        assert breaker.state is CircuitState.OPEN
+        with pytest.raises(CircuitOpenError):
+            await breaker.call(_ok())
+
+        metrics = breaker.metrics()
+        assert metrics["opened_total"] == 1
+        assert metrics["rejected_total"] == 1
+
+    async def test_call_failure_timeout_counts_as_failure(
+        self, breaker: CircuitBreaker
+    ):
+        with pytest.raises(TimeoutError):
+            await breaker.call(_slow(), timeout=0.01)
+
+        assert breaker.metrics()["window_failures"] == 1
+
+    async def test_call_failure_unrelated_error_not_counted(
+        self, breaker: CircuitBreaker
+    ):
+        async def _bug():
+            raise ValueError("bug")
+
+        with pytest.raises(ValueError):
+            await breaker.call(_bug())
+
+        assert breaker.metrics()["window_calls"] == 0
+
+    async def test_call_failure_ignored_error_not_counted(self):
+        class PoolFull(ConnectionError):
+            pass
+
+        async def _pool_full():
+            raise PoolFull("busy")
+
+        breaker = CircuitBreaker(
+            failure_exceptions=(ConnectionError,),
+            ignored_exceptions=(PoolFull,),
+        )
+
+        with pytest.raises(PoolFull):
+            await breaker.call(_pool_full())
+
+        assert breaker.metrics()["window_calls"] == 0
+
+    async def test_half_open_probe_success_closes(
+        self, breaker: CircuitBreaker
+    ):
+        await self._trip(breaker)
+
+        with patch(
+            "app.core.circuit_breaker.time.monotonic",
+            return_value=breaker._opened_at + 5,
+        ):
+            assert breaker.state is CircuitState.HALF_OPEN
+            assert await breaker.call(_ok()) == "ok"
+
+        assert breaker.state is CircuitState.CLOSED
+
+    async def test_half_open_probe_failure_reopens(
+        self, breaker: CircuitBreaker
+    ):
+        await self._trip(breaker)
+
+        with patch(
+            "app.core.circuit_breaker.time.monotonic",
+            return_value=breaker._opened_at + 5,
+        ):
+            with pytest.raises(ConnectionError):
+                await breaker.call(_fail())
+
+        assert breaker.state is CircuitState.OPEN
+        assert breaker.opened_total == 2
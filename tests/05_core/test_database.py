@@ -0,0 +1,48 @@
+from app.core.database import engine_options
+from app.core.settings import settings
+from app.repositories.user_repository import _find_conflicts, _select_user
+
+
+class TestEngineOptions:
+    def test_default_profile_uses_settings(self, monkeypatch):
+        monkeypatch.setattr(settings, "db_prepared_statement_cache_size", 7)
+        monkeypatch.setattr(settings, "db_statement_cache_size", 3)
+
+        connect_args = engine_options(pgbouncer=False)["connect_args"]
+
+        assert connect_args == {
+            "prepared_statement_cache_size": 7,
+            "statement_cache_size": 3,
+        }
+
+    def test_pgbouncer_profile_disables_prepares(self):
+        connect_args = engine_options(pgbouncer=True)["connect_args"]
+
+        assert connect_args["prepared_statement_cache_size"] == 0
+        assert connect_args["statement_cache_size"] == 0
+        name = connect_args["prepared_statement_name_func"]
+        assert name() != name()
+
+    def test_profile_follows_setting(self, monkeypatch):
+        monkeypatch.setattr(settings, "db_pgbouncer", True)
+
+        connect_args = engine_options()["connect_args"]
+
+        assert "prepared_statement_name_func" in connect_args
+
+
+class TestStatementCache:
+    def test_same_shape_reuses_statement(self):
+        assert _select_user("id", None, False) is _select_user(
+            "id", None, False
+        )
+        assert _find_conflicts(True, False, True) is _find_conflicts(
+            True, False, True
+        )
+
+    def test_projection_changes_statement(self):
+        full = _select_user("email", None, True)
+        projected = _select_user("email", frozenset({"id", "name"}), True)
+
+        assert full is not projected
+        assert full.compile().params == {"email": None}
@@ -0,0 +1,54 @@
+from collections import Counter
+
+import pytest
+
+from app.core.hash_ring import HashRing
+from app.core.redis import node_name
+
+NODES = ["localhost:6380/0", "localhost:6381/0", "localhost:6382/0"]
+KEYS = [f"session:{i}" for i in range(10_000)]
+
+
+class TestHashRing:
+    def test_get_node_success_deterministic(self):
+        ring = HashRing(NODES)
+        other = HashRing(reversed(NODES))
+
+        assert all(ring.get_node(key) == other.get_node(key) for key in KEYS)
+
+    def test_get_node_success_balanced(self):
+        ring = HashRing(NODES)
+        counts = Counter(ring.get_node(key) for key in KEYS)
+
+        assert set(counts) == set(NODES)
+        for count in counts.values():
+            assert abs(count - len(KEYS) / 3) < len(KEYS) * 0.1
+
+    def test_add_node_success_remaps_only_new_share(self):
+        ring = HashRing(NODES)
+        before = {key: ring.get_node(key) for key in KEYS}
+
+        ring.add_node("localhost:6383/0")
+        moved = [key for key in KEYS if ring.get_node(key) != before[key]]
+
+        assert all(ring.get_node(key) == "localhost:6383/0" for key in moved)
+        assert len(moved) < len(KEYS) * 0.35
+
+    def test_remove_node_success_keeps_other_keys(self):
+        ring = HashRing(NODES)
+        before = {key: ring.get_node(key) for key in KEYS}
+
+        ring.remove_node(NODES[0])
+
+        for key in KEYS:
+            if before[key] != NODES[0]:
+                assert ring.get_node(key) == before[key]
+        assert NODES[0] not in ring.nodes
+
+    def test_get_node_failure_empty_ring(self):
+        with pytest.raises(LookupError):
+            HashRing().get_node("session:1")
+
+    def test_node_name_success_ignores_credentials(self):
+        assert node_name("redis://:secret@cache-1:6380/2") == "cache-1:6380/2"
+        assert node_name("redis://localhost") == "localhost:6379/0"
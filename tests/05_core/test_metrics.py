@@ -0,0 +1,45 @@
+from typing import AsyncGenerator
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.core.settings import settings
+from app.main import app
+
+
+@pytest.mark.anyio
+class TestMetricsEndpoint:
+    @pytest.fixture
+    async def client(self, monkeypatch) -> AsyncGenerator[AsyncClient, None]:
+        monkeypatch.setattr(settings, "metrics_token", "s3gr3d0")
+        transport = ASGITransport(app=app)
+        async with AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            yield client
+
+    async def test_metrics_success(self, client: AsyncClient):
+        response = await client.get(
+            "/metrics", headers={"Authorization": "Bearer s3gr3d0"}
+        )
+
+        assert response.status_code == 200
+        assert "redis" in response.json()
+
+    @pytest.mark.parametrize("authorization", [None, "Bearer errado"])
+    async def test_metrics_failure_unauthorized(
+        self, client: AsyncClient, authorization
+    ):
+        headers = {"Authorization": authorization} if authorization else {}
+        response = await client.get("/metrics", headers=headers)
+
+        assert response.status_code == 401
+
+    async def test_metrics_failure_disabled_without_token(
+        self, client: AsyncClient, monkeypatch
+    ):
+        monkeypatch.setattr(settings, "metrics_token", None)
+
+        response = await client.get("/metrics")
+
+        assert response.status_code == 404
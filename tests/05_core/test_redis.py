@@ -0,0 +1,64 @@
+import asyncio
+from typing import AsyncGenerator
+
+import pytest
+
+from app.core.circuit_breaker import CircuitOpenError
+from app.core.redis import GuardedRedis, PoolExhaustedError, RedisManager
+
+
+@pytest.mark.anyio
+class TestGuardedRedis:
+    @pytest.fixture
+    async def manager(self) -> AsyncGenerator[RedisManager, None]:
+        manager = RedisManager(
+            max_connections=2, client_cache=False, session_urls=[]
+        )
+        async with manager.lifespan():
+            yield manager
+
+    async def test_execute_command_success_burst_waits_for_pool(
+        self, manager: RedisManager
+    ):
+        client = manager.get_client()
+        # Folga para a fila do pool não depender da carga da máquina
+        client.connection_pool.timeout = 1.0
+
+        await asyncio.gather(*(client.get("missing") for _ in range(15)))
+
+        metrics = manager.breaker.metrics()
+        assert metrics["window_failures"] == 0
+        assert metrics["window_calls"] == 16  # PING do connect + 15 GETs
+
+    async def test_execute_command_failure_pool_exhausted_not_counted(
+        self, manager: RedisManager
+    ):
+        client = manager.get_client()
+        pool = client.connection_pool
+        held = [await pool.get_connection() for _ in range(2)]
+        try:
+            with pytest.raises(PoolExhaustedError):
+                await client.get("missing")
+        finally:
+            for connection in held:
+                await pool.release(connection)
+
+        metrics = manager.breaker.metrics()
+        assert metrics["window_failures"] == 0
+        assert metrics["window_calls"] == 1
+
+    async def test_pipeline_success_guarded(self, manager: RedisManager):
+        client: GuardedRedis = manager.get_client()
+        pipe = client.pipeline(transaction=False)
+        pipe.get("missing")
+
+        assert await pipe.execute() == [None]
+        assert manager.breaker.metrics()["window_calls"] == 2
+
+    async def test_pipeline_failure_circuit_open(self, manager: RedisManager):
+        manager.breaker._open()
+        pipe = manager.get_client().pipeline(transaction=False)
+        pipe.get("missing")
+
+        with pytest.raises(CircuitOpenError):
+            await pipe.execute()
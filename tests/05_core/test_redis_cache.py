@@ -0,0 +1,83 @@
+from unittest.mock import patch
+
+import pytest
+
+from app.core.redis_cache import ClientSideCache
+
+
+class TestClientSideCache:
+    @pytest.fixture
+    def cache(self) -> ClientSideCache:
+        cache = ClientSideCache(prefixes=("session:",), max_size=2)
+        cache._active = True
+        return cache
+
+    def test_get_failure_inactive(self, cache: ClientSideCache):
+        cache.begin("session:1")
+        cache.store("session:1", "data")
+        cache._active = False
+
+        assert cache.get("session:1") == (False, None)
+        assert cache.stats.misses == 0
+
+    def test_store_and_get_success(self, cache: ClientSideCache):
+        cache.begin("session:1")
+        cache.store("session:1", "data")
+
+        assert cache.get("session:1") == (True, "data")
+        assert cache.get("session:2") == (False, None)
+        assert cache.metrics()["hit_rate"] == 0.5
+
+    def test_store_failure_invalidated_while_pending(
+        self, cache: ClientSideCache
+    ):
+        cache.begin("session:1")
+        cache.invalidate(["session:1"])
+        cache.store("session:1", "stale")
+
+        assert cache.get("session:1") == (False, None)
+
+    def test_store_success_missing_value(self, cache: ClientSideCache):
+        cache.begin("session:1")
+        cache.store("session:1", None)
+
+        assert cache.get("session:1") == (True, None)
+
+    def test_cancel_success_clears_pending(self, cache: ClientSideCache):
+        cache.begin("session:1")
+        cache.cancel("session:1")
+        cache.store("session:1", "data")
+
+        assert cache.get("session:1") == (False, None)
+        assert not cache._pending
+
+    def test_store_success_evicts_least_recently_used(
+        self, cache: ClientSideCache
+    ):
+        for key in ("session:1", "session:2", "session:3"):
+            cache.begin(key)
+            cache.store(key, key)
+
+        assert cache.get("session:1") == (False, None)
+        assert cache.get("session:3") == (True, "session:3")
+        assert cache.stats.evictions == 1
+
+    def test_invalidate_success_flush_all(self, cache: ClientSideCache):
+        cache.begin("session:1")
+        cache.store("session:1", "data")
+
+        cache.invalidate(None)
+
+        assert cache.get("session:1") == (False, None)
+        assert cache.stats.invalidations == 1
+
+    def test_needs_touch_success(self, cache: ClientSideCache):
+        cache.begin("session:1")
+        with patch("app.core.redis_cache.time.monotonic", return_value=0):
+            cache.store("session:1", "data")
+
+        with patch("app.core.redis_cache.time.monotonic", return_value=30):
+            assert cache.needs_touch("session:1") is False
+
+        with patch("app.core.redis_cache.time.monotonic", return_value=60):
+            assert cache.needs_touch("session:1") is True
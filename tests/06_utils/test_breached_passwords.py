@@ -0,0 +1,98 @@
+import pytest
+
+from app.core.settings import settings
+from app.schemas.user_schema import (
+    UserChangePassword,
+    UserCreate,
+    UserLogin,
+)
+from app.utils.breached_passwords import (
+    BreachedPasswordFilter,
+    build_filter,
+    get_breached_filter,
+    optimal_parameters,
+    password_digest,
+)
+from app.utils.validators import (
+    validate_password_not_breached,
+    validate_password_strength,
+)
+
+# Passam em todas as outras regras: só o filtro pode recusá-las
+BREACHED = [f"Vaz@da{i:04d}" for i in range(1000)]
+
+
+@pytest.fixture
+def filter_path(tmp_path) -> str:
+    path = str(tmp_path / "breached.bloom")
+    build_filter((password_digest(p) for p in BREACHED), len(BREACHED), path)
+    return path
+
+
+@pytest.fixture
+def configured_filter(filter_path, monkeypatch):
+    monkeypatch.setattr(settings, "breached_passwords_path", filter_path)
+    get_breached_filter.cache_clear()
+    yield
+    get_breached_filter.cache_clear()
+
+
+class TestBreachedPasswordFilter:
+    def test_contains_success_all_breached(self, filter_path):
+        breached = BreachedPasswordFilter(filter_path)
+        assert all(password in breached for password in BREACHED)
+
+    def test_contains_success_rare_false_positives(self, filter_path):
+        breached = BreachedPasswordFilter(filter_path)
+        false_positives = sum(
+            1 for i in range(10_000) if f"Inedit@{i}" in breached
+        )
+        assert false_positives <= 1
+
+    def test_open_failure_invalid_file(self, tmp_path):
+        path = tmp_path / "invalid.bloom"
+        path.write_bytes(b"x" * 64)
+
+        with pytest.raises(ValueError):
+            BreachedPasswordFilter(str(path))
+
+    def test_optimal_parameters(self):
+        num_bits, num_hashes = optimal_parameters(1_000_000, 1e-6)
+        assert 28_000_000 < num_bits < 29_000_000
+        assert num_hashes == 20
+
+
+class TestValidatePasswordBreached:
+    def test_validate_failure_breached(self, configured_filter):
+        assert validate_password_strength(BREACHED[0]) == BREACHED[0]
+        with pytest.raises(ValueError, match="vazamentos"):
+            validate_password_not_breached(BREACHED[0])
+
+    def test_validate_success_not_breached(self, configured_filter):
+        assert validate_password_not_breached("N@oVaz4da") == "N@oVaz4da"
+
+    def test_validate_success_without_filter(self):
+        get_breached_filter.cache_clear()
+        assert validate_password_not_breached(BREACHED[0]) == BREACHED[0]
+
+    def test_new_passwords_failure_breached(self, configured_filter):
+        with pytest.raises(ValueError, match="vazamentos"):
+            UserCreate(
+                name="Bruenor",
+                username="bruenor",
+                email="bruenor@mithral.com",
+                password=BREACHED[0],
+            )
+        with pytest.raises(ValueError, match="vazamentos"):
+            UserChangePassword(
+                current_password="N@oVaz4da", new_password=BREACHED[0]
+            )
+
+    def test_current_password_success_breached(self, configured_filter):
+        # Quem já tem uma senha vazada ainda consegue entrar e trocá-la
+        login = UserLogin(email="bruenor@mithral.com", password=BREACHED[0])
+        change = UserChangePassword(
+            current_password=BREACHED[0], new_password="N@oVaz4da"
+        )
+
+        assert login.password == change.current_password == BREACHED[0]
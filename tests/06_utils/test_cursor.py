@@ -0,0 +1,46 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.exceptions import InvalidCursorError
+from app.utils.cursor import (
+    decode_cursor,
+    decode_rank_cursor,
+    encode_cursor,
+    encode_rank_cursor,
+)
+
+
+class TestCursor:
+    def test_round_trip(self):
+        created_at = datetime(2026, 10, 19, 5, 0, 1, 123456, timezone.utc)
+        user_id = uuid4()
+
+        assert decode_cursor(encode_cursor(created_at, user_id)) == (
+            created_at,
+            user_id,
+        )
+
+    @pytest.mark.parametrize(
+        "cursor", ["cursor-invalido", "bm9wZQ==", "YXxi", "%%%"]
+    )
+    def test_decode_failure_invalid(self, cursor):
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor)
+
+    def test_rank_round_trip(self):
+        # Valor típico de um float4 vindo do word_similarity
+        score = 0.4285714328289032
+        user_id = uuid4()
+
+        assert decode_rank_cursor(encode_rank_cursor(score, user_id)) == (
+            score,
+            user_id,
+        )
+
+    def test_decode_rank_failure_listing_cursor(self):
+        cursor = encode_cursor(datetime.now(timezone.utc), uuid4())
+
+        with pytest.raises(InvalidCursorError):
+            decode_rank_cursor(cursor)
@@ -0,0 +1,37 @@
+from uuid import uuid1, uuid4
+
+from app.core.settings import settings
+from app.utils.ids import new_id, uuid7
+from app.utils.validators import is_uuid
+
+
+class TestUuid7:
+    def test_version_and_variant(self):
+        value = uuid7()
+
+        assert value.version == 7
+        assert value.variant == "specified in RFC 4122"
+
+    def test_monotonic_within_process(self):
+        values = [uuid7() for _ in range(10_000)]
+
+        assert values == sorted(values)
+        assert len(set(values)) == len(values)
+
+    def test_new_id_follows_setting(self, monkeypatch):
+        monkeypatch.setattr(settings, "id_uuid_version", 4)
+        assert new_id().version == 4
+
+        monkeypatch.setattr(settings, "id_uuid_version", 7)
+        assert new_id().version == 7
+
+
+class TestIsUuid:
+    def test_accepts_v4_and_v7(self):
+        assert is_uuid(str(uuid4()))
+        assert is_uuid(str(uuid7()))
+
+    def test_rejects_other_versions_and_garbage(self):
+        assert not is_uuid(str(uuid1()))
+        assert not is_uuid("faker.uuid4()")
+        assert not is_uuid(None)
@@ -0,0 +1,76 @@
+import pytest
+
+from app.core.settings import Settings
+from app.utils import security
+
+# Custos mínimos: os testes verificam a política, não a força do hash
+FAST = dict(
+    bcrypt_rounds=4,
+    argon2_time_cost=1,
+    argon2_memory_cost=8,
+    argon2_parallelism=1,
+    scrypt_rounds=4,
+)
+
+
+class TestSecurity:
+    @pytest.fixture(autouse=True)
+    def fast_context(self, monkeypatch):
+        context = security.build_context(Settings(**FAST))
+        monkeypatch.setattr(security, "pwd_context", context)
+
+    @pytest.mark.parametrize("scheme", ["bcrypt", "argon2", "scrypt"])
+    def test_hash_and_verify_success_each_scheme(self, scheme):
+        context = security.build_context(
+            Settings(**FAST, password_schemes=[scheme])
+        )
+        hashed = context.hash("Senh@123")
+
+        assert security.verify_password("Senh@123", hashed)
+        assert not security.verify_password("Senh@124", hashed)
+
+    def test_needs_rehash_success_current_hash(self):
+        hashed = security.hash_password("Senh@123")
+
+        assert hashed.startswith("$2b$04$")
+        assert security.needs_rehash(hashed) is False
+
+    def test_needs_rehash_success_non_default_scheme(self):
+        context = security.build_context(
+            Settings(**FAST, password_schemes=["scrypt"])
+        )
+
+        assert security.needs_rehash(context.hash("Senh@123")) is True
+
+    def test_needs_rehash_success_under_cost(self, monkeypatch):
+        hashed = security.hash_password("Senh@123")
+        monkeypatch.setattr(
+            security,
+            "pwd_context",
+            security.build_context(Settings(**{**FAST, "bcrypt_rounds": 5})),
+        )
+
+        assert security.needs_rehash(hashed) is True
+
+    def test_needs_rehash_failure_unknown_format(self):
+        assert security.needs_rehash("not-a-hash") is False
+
+    def test_wrap_hash_success(self):
+        weak = security.build_context(
+            Settings(**{**FAST, "bcrypt_rounds": 4})
+        ).hash("Senh@123")
+        wrapped = security.wrap_hash(weak)
+
+        assert security.can_wrap(weak)
+        assert security.describe_hash(wrapped) == ("wrapped_bcrypt", 4)
+        assert security.verify_password("Senh@123", wrapped)
+        assert not security.verify_password("Senh@124", wrapped)
+        assert security.needs_rehash(wrapped)
+
+    def test_can_wrap_failure_not_bcrypt(self):
+        context = security.build_context(
+            Settings(**FAST, password_schemes=["scrypt"])
+        )
+
+        assert not security.can_wrap(context.hash("Senh@123"))
+        assert not security.can_wrap("not-a-hash")
@@ -14,7 +14,6 @@ from sqlalchemy.ext.asyncio import (
 )
 
 import app.models  # noqa: F401
-from app.core.redis import redis_manager
 from app.models.base_model import Base
 
 # ruff: noqa: E402
@@ -22,6 +21,8 @@ from app.models.base_model import Base
 ENV = os.getenv("ENV", "test")
 load_dotenv(f".env.{ENV}", override=True)
 
+from app.core.database import engine_options
+from app.core.redis import redis_manager
 from app.core.settings import settings
 
 DATABASE_URL = settings.database_url_async
@@ -62,10 +63,10 @@ async def wait_for_postgres_fixture():
 
 @pytest.fixture(scope="session")
 async def engine():
+    # O schema é recriado a cada sessão de testes: prepares em cache
+    # apontariam para tabelas antigas, então usamos o perfil sem cache
     async_engine = create_async_engine(
-        f"{DATABASE_URL}?statement_cache_size=0",
-        future=True,
-        connect_args={"statement_cache_size": 0},
+        DATABASE_URL, future=True, **engine_options(pgbouncer=True)
     )
     async with async_engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
@@ -6,9 +6,14 @@ from .asserts import (
     assert_schema_from_orm,
 )
 from .core import FakeWithID
+from .explain import explain, has_seq_scan, plan_nodes, scanned_indexes
 
 __all__ = [
     "FakeWithID",
+    "explain",
+    "has_seq_scan",
+    "plan_nodes",
+    "scanned_indexes",
     "assert_schema_equals_data",
     "assert_missing_required_fields",
     "assert_schema_creation_fails",
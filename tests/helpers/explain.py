@@ -0,0 +1,49 @@
+from typing import Any, Dict, Iterator, Optional, Sequence, Set
+
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def explain(
+    session: AsyncSession,
+    stmt,
+    params: Optional[Dict[str, Any]] = None,
+    disable: Sequence[str] = ("seqscan",),
+    analyze: bool = False,
+) -> Dict[str, Any]:
+    """Plano (``EXPLAIN FORMAT JSON``) do statement com ``params``.
+
+    Desliga seq scan na transação: tabelas de teste são minúsculas e o
+    planner varreria mesmo com índice. Desligado, ele só varre quando
+    nenhum índice serve para o filtro, que é o que os testes verificam.
+    ``disable`` aceita outros métodos (``indexscan``, ``bitmapscan``...).
+    """
+    compiled = stmt.params(**(params or {})).compile(
+        dialect=postgresql.dialect(),
+        compile_kwargs={"literal_binds": True},
+    )
+    for method in disable:
+        await session.execute(text(f"SET LOCAL enable_{method} = off"))
+    options = "ANALYZE, FORMAT JSON" if analyze else "FORMAT JSON"
+    connection = await session.connection()
+    result = await connection.exec_driver_sql(
+        f"EXPLAIN ({options}) {compiled}"
+    )
+    return result.scalar()[0]["Plan"]
+
+
+def plan_nodes(plan: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from plan_nodes(child)
+
+
+def scanned_indexes(plan: Dict[str, Any]) -> Set[str]:
+    return {
+        node["Index Name"] for node in plan_nodes(plan) if "Index Name" in node
+    }
+
+
+def has_seq_scan(plan: Dict[str, Any]) -> bool:
+    return any(node["Node Type"] == "Seq Scan" for node in plan_nodes(plan))
@@ -132,8 +132,10 @@ class TestGraphQLWithUser(TestBaseGraphQL):
     def _input_create_user(self) -> Dict[str, str]:
         return {
             "name": faker.name(),
-            "username": faker.first_name(),
-            "email": faker.email(),
+            # Sem repetição: vários cadastros no mesmo teste batem no índice
+            # único de username/email
+            "username": faker.unique.first_name(),
+            "email": faker.unique.email(),
             "password": self.strong_password(),
         }
 